@@ -0,0 +1,175 @@
+"""Extract per-glyph advance widths for the nav-pill width estimator.
+
+Writes ``src/chirp_ui/_glyph_tables.py``: one compact table per font stack
+family and weight, holding the advance width of every printable ASCII glyph
+(U+0020..U+007E) in 1/1000 em. :mod:`chirp_ui.glyph_metrics` maps the
+``--chirpui-*-font-family`` tokens in ``002_reset.css`` onto these tables.
+
+Fonts are read with the stdlib only: TrueType/OpenType files through their
+``head``/``hhea``/``hmtx``/``cmap`` tables, or Adobe ``.afm`` metric files.
+Pass the metric-compatible fallback face of each stack.
+
+The committed tables come from the Adobe Core 14 font metrics
+(Adobe's freely distributed ``Core14_AFMs`` package):
+``Helvetica.afm`` / ``Helvetica-Bold.afm`` for the sans stacks (Arial and
+Liberation Sans share these advances) and ``Courier.afm`` /
+``Courier-Bold.afm`` for code.
+
+Usage
+-----
+From the repo root::
+
+    python scripts/build_glyph_metrics.py \\
+        --sans Helvetica.afm --sans-bold Helvetica-Bold.afm \\
+        --mono Courier.afm --mono-bold Courier-Bold.afm
+    python scripts/build_glyph_metrics.py --check ...  # exits non-zero if stale
+
+``--check`` regenerates into memory from the same font files and fails when
+the committed ``_glyph_tables.py`` differs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import struct
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+OUTPUT = REPO_ROOT / "src" / "chirp_ui" / "_glyph_tables.py"
+FIRST, LAST = 0x20, 0x7E
+
+HEADER = '''\
+"""Glyph advance tables for :mod:`chirp_ui.glyph_metrics`.
+
+GENERATED by scripts/build_glyph_metrics.py; do not hand-edit.
+Each table holds the advance width of U+0020..U+007E in 1/1000 em.
+"""
+
+from array import array
+
+FIRST_CODEPOINT = 0x20
+
+'''
+
+
+def _afm_widths(path: Path) -> dict[int, float]:
+    widths: dict[int, float] = {}
+    for line in path.read_text(encoding="latin-1").splitlines():
+        if not line.startswith("C "):
+            continue
+        fields = dict(part.strip().split(" ", 1) for part in line.split(";") if part.strip())
+        code = int(fields["C"])
+        if code >= 0 and "WX" in fields:
+            widths[code] = float(fields["WX"])
+    return widths
+
+
+def _sfnt_widths(path: Path) -> dict[int, float]:
+    data = path.read_bytes()
+    (num_tables,) = struct.unpack_from(">H", data, 4)
+    tables = {}
+    for i in range(num_tables):
+        tag, _checksum, offset, _length = struct.unpack_from(">4sIII", data, 12 + 16 * i)
+        tables[tag.decode("latin-1")] = offset
+    (units_per_em,) = struct.unpack_from(">H", data, tables["head"] + 18)
+    (num_metrics,) = struct.unpack_from(">H", data, tables["hhea"] + 34)
+    advances = [
+        struct.unpack_from(">H", data, tables["hmtx"] + 4 * i)[0] for i in range(num_metrics)
+    ]
+    cmap = tables["cmap"]
+    (num_subtables,) = struct.unpack_from(">H", data, cmap + 2)
+    subtable = None
+    for i in range(num_subtables):
+        platform, encoding, offset = struct.unpack_from(">HHI", data, cmap + 4 + 8 * i)
+        if (platform, encoding) in ((3, 1), (0, 3), (0, 4)):
+            fmt = struct.unpack_from(">H", data, cmap + offset)[0]
+            if fmt == 4:
+                subtable = cmap + offset
+                break
+    if subtable is None:
+        raise SystemExit(f"{path}: no format-4 Unicode cmap subtable")
+    seg_x2 = struct.unpack_from(">H", data, subtable + 6)[0]
+    ends = subtable + 14
+    starts = ends + seg_x2 + 2
+    deltas = starts + seg_x2
+    range_offsets = deltas + seg_x2
+    widths: dict[int, float] = {}
+    for code in range(FIRST, LAST + 1):
+        for seg in range(0, seg_x2, 2):
+            end = struct.unpack_from(">H", data, ends + seg)[0]
+            if code > end:
+                continue
+            start = struct.unpack_from(">H", data, starts + seg)[0]
+            if code < start:
+                break
+            delta = struct.unpack_from(">h", data, deltas + seg)[0]
+            ro = struct.unpack_from(">H", data, range_offsets + seg)[0]
+            if ro:
+                addr = range_offsets + seg + ro + 2 * (code - start)
+                glyph = struct.unpack_from(">H", data, addr)[0]
+                glyph = (glyph + delta) & 0xFFFF if glyph else 0
+            else:
+                glyph = (code + delta) & 0xFFFF
+            advance = advances[min(glyph, num_metrics - 1)]
+            widths[code] = advance * 1000 / units_per_em
+            break
+    return widths
+
+
+def read_widths(path: Path) -> tuple[int, ...]:
+    """Return ``LAST - FIRST + 1`` advances in 1/1000 em for ``path``."""
+    widths = _afm_widths(path) if path.suffix.lower() == ".afm" else _sfnt_widths(path)
+    missing = [chr(c) for c in range(FIRST, LAST + 1) if c not in widths]
+    if missing:
+        raise SystemExit(f"{path}: no advance for {''.join(missing)!r}")
+    return tuple(round(widths[c]) for c in range(FIRST, LAST + 1))
+
+
+def render(tables: dict[str, tuple[int, ...]]) -> str:
+    lines = [HEADER.rstrip("\n"), "", "# fmt: off", "TABLES: dict[str, array[int]] = {"]
+    for name, widths in tables.items():
+        lines += [f'    "{name}": array("H", [']
+        lines += [
+            "        " + ", ".join(map(str, widths[i : i + 16])) + ","
+            for i in range(0, len(widths), 16)
+        ]
+        lines += ["    ]),"]
+    lines += ["}", "# fmt: on"]
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    for name in ("sans", "sans-bold", "mono", "mono-bold"):
+        parser.add_argument(f"--{name}", type=Path, required=True, help=f"{name} font or .afm")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit non-zero if the committed output is stale.",
+    )
+    args = parser.parse_args(argv)
+    tables = {
+        "sans": read_widths(args.sans),
+        "sans-bold": read_widths(args.sans_bold),
+        "mono": read_widths(args.mono),
+        "mono-bold": read_widths(args.mono_bold),
+    }
+    generated = render(tables)
+
+    if args.check:
+        current = OUTPUT.read_text(encoding="utf-8") if OUTPUT.exists() else ""
+        if current != generated:
+            sys.stderr.write(
+                f"{OUTPUT.relative_to(REPO_ROOT)} is stale relative to the given fonts.\n"
+            )
+            return 1
+        return 0
+
+    OUTPUT.write_text(generated, encoding="utf-8")
+    sys.stdout.write(f"wrote {OUTPUT.relative_to(REPO_ROOT)}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
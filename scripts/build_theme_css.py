@@ -0,0 +1,282 @@
+"""Flatten the Bengal ``chirp-theme`` stylesheet into one bundled file.
+
+``assets/css/style.css`` is the authoring entry point: it pulls ~60 files in
+through ``@layer NAME { @import url(...); }`` blocks. Served as-is, the browser
+walks that graph as a serial request waterfall before first paint. This script
+resolves the import graph and inlines every local import where it appears, so
+cascade-layer order is exactly the authored order. It writes
+``style.bundle.css`` (what ``base.html`` loads) plus a v3 source map that
+points each bundled line back to its source file.
+
+Pure Python, stdlib only, deterministic — the companion of
+``scripts/build_chirpui_css.py``.
+
+Usage
+-----
+From the repo root::
+
+    python scripts/build_theme_css.py          # writes style.bundle.css(.map)
+    python scripts/build_theme_css.py --check  # exits non-zero if stale
+
+Import forms handled: ``@import url(x);`` / ``@import "x";`` inside or outside a
+``@layer`` block, plus the top-level ``layer(NAME)`` / ``layer`` /
+``supports(...)`` / media-query suffixes, which become the equivalent wrapping
+at-rules. Relative ``url()`` references in imported files are rebased onto the
+bundle's directory. Remote imports and import cycles are errors.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import posixpath
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CSS_ROOT = REPO_ROOT / "src" / "bengal_themes" / "chirp_theme" / "assets" / "css"
+ENTRY = "style.css"
+OUTPUT = CSS_ROOT / "style.bundle.css"
+MAP_OUTPUT = CSS_ROOT / "style.bundle.css.map"
+
+HEADER = """\
+/* ============================================================================
+ * chirp-theme — GENERATED FILE; do not hand-edit.
+ *
+ * Source entry:  src/bengal_themes/chirp_theme/assets/css/style.css
+ * Rebuild:       poe build-theme-css   (or python scripts/build_theme_css.py)
+ * ============================================================================
+ */
+"""
+
+_IMPORT_RE = re.compile(
+    r"""@import\s+(?:url\(\s*(['"]?)(?P<url>[^'")]+)\1\s*\)|(['"])(?P<str>[^'"]+)\3)"""
+    r"""(?P<rest>[^;]*);""",
+)
+_LAYER_RE = re.compile(r"^layer(?:\(\s*([^)]*?)\s*\))?")
+_SUPPORTS_RE = re.compile(r"^supports\(")
+_URL_RE = re.compile(r"""url\(\s*(['"]?)([^'")]+)\1\s*\)""")
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_B64 = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+
+
+@dataclass(frozen=True, slots=True)
+class Chunk:
+    """A run of bundle text copied from ``source`` starting at (line, col)."""
+
+    text: str
+    source: str | None
+    line: int = 0
+    col: int = 0
+
+
+def _is_remote(url: str) -> bool:
+    return "://" in url or url.startswith("//")
+
+
+def _rebase(url: str, from_dir: str) -> str:
+    """Rewrite a url() relative to ``from_dir`` so it resolves from the entry's dir."""
+    if not from_dir or _is_remote(url) or url.startswith(("/", "#", "data:")):
+        return url
+    return posixpath.normpath(posixpath.join(from_dir, url))
+
+
+def _split_conditions(rest: str) -> tuple[str | None, str | None, str]:
+    """Split an import suffix into (layer, supports, media).
+
+    ``layer`` is ``None`` when absent and ``""`` for an anonymous layer.
+    """
+    rest = rest.strip()
+    layer = supports = None
+    if m := _LAYER_RE.match(rest):
+        layer = (m.group(1) or "").strip()
+        rest = rest[m.end() :].strip()
+    if _SUPPORTS_RE.match(rest):
+        depth, i = 0, len("supports")
+        for i in range(len("supports"), len(rest)):
+            depth += {"(": 1, ")": -1}.get(rest[i], 0)
+            if depth == 0:
+                break
+        supports = rest[len("supports") + 1 : i].strip()
+        rest = rest[i + 1 :].strip()
+    return layer, supports, rest
+
+
+def _position(text: str, offset: int, line: int, col: int) -> tuple[int, int]:
+    """Advance (line, col) across ``text[:offset]``."""
+    newlines = text.count("\n", 0, offset)
+    if newlines:
+        return line + newlines, offset - text.rfind("\n", 0, offset) - 1
+    return line, col + offset
+
+
+def _mask_comments(text: str) -> str:
+    """Blank out comment bodies (same length) so imports in comments are ignored."""
+    return _COMMENT_RE.sub(lambda m: re.sub(r"[^\n]", " ", m.group(0)), text)
+
+
+def _inline(rel: str, stack: tuple[str, ...], root: Path) -> list[Chunk]:
+    if rel in stack:
+        cycle = " -> ".join((*stack, rel))
+        raise ValueError(f"@import cycle: {cycle}")
+    path = root / rel
+    if not path.is_file():
+        raise FileNotFoundError(f"@import target not found: {path}")
+    text = path.read_text(encoding="utf-8")
+    base = posixpath.dirname(rel)
+    masked = _mask_comments(text)
+    chunks: list[Chunk] = []
+    pos, line, col = 0, 0, 0
+
+    def copy(end: int) -> None:
+        nonlocal pos, line, col
+        if end <= pos:
+            return
+        segment = text[pos:end]
+        if base:
+            segment = _URL_RE.sub(
+                lambda m: f"url({m.group(1)}{_rebase(m.group(2), base)}{m.group(1)})",
+                segment,
+            )
+        chunks.append(Chunk(segment, rel, line, col))
+        line, col = _position(text[pos:end], end - pos, line, col)
+        pos = end
+
+    for m in _IMPORT_RE.finditer(masked):
+        copy(m.start())
+        target = m.group("url") or m.group("str")
+        if _is_remote(target):
+            raise ValueError(f"{rel}: remote @import is not bundled: {target}")
+        layer, supports, media = _split_conditions(m.group("rest"))
+        child = posixpath.normpath(posixpath.join(base, target))
+        opens: list[str] = []
+        if layer is not None:
+            opens.append(f"@layer {layer} {{" if layer else "@layer {")
+        if supports:
+            opens.append(f"@supports ({supports}) {{")
+        if media:
+            opens.append(f"@media {media} {{")
+        head = "".join(f"{o}\n" for o in opens)
+        chunks.append(Chunk(f"{head}/* === {child} === */\n", rel, line, col))
+        chunks.extend(_inline(child, (*stack, rel), root))
+        tail = "}" * len(opens)
+        chunks.append(Chunk(f"\n{tail}" if tail else "\n", rel, line, col))
+        line, col = _position(text[pos : m.end()], m.end() - pos, line, col)
+        pos = m.end()
+    copy(len(text))
+    return chunks
+
+
+def _vlq(value: int) -> str:
+    value = (-value << 1) | 1 if value < 0 else value << 1
+    out = ""
+    while True:
+        digit = value & 31
+        value >>= 5
+        if value:
+            digit |= 32
+        out += _B64[digit]
+        if not value:
+            return out
+
+
+def _assemble(chunks: list[Chunk], bundle_name: str) -> tuple[str, str]:
+    """Join chunks into (css, source-map JSON) with one segment per line start."""
+    sources: list[str] = []
+    index: dict[str, int] = {}
+    lines: list[list[str]] = [[]]
+    out_parts: list[str] = []
+    out_col = 0
+    prev = [0, 0, 0]  # source index, source line, source column (relative state)
+
+    def segment(col: int, src: str, line: int, scol: int) -> None:
+        if src not in index:
+            index[src] = len(sources)
+            sources.append(src)
+        idx = index[src]
+        seg = (
+            _vlq(col)  # generated column resets each line, so it is absolute here
+            + _vlq(idx - prev[0])
+            + _vlq(line - prev[1])
+            + _vlq(scol - prev[2])
+        )
+        prev[:] = [idx, line, scol]
+        lines[-1].append(seg)
+
+    for chunk in chunks:
+        out_parts.append(chunk.text)
+        if chunk.source is None:
+            for ch in chunk.text:
+                if ch == "\n":
+                    lines.append([])
+                    out_col = 0
+                else:
+                    out_col += 1
+            continue
+        src_line, src_col = chunk.line, chunk.col
+        pieces = chunk.text.split("\n")
+        for i, piece in enumerate(pieces):
+            if i:
+                lines.append([])
+                out_col = 0
+                src_line, src_col = src_line + 1, 0
+            if piece and not lines[-1]:
+                segment(out_col, chunk.source, src_line, src_col)
+            out_col += len(piece)
+
+    css = "".join(out_parts)
+    mapping = {
+        "version": 3,
+        "file": bundle_name,
+        "sources": sources,
+        "names": [],
+        "mappings": ";".join(",".join(segs) for segs in lines),
+    }
+    return css, json.dumps(mapping, indent=None, separators=(",", ":")) + "\n"
+
+
+def build(root: Path = CSS_ROOT, entry: str = ENTRY) -> tuple[str, str]:
+    """Return ``(bundle_css, source_map_json)`` for ``entry`` under ``root``."""
+    chunks = [Chunk(HEADER + "\n", None), *_inline(entry, (), root)]
+    css, source_map = _assemble(chunks, OUTPUT.name)
+    if not css.endswith("\n"):
+        css += "\n"
+    css += f"/*# sourceMappingURL={MAP_OUTPUT.name} */\n"
+    return css, source_map
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit non-zero if the committed bundle or source map is stale.",
+    )
+    args = parser.parse_args(argv)
+
+    css, source_map = build()
+
+    if args.check:
+        stale = [
+            path.relative_to(REPO_ROOT)
+            for path, generated in ((OUTPUT, css), (MAP_OUTPUT, source_map))
+            if (path.read_text(encoding="utf-8") if path.exists() else "") != generated
+        ]
+        if stale:
+            sys.stderr.write(
+                f"{', '.join(map(str, stale))} stale relative to {CSS_ROOT / ENTRY}.\n"
+                "Run: poe build-theme-css\n"
+            )
+            return 1
+        return 0
+
+    OUTPUT.write_text(css, encoding="utf-8")
+    MAP_OUTPUT.write_text(source_map, encoding="utf-8")
+    sys.stdout.write(f"wrote {OUTPUT.relative_to(REPO_ROOT)} ({len(css):,} bytes) + source map\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,63 @@
+"""Compile the catalog theme packs into flattened per-mode token sheets.
+
+Each ``THEME_PACKS`` entry gets ``themes/compiled/<name>.<mode>.css`` for
+``light``, ``dark`` and ``system``: only the tokens the pack actually changes
+relative to ``chirpui.css``, with static ``var()`` chains pre-collapsed. See
+:mod:`chirp_ui.theme_compiler` for the rules.
+
+Pure Python, stdlib only, deterministic — run after ``build_chirpui_css.py``
+since the compiled sheets diff against the built ``chirpui.css``.
+
+Usage
+-----
+From the repo root::
+
+    python scripts/build_theme_packs.py          # writes themes/compiled/*.css
+    python scripts/build_theme_packs.py --check  # exits non-zero if stale
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from chirp_ui.theme_compiler import compiled_theme_packs
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit non-zero if a committed compiled theme sheet is stale.",
+    )
+    args = parser.parse_args(argv)
+
+    outputs = compiled_theme_packs()
+
+    if args.check:
+        stale = [
+            path.relative_to(REPO_ROOT)
+            for path, css in outputs.items()
+            if (path.read_text(encoding="utf-8") if path.exists() else "") != css
+        ]
+        if stale:
+            sys.stderr.write(
+                f"{', '.join(map(str, stale))} stale relative to the theme pack sources.\n"
+                "Run: poe build-theme-packs\n"
+            )
+            return 1
+        return 0
+
+    for path, css in outputs.items():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(css, encoding="utf-8")
+        sys.stdout.write(f"wrote {path.relative_to(REPO_ROOT)} ({len(css.encode()):,} bytes)\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -9,7 +9,8 @@ Headless, htmx-native, zero JavaScript. Install and import::
 
 When used with Chirp, components are auto-detected via ``PackageLoader``.
 For standalone Kida usage, call :func:`get_loader`.
-Call :func:`register_filters` to ensure bem/field_errors/html_attrs filters are available.
+Call :func:`register_filters` to ensure bem/field_errors/html_attrs filters are available
+(:func:`install_template_registry` for a bare kida ``Environment``).
 Call :func:`register_colors` once per app if you use semantic color names with
 ``resolve_color`` / ``badge(..., color=...)`` / ``filter_chips`` (see ``docs/COMPONENT-OPTIONS.md``).
 """
@@ -28,35 +29,80 @@ from chirp_ui.alpine import (
     AlpineRuntimeCheck,
     check_alpine_runtime,
 )
+from chirp_ui.ascii_table import AsciiTableLayout, stream_ascii_table
+from chirp_ui.calendar_state import CalendarMonth, calendar_month
+from chirp_ui.chart_state import (
+    BarChart,
+    BarRow,
+    DonutState,
+    MetricRow,
+    project_bars,
+    project_donut,
+    project_metric_grid,
+)
 from chirp_ui.components import DesignSystemReport, DesignSystemStats, design_system_report
 from chirp_ui.config_schema import (
+    CompiledSchema,
     Field,
     ProjectedField,
     Widget,
+    aproject_fields,
     project_fields,
 )
+from chirp_ui.critical_css import CriticalCss, extract_critical_css
 from chirp_ui.css_subset import CssSubsetPlan, resolve_partial_paths
 from chirp_ui.filters import TemplateFilterApp, register_colors, reset_colors
+from chirp_ui.form_state import FieldState, FormState, field_state, form_state
+from chirp_ui.fragment_cache import (
+    FileStore,
+    FragmentCache,
+    MemoryStore,
+    get_fragment_cache,
+    set_fragment_cache,
+)
 from chirp_ui.grid_state import (
     Column,
     ColumnSort,
+    GridRow,
     GridSort,
+    GridWindow,
+    RecordRows,
+    RowSource,
     SelectionState,
+    UrlTemplate,
+    agrid_window,
+    aselection_state,
+    asort_columns,
     column_aria_sort,
+    grid_rows,
+    grid_template_columns,
+    grid_window,
     parse_sort,
+    record_rows,
+    row_count,
     selection_state,
     sort_columns,
     sort_query,
+    url_template,
 )
 from chirp_ui.library import LIBRARY_CONTRACT, LibraryAsset, LibraryContract, get_library_contract
+from chirp_ui.nav_index import NavIndex, NavMatch, nav_index
+from chirp_ui.oob_response import OobResponse
+from chirp_ui.series import Series, project_series
 from chirp_ui.shortcuts import (
     DEFAULT_SHORTCUTS,
     Shortcut,
     shortcuts_by_category,
     shortcuts_json,
 )
+from chirp_ui.sse import SSEBroker, SSEEvent
+from chirp_ui.suspense import DeferredBlock, resolve_deferred
+from chirp_ui.template_cache import template_cache, warm_templates
+from chirp_ui.template_registry import TEMPLATE_REGISTRY, install_template_registry
 from chirp_ui.text_fragment import build_text_fragment_url
 from chirp_ui.theme_packs import THEME_PACKS, ThemePack, get_theme_pack, list_theme_packs
+from chirp_ui.tree_state import TreeIndex, TreePage
+from chirp_ui.typeahead import TypeaheadHit, TypeaheadIndex, typeahead_fragment
 from chirp_ui.validation import (
     ChirpUIDeprecationWarning,
     ChirpUIValidationWarning,
@@ -75,49 +121,106 @@ __all__ = [
     "DEFAULT_SHORTCUTS",
     "LIBRARY_CONTRACT",
     "MANIFEST_PATH",
+    "TEMPLATE_REGISTRY",
     "THEME_PACKS",
     "AlpineRequirement",
     "AlpineRuntimeCheck",
+    "AsciiTableLayout",
+    "BarChart",
+    "BarRow",
+    "CalendarMonth",
     "ChirpUIDeprecationWarning",
     "ChirpUIValidationWarning",
     "ChirpUIWarning",
     "Column",
     "ColumnSort",
+    "CompiledSchema",
+    "CriticalCss",
     "CssSubsetPlan",
+    "DeferredBlock",
     "DesignSystemReport",
     "DesignSystemStats",
+    "DonutState",
     "Field",
+    "FieldState",
+    "FileStore",
+    "FormState",
+    "FragmentCache",
+    "GridRow",
     "GridSort",
+    "GridWindow",
     "LibraryAsset",
     "LibraryContract",
+    "MemoryStore",
+    "MetricRow",
+    "NavIndex",
+    "NavMatch",
+    "OobResponse",
     "ProjectedField",
+    "RecordRows",
+    "RowSource",
+    "SSEBroker",
+    "SSEEvent",
     "SelectionState",
+    "Series",
     "Shortcut",
     "ThemePack",
+    "TreeIndex",
+    "TreePage",
+    "TypeaheadHit",
+    "TypeaheadIndex",
+    "UrlTemplate",
     "Widget",
+    "agrid_window",
+    "aproject_fields",
+    "aselection_state",
+    "asort_columns",
     "build_text_fragment_url",
+    "calendar_month",
     "check_alpine_runtime",
     "column_aria_sort",
     "design_system_report",
+    "extract_critical_css",
+    "field_state",
+    "form_state",
+    "get_fragment_cache",
     "get_library_contract",
     "get_loader",
     "get_theme_pack",
+    "grid_rows",
+    "grid_template_columns",
+    "grid_window",
+    "install_template_registry",
     "is_strict",
     "list_theme_packs",
     "load_manifest",
+    "nav_index",
     "parse_sort",
+    "project_bars",
+    "project_donut",
     "project_fields",
+    "project_metric_grid",
+    "project_series",
+    "record_rows",
     "register_colors",
     "register_filters",
     "reset_colors",
+    "resolve_deferred",
     "resolve_partial_paths",
+    "row_count",
     "selection_state",
+    "set_fragment_cache",
     "set_strict",
     "shortcuts_by_category",
     "shortcuts_json",
     "sort_columns",
     "sort_query",
     "static_path",
+    "stream_ascii_table",
+    "template_cache",
+    "typeahead_fragment",
+    "url_template",
+    "warm_templates",
 ]
 
 # Path to the shipped ``chirpui-manifest@5`` JSON. Populated at build time by
@@ -175,8 +278,11 @@ def get_loader() -> PackageLoader:
             loader=ChoiceLoader([
                 FileSystemLoader("templates"),
                 get_loader(),
-            ])
+            ]),
+            bytecode_cache=template_cache(),  # persist compiled chirpui templates
         )
+
+    See :mod:`chirp_ui.template_cache` for :func:`warm_templates`.
     """
     return PackageLoader("chirp_ui", "templates")
 
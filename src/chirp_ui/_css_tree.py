@@ -0,0 +1,113 @@
+"""Minimal CSS rule-tree parser — internal.
+
+Shared by :mod:`chirp_ui.critical_css` (prunes ``chirpui.css`` to the classes a
+page uses) and :mod:`chirp_ui.theme_compiler` (resolves theme-pack tokens). It
+only splits a stylesheet into preludes, declaration bodies and nested grouping
+at-rules; selectors and values stay as (whitespace-folded) text.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+__all__ = ["CssNode", "parse_css", "split_top", "strip_comments"]
+
+_NEWLINE_WS_RE = re.compile(r"\s*\n\s*")
+# At-rules whose block holds rules (recursed into); other block at-rules
+# (@keyframes, @font-face, @property, ...) are kept or dropped whole.
+_GROUPING_AT_RULES = ("@layer", "@media", "@supports", "@container", "@scope", "@starting-style")
+
+
+@dataclass(frozen=True, slots=True)
+class CssNode:
+    prelude: str
+    body: str | None = None  # declarations (style rules / opaque at-rules)
+    children: tuple[CssNode, ...] | None = None  # grouping at-rules
+
+
+def strip_comments(css: str) -> str:
+    """Drop ``/* ... */`` comments, leaving string literals untouched."""
+    out: list[str] = []
+    i, n = 0, len(css)
+    while i < n:
+        ch = css[i]
+        if ch in "\"'":
+            j = i + 1
+            while j < n and css[j] != ch:
+                j += 2 if css[j] == "\\" else 1
+            out.append(css[i : j + 1])
+            i = j + 1
+        elif css.startswith("/*", i):
+            end = css.find("*/", i + 2)
+            i = n if end == -1 else end + 2
+        else:
+            out.append(ch)
+            i += 1
+    return "".join(out)
+
+
+def _match_brace(css: str, open_at: int) -> int:
+    """Index of the ``}`` closing the ``{`` at ``open_at`` (strings respected)."""
+    depth, i, n = 0, open_at, len(css)
+    while i < n:
+        ch = css[i]
+        if ch in "\"'":
+            i += 1
+            while i < n and css[i] != ch:
+                i += 2 if css[i] == "\\" else 1
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    return n
+
+
+def _squash(text: str) -> str:
+    # Newlines never occur inside CSS strings, so folding them is lossless.
+    return _NEWLINE_WS_RE.sub(" ", text).strip()
+
+
+def parse_css(css: str) -> tuple[CssNode, ...]:
+    """Parse comment-free ``css`` into top-level :class:`CssNode` values."""
+    nodes: list[CssNode] = []
+    i, n = 0, len(css)
+    while i < n:
+        while i < n and (css[i].isspace() or css[i] == ";"):
+            i += 1
+        if i >= n:
+            break
+        brace, semi = css.find("{", i), css.find(";", i)
+        if css[i] == "@" and semi != -1 and (brace == -1 or semi < brace):
+            nodes.append(CssNode(_squash(css[i:semi])))  # statement at-rule
+            i = semi + 1
+            continue
+        if brace == -1:
+            break
+        close = _match_brace(css, brace)
+        prelude = _squash(css[i:brace])
+        inner = css[brace + 1 : close]
+        if prelude.startswith(_GROUPING_AT_RULES):
+            nodes.append(CssNode(prelude, children=parse_css(inner)))
+        else:
+            nodes.append(CssNode(prelude, body=_squash(inner)))
+        i = close + 1
+    return tuple(nodes)
+
+
+def split_top(text: str, sep: str = ",") -> list[str]:
+    """Split ``text`` on ``sep`` outside parentheses and brackets."""
+    parts, depth, start = [], 0, 0
+    for i, ch in enumerate(text):
+        if ch in "([":
+            depth += 1
+        elif ch in ")]":
+            depth -= 1
+        elif ch == sep and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return parts
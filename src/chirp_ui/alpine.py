@@ -129,6 +129,11 @@ ALPINE_REQUIRED_COMPONENTS: dict[str, AlpineRequirement] = {
         macros=("data_grid",),
         conditional="selectable=true (the data_grid root always carries it)",
     ),
+    "chirpuiGridWindow": AlpineRequirement(
+        factory="chirpuiGridWindow",
+        macros=("data_grid",),
+        conditional='render_mode="aria_grid"',
+    ),
     "chirpuiContextMenu": AlpineRequirement(
         factory="chirpuiContextMenu",
         macros=("context_menu",),
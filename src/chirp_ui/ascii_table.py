@@ -0,0 +1,271 @@
+"""Precomputed column layout for ``ascii_table``.
+
+Modeled on :mod:`chirp_ui.grid_state`: stdlib + dataclasses only, no ``import
+chirp`` and no ``import kida``. The ``ascii_table`` / ``ascii_row`` macros let
+CSS flex the cells and draw borders from fixed 100-character strings, so
+columns never line up as text and headers cannot share a width with the rows.
+:class:`AsciiTableLayout` measures every column once — in terminal display
+columns, so CJK/fullwidth text counts double and combining marks count zero —
+and returns padded cell strings plus matching border lines for
+``ascii_table_fixed``, which emits them verbatim::
+
+    from chirp_ui import AsciiTableLayout
+
+    layout = AsciiTableLayout.measure(["Service", "Region", "p99"], rows,
+                                      align=["left", "left", "right"])
+    {{ ascii_table_fixed(layout) }}
+
+    print(layout.text())   # the same table as plain text (CLI, logs, <pre>)
+
+For long tables :func:`stream_ascii_table` measures a leading sample of the
+rows, then streams the rest in batches at those widths (wider cells are cut
+with ``…``); pass ``widths=`` to skip measuring.
+"""
+
+from __future__ import annotations
+
+import unicodedata
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Any, Protocol
+
+from chirp_ui.render_stream import DEFAULT_BATCH_SIZE, stream_wrapped
+
+__all__ = [
+    "BOX_CHARS",
+    "AsciiTableLayout",
+    "display_width",
+    "stream_ascii_table",
+]
+
+#: Box-drawing characters per ``ascii_table`` variant: corners (tl tr bl br),
+#: horizontal, vertical, junctions (top, bottom, left, right, cross).
+BOX_CHARS: dict[str, str] = {
+    "single": "┌┐└┘─│┬┴├┤┼",
+    "double": "╔╗╚╝═║╦╩╠╣╬",
+    "heavy": "┏┓┗┛━┃┳┻┣┫╋",
+    "rounded": "╭╮╰╯─│┬┴├┤┼",
+}
+
+_ELLIPSIS = "…"
+_DEFAULT_SAMPLE = 500
+
+
+class _RenderEnv(Protocol):
+    def from_string(self, source: str) -> Any: ...
+
+
+@lru_cache(maxsize=4096)
+def _char_width(ch: str) -> int:
+    if unicodedata.combining(ch) or unicodedata.category(ch) in ("Mn", "Me", "Cf"):
+        return 0
+    return 2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1
+
+
+def display_width(text: str) -> int:
+    """Terminal display columns of ``text`` (wide/fullwidth = 2, combining = 0)."""
+    if text.isascii():
+        return len(text)
+    return sum(_char_width(ch) for ch in text)
+
+
+def _truncate(text: str, width: int) -> str:
+    """Cut ``text`` to ``width`` display columns, ending in ``…``."""
+    out: list[str] = []
+    used = 0
+    for ch in text:
+        w = _char_width(ch)
+        if used + w > width - 1:
+            break
+        out.append(ch)
+        used += w
+    return "".join(out) + _ELLIPSIS
+
+
+def _cell_text(value: object) -> str:
+    return "" if value is None else " ".join(str(value).splitlines())
+
+
+@dataclass(frozen=True, slots=True)
+class AsciiTableLayout:
+    """Column widths (display columns) plus the padded header and body cells.
+
+    ``header`` and ``rows`` hold cell strings already fitted to ``widths`` and
+    aligned, with ``padding`` spaces either side; ``top``/``mid``/``bottom``
+    are the border lines and ``vertical`` the column separator.
+    """
+
+    widths: tuple[int, ...]
+    align: tuple[str, ...] = ()
+    variant: str = "single"
+    padding: int = 1
+    header: tuple[str, ...] = ()
+    rows: tuple[tuple[str, ...], ...] = ()
+
+    @classmethod
+    def measure(
+        cls,
+        headers: Sequence[object] | None,
+        rows: Iterable[Sequence[object]] = (),
+        *,
+        align: Sequence[str] | None = None,
+        variant: str = "single",
+        padding: int = 1,
+        max_width: int | None = None,
+        widths: Sequence[int] | None = None,
+    ) -> AsciiTableLayout:
+        """Measure ``headers`` and ``rows`` once and pad every cell.
+
+        ``max_width`` caps each column (longer cells end in ``…``); ``widths``
+        skips measuring. Unknown variants fall back to ``single``.
+        """
+        head = [_cell_text(h) for h in headers or ()]
+        body = [[_cell_text(c) for c in row] for row in rows]
+        if widths is None:
+            cols = max([len(head), *(len(r) for r in body)], default=0)
+            measured = [0] * cols
+            for row in (head, *body):
+                for i, cell in enumerate(row):
+                    measured[i] = max(measured[i], display_width(cell))
+            if max_width is not None:
+                measured = [min(w, max(max_width, 1)) for w in measured]
+            widths = measured
+        layout = cls(
+            widths=tuple(max(int(w), 1) for w in widths),
+            align=tuple(align or ()),
+            variant=variant if variant in BOX_CHARS else "single",
+            padding=max(padding, 0),
+        )
+        return cls(
+            widths=layout.widths,
+            align=layout.align,
+            variant=layout.variant,
+            padding=layout.padding,
+            header=layout.pad_row(head) if head else (),
+            rows=tuple(layout.iter_rows(body)),
+        )
+
+    def _fit(self, text: str, i: int) -> str:
+        width = self.widths[i]
+        used = display_width(text)
+        if used > width:
+            text = _truncate(text, width)
+            used = display_width(text)
+        gap = width - used
+        align = self.align[i] if i < len(self.align) else "left"
+        if align == "right":
+            text = " " * gap + text
+        elif align == "center":
+            text = " " * (gap // 2) + text + " " * (gap - gap // 2)
+        else:
+            text = text + " " * gap
+        pad = " " * self.padding
+        return pad + text + pad
+
+    def pad_row(self, cells: Sequence[object]) -> tuple[str, ...]:
+        """Fit one row to the widths; missing cells are blank, extra cells dropped."""
+        n = len(self.widths)
+        texts = [_cell_text(c) for c in islice(cells, n)]
+        texts.extend([""] * (n - len(texts)))
+        return tuple(self._fit(text, i) for i, text in enumerate(texts))
+
+    def iter_rows(self, rows: Iterable[Sequence[object]]) -> Iterator[tuple[str, ...]]:
+        """Lazily pad ``rows`` at these widths (the streaming path)."""
+        for row in rows:
+            yield self.pad_row(row)
+
+    def _rule(self, left: str, junction: str, right: str) -> str:
+        h = BOX_CHARS[self.variant][4]
+        segments = (h * (w + 2 * self.padding) for w in self.widths)
+        return left + junction.join(segments) + right
+
+    @property
+    def vertical(self) -> str:
+        return BOX_CHARS[self.variant][5]
+
+    @property
+    def top(self) -> str:
+        c = BOX_CHARS[self.variant]
+        return self._rule(c[0], c[6], c[1])
+
+    @property
+    def mid(self) -> str:
+        c = BOX_CHARS[self.variant]
+        return self._rule(c[8], c[10], c[9])
+
+    @property
+    def bottom(self) -> str:
+        c = BOX_CHARS[self.variant]
+        return self._rule(c[2], c[7], c[3])
+
+    def line(self, cells: Sequence[str]) -> str:
+        """One padded row as a text line, separators included."""
+        v = self.vertical
+        return v + v.join(cells) + v
+
+    def lines(self) -> Iterator[str]:
+        yield self.top
+        if self.header:
+            yield self.line(self.header)
+            yield self.mid
+        for row in self.rows:
+            yield self.line(row)
+        yield self.bottom
+
+    def text(self) -> str:
+        """The whole table as plain text."""
+        return "\n".join(self.lines())
+
+
+def stream_ascii_table(
+    env: _RenderEnv,
+    headers: Sequence[object] | None,
+    rows: Iterable[Sequence[object]],
+    *,
+    align: Sequence[str] | None = None,
+    variant: str = "single",
+    padding: int = 1,
+    max_width: int | None = None,
+    widths: Sequence[int] | None = None,
+    sample: int = _DEFAULT_SAMPLE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    striped: bool = False,
+    sticky_header: bool = False,
+    cls: str = "",
+) -> Iterator[str]:
+    """Stream ``ascii_table_fixed``: head, padded row batches, bottom border.
+
+    Widths come from ``widths`` or from the headers plus the first ``sample``
+    rows; the remaining rows are consumed lazily and fitted to those widths.
+    """
+    it = iter(rows)
+    head_rows = [] if widths is not None else list(islice(it, max(sample, 0)))
+    layout = AsciiTableLayout.measure(
+        headers,
+        head_rows,
+        align=align,
+        variant=variant,
+        padding=padding,
+        max_width=max_width,
+        widths=widths,
+    )
+    shell = AsciiTableLayout(
+        widths=layout.widths,
+        align=layout.align,
+        variant=layout.variant,
+        padding=layout.padding,
+        header=layout.header,
+    )
+    yield from stream_wrapped(
+        env,
+        "chirpui/ascii_table.html",
+        "ascii_table_fixed",
+        {"layout": shell, "striped": striped, "sticky_header": sticky_header, "cls": cls},
+        "ascii_table_fixed_rows",
+        chain(layout.rows, layout.iter_rows(it)),
+        items_param="rows",
+        batch_size=batch_size,
+        vertical=layout.vertical,
+    )
@@ -0,0 +1,23 @@
+"""Small helpers shared by chirp-ui's async projections.
+
+Stdlib only. The ``a*`` projection helpers (:func:`chirp_ui.grid_state.asort_columns`,
+:meth:`chirp_ui.config_schema.CompiledSchema.aproject`, ...) accept either a
+plain value or an awaitable for each input and resolve them concurrently in one
+``asyncio.TaskGroup``; :func:`await_value` is the per-input step::
+
+    async with asyncio.TaskGroup() as tg:
+        rows = tg.create_task(await_value(rows_or_query))
+        count = tg.create_task(await_value(total))
+"""
+
+import inspect
+from collections.abc import Awaitable
+
+__all__ = ["await_value"]
+
+
+async def await_value[T](value: T | Awaitable[T]) -> T:
+    """Return ``value``, awaiting it first when it is awaitable."""
+    if inspect.isawaitable(value):
+        return await value
+    return value
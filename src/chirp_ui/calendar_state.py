@@ -0,0 +1,256 @@
+"""Month-grid projection for ``calendar``.
+
+Modeled on :mod:`chirp_ui.grid_state`: stdlib + dataclasses only, no ``import
+chirp`` and no ``import kida``. ``calendar`` used to take raw ``weeks`` from
+``calendar.monthcalendar`` plus hand-built prev/next URLs, and had no way to
+mark today, a selection or event days. :func:`calendar_month` returns a
+:class:`CalendarMonth` the macro renders as-is (``calendar(month=...)``):
+
+* the date skeleton of a month is memoized per ``(year, month, firstweekday)``
+  in an LRU, so repeated renders of the same month skip ``calendar`` entirely;
+* per-day state — today, selected, inside a range, disabled (outside
+  ``min``/``max`` or listed), has events — is resolved in one pass over the
+  ≤ 42 cells into a ready-made class string;
+* ``url`` (a ``str.format`` pattern with ``{year}``/``{month}``) yields the
+  prev/next month links.
+
+Example (Chirp route)::
+
+    from chirp_ui import calendar_month
+
+    @app.get("/calendar/{year}/{month}")
+    def month_view(req, year: int, month: int):
+        cal = calendar_month(year, month, today=date.today(),
+                             events=events_by_date(year, month),   # {date: [{title, href}]}
+                             url="/calendar/{year}/{month}")
+        return Template("calendar.html", cal=cal)
+
+    {{ calendar(month=cal) }}
+
+Dates may be :class:`datetime.date` objects or ISO ``YYYY-MM-DD`` strings;
+unparseable values are ignored.
+"""
+
+from __future__ import annotations
+
+import calendar as _calendar
+import datetime as _dt
+from collections.abc import Collection, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any
+
+__all__ = [
+    "CalendarDay",
+    "CalendarEvent",
+    "CalendarMonth",
+    "calendar_month",
+    "month_dates",
+]
+
+_DAY = "chirpui-calendar__day"
+
+
+def _get(item: object, key: str, default: Any = None) -> Any:
+    if isinstance(item, Mapping):
+        return item.get(key, default)
+    return getattr(item, key, default)
+
+
+def _as_date(value: object) -> date | None:
+    # datetime subclasses date but never compares equal to one: normalize it.
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value[:10])
+        except ValueError:
+            return None
+    return None
+
+
+def _dates(values: Iterable[object] | None) -> frozenset[date]:
+    return frozenset(d for d in map(_as_date, values or ()) if d is not None)
+
+
+@lru_cache(maxsize=256)
+def month_dates(
+    year: int, month: int, firstweekday: int = 6
+) -> tuple[tuple[date | None, ...], ...]:
+    """Weeks of the month as dates, ``None`` for padding cells (LRU-memoized).
+
+    ``firstweekday`` follows :mod:`calendar`: 0 = Monday … 6 = Sunday.
+    """
+    cal = _calendar.Calendar(firstweekday % 7)
+    return tuple(
+        tuple(d if d.month == month else None for d in week)
+        for week in cal.monthdatescalendar(year, month)
+    )
+
+
+@lru_cache(maxsize=7)
+def _weekday_labels(firstweekday: int) -> tuple[str, ...]:
+    return tuple(_calendar.day_abbr[(firstweekday + i) % 7] for i in range(7))
+
+
+@dataclass(frozen=True, slots=True)
+class CalendarEvent:
+    """An event chip inside a day cell; ``href`` makes it a link."""
+
+    label: str
+    href: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class CalendarDay:
+    """One grid cell. ``day`` is 0 for padding cells; ``cls`` is the modifier suffix."""
+
+    day: int
+    date: _dt.date | None = None
+    cls: str = ""
+    today: bool = False
+    selected: bool = False
+    in_range: bool = False
+    disabled: bool = False
+    events: tuple[CalendarEvent, ...] = ()
+
+    @property
+    def iso(self) -> str:
+        return self.date.isoformat() if self.date else ""
+
+
+_EMPTY = CalendarDay(day=0, cls=f" {_DAY}--empty")
+
+
+@dataclass(frozen=True, slots=True)
+class CalendarMonth:
+    """Everything ``calendar(month=...)`` renders."""
+
+    year: int
+    month: int
+    label: str
+    weekdays: tuple[str, ...]
+    weeks: tuple[tuple[CalendarDay, ...], ...]
+    prev_url: str | None = None
+    next_url: str | None = None
+
+
+def _shift(year: int, month: int, delta: int) -> tuple[int, int]:
+    index = year * 12 + (month - 1) + delta
+    return index // 12, index % 12 + 1
+
+
+def _event(item: object) -> CalendarEvent:
+    if isinstance(item, CalendarEvent):
+        return item
+    if isinstance(item, str):
+        return CalendarEvent(label=item)
+    label = _get(item, "title") or _get(item, "label") or ""
+    return CalendarEvent(label=str(label), href=str(_get(item, "href") or ""))
+
+
+def _events(value: object) -> tuple[CalendarEvent, ...]:
+    # ``True`` marks a date from a set; a str, mapping or plain object is one
+    # event, any other iterable a list of them.
+    if value is None or isinstance(value, bool):
+        return ()
+    if isinstance(value, (str, Mapping)):
+        return (_event(value),) if value else ()
+    if not isinstance(value, Iterable):
+        return (_event(value),)
+    return tuple(_event(item) for item in value)
+
+
+def calendar_month(
+    year: int,
+    month: int,
+    *,
+    today: date | str | None = None,
+    selected: Iterable[date | str] | date | str | None = None,
+    range: tuple[date | str, date | str] | None = None,
+    min: date | str | None = None,
+    max: date | str | None = None,
+    disabled: Iterable[date | str] = (),
+    events: Mapping[date | str, object] | Collection[date | str] | None = None,
+    firstweekday: int = 6,
+    url: str | None = None,
+) -> CalendarMonth:
+    """Project one month into render-ready :class:`CalendarDay` cells.
+
+    ``events`` is a set of dates (marks them) or a mapping of date to event
+    items (``{title, href}`` dicts/objects, or plain label strings) rendered
+    as chips; a single item need not be wrapped in a list. ``range`` is an
+    inclusive ``(start, end)``; ``min``/``max`` and ``disabled`` mark days
+    unavailable. ``min``/``max``/``range`` keep the ``date_picker`` names.
+    """
+    today_d = _as_date(today)
+    picked = _dates((selected,) if isinstance(selected, (date, str)) else selected)
+    start, end = (_as_date(range[0]), _as_date(range[1])) if range else (None, None)
+    if start and end and end < start:
+        start, end = end, start
+    lo, hi = _as_date(min), _as_date(max)
+    blocked = _dates(disabled)
+    by_date: dict[date, object] = {}
+    if isinstance(events, Mapping):
+        for key, items in events.items():
+            d = _as_date(key)
+            if d is not None:
+                by_date[d] = items
+    else:
+        by_date = dict.fromkeys(_dates(events), True)
+
+    weeks = []
+    for week in month_dates(year, month, firstweekday):
+        cells = []
+        for d in week:
+            if d is None:
+                cells.append(_EMPTY)
+                continue
+            is_today = d == today_d
+            is_selected = d in picked or d in (start, end)
+            in_range = bool(start and end and start <= d <= end)
+            is_disabled = d in blocked or bool(lo and d < lo) or bool(hi and d > hi)
+            has_events = d in by_date
+            cls = "".join(
+                f" {_DAY}--{name}"
+                for name, on in (
+                    ("today", is_today),
+                    ("selected", is_selected),
+                    ("in-range", in_range),
+                    ("disabled", is_disabled),
+                    ("has-events", has_events),
+                )
+                if on
+            )
+            cells.append(
+                CalendarDay(
+                    day=d.day,
+                    date=d,
+                    cls=cls,
+                    today=is_today,
+                    selected=is_selected,
+                    in_range=in_range,
+                    disabled=is_disabled,
+                    events=_events(by_date.get(d)),
+                )
+            )
+        weeks.append(tuple(cells))
+
+    prev_url = next_url = None
+    if url:
+        py, pm = _shift(year, month, -1)
+        ny, nm = _shift(year, month, 1)
+        prev_url = url.format(year=py, month=pm)
+        next_url = url.format(year=ny, month=nm)
+    return CalendarMonth(
+        year=year,
+        month=month,
+        label=f"{_calendar.month_name[month]} {year}",
+        weekdays=_weekday_labels(firstweekday % 7),
+        weeks=tuple(weeks),
+        prev_url=prev_url,
+        next_url=next_url,
+    )
@@ -0,0 +1,191 @@
+"""Render-ready projections for ``bar_chart``, ``donut`` and ``metric_grid``.
+
+Modeled on :mod:`chirp_ui.grid_state`: stdlib + dataclasses only, no ``import
+chirp`` and no ``import kida``. The chart macros used to aggregate inside the
+template (``items | map(attribute="value") | list | max`` for the bar scale,
+the donut percentage and its label), so every render walked the data through
+the template interpreter. These helpers do the arithmetic once in Python and
+return rows that the macros only interpolate, the way :func:`sort_columns`
+feeds ``data_grid``:
+
+* :func:`project_bars` → :class:`BarChart` of :class:`BarRow` (``pct``, the
+  ``width`` style, label/href/value text);
+* :func:`project_donut` → :class:`DonutState` (``pct``, the
+  ``--chirpui-donut-pct`` style, center text, aria label);
+* :func:`project_metric_grid` → :class:`MetricRow` list for
+  ``metric_grid(items=...)`` with the trend direction and arrow resolved.
+
+Every helper returns its input unchanged when it is already projected, so a
+route can precompute (and cache) the projection and pass it to the macro.
+
+Example (Chirp route)::
+
+    from chirp_ui import project_bars, project_metric_grid
+
+    bars = project_bars(tag_counts, max=10)
+    kpis = project_metric_grid([
+        {"value": 128, "label": "Tasks", "trend": "+12%", "trend_direction": "up"},
+        {"value": "99.9%", "label": "Uptime", "href": "/status"},
+    ])
+"""
+
+from __future__ import annotations
+
+import builtins
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from chirp_ui.series import Series
+
+__all__ = [
+    "BarChart",
+    "BarRow",
+    "DonutState",
+    "MetricRow",
+    "project_bars",
+    "project_donut",
+    "project_metric_grid",
+]
+
+
+def _get(item: object, key: str, default: Any = None) -> Any:
+    if isinstance(item, Mapping):
+        return item.get(key, default)
+    return getattr(item, key, default)
+
+
+@dataclass(frozen=True, slots=True)
+class BarRow:
+    """One ``bar_chart`` row: ``style`` is the bar's inline ``width``."""
+
+    label: str
+    value: float
+    href: str
+    pct: float
+    style: str
+
+
+@dataclass(frozen=True, slots=True)
+class BarChart:
+    """Projected ``bar_chart`` rows plus the scale they were computed against."""
+
+    rows: tuple[BarRow, ...]
+    max: float
+    aria_label: str
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+
+def project_bars(
+    items: Iterable[object] | Series | BarChart | None, max: float | None = None
+) -> BarChart:
+    """Scale ``{label, value, href?}`` items against ``max`` (default: largest value).
+
+    A :class:`~chirp_ui.series.Series` is charted through its ``rows``. ``max``
+    keeps the macro's parameter name, hence ``builtins.max`` below.
+    """
+    if isinstance(items, BarChart):
+        return items
+    if isinstance(items, Series):
+        items = items.rows
+    source = tuple(items or ())
+    values = [_get(item, "value", 0) or 0 for item in source]
+    scale = max if max is not None and max > 0 else (builtins.max(values) if values else 1)
+    rows = []
+    for item, value in zip(source, values, strict=True):
+        pct = (value / scale * 100) if scale > 0 else 0
+        label = _get(item, "label")
+        rows.append(
+            BarRow(
+                label="" if label is None else str(label),
+                value=value,
+                href=str(_get(item, "href") or ""),
+                pct=pct,
+                style=f"width: {pct}%",
+            )
+        )
+    return BarChart(rows=tuple(rows), max=scale, aria_label=f"Bar chart with {len(rows)} items")
+
+
+@dataclass(frozen=True, slots=True)
+class DonutState:
+    """Projected ``donut``: ``style`` carries ``--chirpui-donut-pct``."""
+
+    pct: float
+    text: str
+    caption: str
+    aria_label: str
+    style: str
+
+
+def project_donut(
+    value: float | DonutState,
+    max: float = 100,
+    *,
+    text: str | None = None,
+    label: str | None = None,
+    caption: str | None = None,
+) -> DonutState:
+    """Percentage, center text (``text`` or ``label`` or ``"NN%"``) and aria label."""
+    if isinstance(value, DonutState):
+        return value
+    pct = (value / max * 100) if max > 0 else 0
+    display = text or label or f"{int(pct)}%"
+    return DonutState(
+        pct=pct,
+        text=str(display),
+        caption=caption or "",
+        aria_label=f"{display}: {caption}" if caption else str(display),
+        style=f"--chirpui-donut-pct: {pct}",
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class MetricRow:
+    """Keyword arguments for one ``metric_card``, with the trend resolved.
+
+    ``trend_direction`` passes through unchanged (``metric_card`` draws the
+    arrow for ``"up"``/``"down"`` and uses it as the trend modifier class,
+    ``neutral`` when empty); a numeric ``trend`` without a direction is
+    signed (``+3`` → ``up``).
+    """
+
+    value: object
+    label: str
+    icon: str | None = None
+    trend: str | None = None
+    trend_direction: str = ""
+    hint: str | None = None
+    href: str | None = None
+    icon_bg: str = ""
+    footer_label: str | None = None
+    footer_href: str | None = None
+
+
+def _metric_row(item: object) -> MetricRow:
+    if isinstance(item, MetricRow):
+        return item
+    trend = _get(item, "trend")
+    direction = _get(item, "trend_direction") or ""
+    if not direction and isinstance(trend, (int, float)) and not isinstance(trend, bool):
+        direction = "up" if trend > 0 else "down" if trend < 0 else ""
+        trend = f"{trend:+g}"
+    return MetricRow(
+        value=_get(item, "value", ""),
+        label=str(_get(item, "label", "") or ""),
+        icon=_get(item, "icon"),
+        trend=None if trend is None or trend == "" else str(trend),
+        trend_direction=str(direction),
+        hint=_get(item, "hint"),
+        href=_get(item, "href"),
+        icon_bg=_get(item, "icon_bg") or "",
+        footer_label=_get(item, "footer_label"),
+        footer_href=_get(item, "footer_href"),
+    )
+
+
+def project_metric_grid(items: Iterable[object] | None) -> list[MetricRow]:
+    """Project KPI dicts/objects into :class:`MetricRow` for ``metric_grid(items=...)``."""
+    return [_metric_row(item) for item in items or ()]
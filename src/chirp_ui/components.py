@@ -1520,6 +1520,7 @@ COMPONENTS: dict[str, ComponentDescriptor] = {
         template="ascii_table.html",
         extra_emits=(
             "chirpui-ascii-table--compact",
+            "chirpui-ascii-table--fixed",
             "chirpui-ascii-table--sticky",
             "chirpui-ascii-table--striped",
             "chirpui-ascii-table__body",
@@ -1531,7 +1532,9 @@ COMPONENTS: dict[str, ComponentDescriptor] = {
             "chirpui-ascii-table__cell--left",
             "chirpui-ascii-table__cell--right",
             "chirpui-ascii-table__head",
+            "chirpui-ascii-table__line",
             "chirpui-ascii-table__row",
+            "chirpui-ascii-table__sep",
             "chirpui-ascii-table__td",
             "chirpui-ascii-table__th",
         ),
@@ -2322,7 +2325,7 @@ COMPONENTS: dict[str, ComponentDescriptor] = {
     ),
     "data-grid": ComponentDescriptor(
         block="data-grid",
-        modifiers=("compact",),
+        modifiers=("compact", "aria-grid"),
         elements=(
             "header",
             "title",
@@ -2334,7 +2337,15 @@ COMPONENTS: dict[str, ComponentDescriptor] = {
             "load-more",
             "load-more-btn",
             "footer",
+            # ARIA-grid-over-div render mode (#261).
+            "viewport",
+            "grid",
+            "head",
+            "rows",
+            "row",
+            "spacer",
         ),
+        extra_emits=("chirpui-data-grid__head--sticky",),
         slots=("", "toolbar", "caption"),
         slot_forwards=(
             # Default slot = bulk-action buttons forwarded into the selection bar.
@@ -2543,7 +2554,7 @@ COMPONENTS: dict[str, ComponentDescriptor] = {
     "tree": ComponentDescriptor(
         block="tree",
         modifiers=("branch", "explorer", "plain"),
-        elements=("item", "node", "label"),
+        elements=("item", "node", "label", "lazy"),
         template="tree_view.html",
         extra_emits=("chirpui-tree__label--leaf",),
         category="data-display",
@@ -3352,7 +3363,14 @@ COMPONENTS: dict[str, ComponentDescriptor] = {
             "event",
         ),
         template="calendar.html",
-        extra_emits=("chirpui-calendar__day--empty",),
+        extra_emits=(
+            "chirpui-calendar__day--disabled",
+            "chirpui-calendar__day--empty",
+            "chirpui-calendar__day--has-events",
+            "chirpui-calendar__day--in-range",
+            "chirpui-calendar__day--selected",
+            "chirpui-calendar__day--today",
+        ),
         category="data-display",
         maturity="stable",
     ),
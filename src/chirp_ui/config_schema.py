@@ -30,14 +30,40 @@ Example (Chirp route)::
 
     fields = project_fields(MODEL_SETTINGS, values=load_settings(user))
     # -> template: {{ config_form(fields, action="/settings", method="post") }}
+
+Dashboards that render the same schema on every request compile it once.
+:class:`CompiledSchema` coerces the fields up front and caches each
+``options_callable`` result for ``options_ttl`` seconds. ``aproject`` resolves
+stale choice lists concurrently, and an ``async def`` callable is awaited::
+
+    SETTINGS = CompiledSchema(MODEL_SETTINGS, options_ttl=300)
+
+    fields = SETTINGS.project(load_settings(user))
+    fields = await SETTINGS.aproject(aload_settings(user))
+    SETTINGS.invalidate("model")  # after the model list changes
 """
 
-from collections.abc import Callable, Mapping, Sequence
+import asyncio
+import inspect
+import threading
+import time
+from collections.abc import Awaitable, Callable, Mapping, Sequence
 from dataclasses import dataclass
 from enum import StrEnum
 from typing import Any
 
-__all__ = ["Field", "ProjectedField", "Widget", "project_fields"]
+from chirp_ui.awaitables import await_value
+
+__all__ = [
+    "CompiledSchema",
+    "Field",
+    "ProjectedField",
+    "Widget",
+    "aproject_fields",
+    "project_fields",
+]
+
+_Choices = Sequence[tuple[str, str]]
 
 _SECRET_MASK = ""  # secrets never round-trip to the client; render an empty input
 
@@ -67,7 +93,13 @@ class Field:
     the Python type hint as a string (``"str"``/``"int"``/``"float"``/``"bool"``)
     used for widget inference when ``widget`` is not set. ``choices`` are
     ``(value, label)`` pairs (static); ``options_callable`` supplies them lazily
-    (e.g. a live model list) and wins over ``choices`` when set. ``secret=True``
+    (e.g. a live model list) and wins over ``choices`` when set. It may be an
+    ``async def`` when projected with :meth:`CompiledSchema.aproject`.
+    ``options_ttl`` overrides the schema-wide cache lifetime of its result
+    (``0`` disables caching, ``math.inf`` keeps it until invalidated).
+    ``offload=True`` runs a plain (blocking) ``options_callable`` in a worker
+    thread under :meth:`CompiledSchema.aproject`; by default it is called
+    inline on the event loop, which is right for cheap lookups. ``secret=True``
     forces a password widget and never echoes the value back to the client.
     ``min``/``max``/``step`` drive range/number widgets.
     """
@@ -80,10 +112,12 @@ class Field:
     choices: tuple[tuple[str, str], ...] = ()
     widget: Widget | None = None
     secret: bool = False
-    options_callable: Callable[[], Sequence[tuple[str, str]]] | None = None
+    options_callable: Callable[[], _Choices | Awaitable[_Choices]] | None = None
     min: float | None = None
     max: float | None = None
     step: float | None = None
+    options_ttl: float | None = None
+    offload: bool = False
 
 
 @dataclass(frozen=True, slots=True)
@@ -149,9 +183,181 @@ def _coerce_field(raw: Field | Mapping[str, Any]) -> Field:
         min=raw.get("min"),
         max=raw.get("max"),
         step=raw.get("step"),
+        options_ttl=raw.get("options_ttl"),
+        offload=bool(raw.get("offload", False)),
     )
 
 
+def _normalize_choices(src: _Choices) -> tuple[Mapping[str, str], ...]:
+    return tuple({"value": str(v), "label": str(label)} for v, label in src)
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledField:
+    """Everything about a field that does not depend on values or live choices."""
+
+    field: Field
+    widget: str
+    label: str
+    static_choices: tuple[Mapping[str, str], ...]
+    required: bool
+
+
+class CompiledSchema:
+    """A schema coerced once, with cached ``options_callable`` choice lists.
+
+    ``options_ttl`` is the default cache lifetime in seconds for callable
+    choices; a field's own ``options_ttl`` wins. :meth:`invalidate` drops
+    cached choices for one field (or all). Projection is one pass over the
+    pre-resolved fields; only values and expired choice lists are looked up
+    per call. Thread-safe: concurrent projections may both call a stale
+    ``options_callable``, and the last result wins.
+    """
+
+    __slots__ = ("_cache", "_clock", "_lock", "fields", "options_ttl")
+
+    def __init__(
+        self,
+        schema: Sequence[Field | Mapping[str, Any]],
+        *,
+        options_ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.options_ttl = options_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._cache: dict[str, tuple[float, tuple[Mapping[str, str], ...]]] = {}
+        compiled: list[_CompiledField] = []
+        for raw in schema:
+            f = _coerce_field(raw)
+            compiled.append(
+                _CompiledField(
+                    field=f,
+                    widget=(f.widget or _infer_widget(f)).value,
+                    label=f.label or f.name,
+                    static_choices=_normalize_choices(f.choices),
+                    required=(f.default is None and not f.secret),
+                )
+            )
+        self.fields: tuple[_CompiledField, ...] = tuple(compiled)
+
+    def _ttl(self, f: Field) -> float:
+        return self.options_ttl if f.options_ttl is None else f.options_ttl
+
+    def _cached(self, f: Field) -> tuple[Mapping[str, str], ...] | None:
+        with self._lock:
+            hit = self._cache.get(f.name)
+        if hit is not None and self._clock() < hit[0]:
+            return hit[1]
+        return None
+
+    def _store(self, f: Field, src: _Choices) -> tuple[Mapping[str, str], ...]:
+        choices = _normalize_choices(src)
+        ttl = self._ttl(f)
+        if ttl > 0:
+            with self._lock:
+                self._cache[f.name] = (self._clock() + ttl, choices)
+        return choices
+
+    def invalidate(self, name: str | None = None) -> None:
+        """Drop cached choices for field ``name``, or for every field."""
+        with self._lock:
+            if name is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(name, None)
+
+    def choices(self, name: str) -> tuple[Mapping[str, str], ...]:
+        """Resolved ``{"value","label"}`` choices for one field (cached)."""
+        cf = next((cf for cf in self.fields if cf.field.name == name), None)
+        if cf is None:
+            raise KeyError(name)
+        return self._resolve(cf)
+
+    def _resolve(self, cf: _CompiledField) -> tuple[Mapping[str, str], ...]:
+        f = cf.field
+        if f.options_callable is None:
+            return cf.static_choices
+        cached = self._cached(f)
+        if cached is not None:
+            return cached
+        src = f.options_callable()
+        if inspect.isawaitable(src):
+            if inspect.iscoroutine(src):
+                src.close()
+            raise TypeError(
+                f"options_callable for {f.name!r} is async; project with CompiledSchema.aproject()"
+            )
+        return self._store(f, src)
+
+    async def _aresolve(
+        self, f: Field, fn: Callable[[], _Choices | Awaitable[_Choices]]
+    ) -> tuple[Mapping[str, str], ...]:
+        src = await asyncio.to_thread(fn) if f.offload else fn()
+        if inspect.isawaitable(src):
+            src = await src
+        return self._store(f, src)
+
+    def _project(
+        self,
+        values: Mapping[str, Any] | None,
+        choices: Callable[[_CompiledField], tuple[Mapping[str, str], ...]],
+    ) -> list[ProjectedField]:
+        vals = values or {}
+        out: list[ProjectedField] = []
+        for cf in self.fields:
+            f = cf.field
+            out.append(
+                ProjectedField(
+                    name=f.name,
+                    widget=cf.widget,
+                    label=cf.label,
+                    value=_SECRET_MASK if f.secret else vals.get(f.name, f.default),
+                    description=f.description,
+                    choices=choices(cf),
+                    secret=f.secret,
+                    min=f.min,
+                    max=f.max,
+                    step=f.step,
+                    required=cf.required,
+                )
+            )
+        return out
+
+    def project(self, values: Mapping[str, Any] | None = None) -> list[ProjectedField]:
+        """Project the compiled fields against ``values`` (see :func:`project_fields`)."""
+        return self._project(values, self._resolve)
+
+    async def aproject(
+        self, values: Mapping[str, Any] | Awaitable[Mapping[str, Any] | None] | None = None
+    ) -> list[ProjectedField]:
+        """Like :meth:`project`, resolving every stale ``options_callable`` concurrently.
+
+        ``async def`` callables are awaited on the loop and plain callables are
+        called inline, unless their field sets ``offload=True`` — then they run
+        in a worker thread (``asyncio.to_thread``) so blocking lookups overlap.
+        ``values`` may itself be an awaitable (e.g. the settings query) and is
+        loaded alongside the choice lists.
+        """
+        fresh: dict[str, tuple[Mapping[str, str], ...]] = {}
+        pending: dict[str, asyncio.Task[tuple[Mapping[str, str], ...]]] = {}
+        async with asyncio.TaskGroup() as tg:
+            loaded = tg.create_task(await_value(values))
+            for cf in self.fields:
+                f = cf.field
+                if f.options_callable is None:
+                    continue
+                cached = self._cached(f)
+                if cached is not None:
+                    fresh[f.name] = cached
+                else:
+                    pending[f.name] = tg.create_task(self._aresolve(f, f.options_callable))
+        fresh.update((name, task.result()) for name, task in pending.items())
+        return self._project(
+            loaded.result(), lambda cf: fresh.get(cf.field.name, cf.static_choices)
+        )
+
+
 def project_fields(
     schema: Sequence[Field | Mapping[str, Any]],
     values: Mapping[str, Any] | None = None,
@@ -165,29 +371,20 @@ def project_fields(
     so the existing ``select_field``/``radio_field`` macros consume them
     unchanged. The macro never recomputes any of this — the server schema and
     the rendered control are the same source of truth.
+
+    Every call coerces the schema and calls each ``options_callable``; compile
+    a long-lived :class:`CompiledSchema` to reuse both across requests.
     """
-    vals = values or {}
-    out: list[ProjectedField] = []
-    for raw in schema:
-        f = _coerce_field(raw)
-        widget = (f.widget or _infer_widget(f)).value
-        raw_val = vals.get(f.name, f.default)
-        value = _SECRET_MASK if f.secret else raw_val
-        choices_src = f.options_callable() if f.options_callable else f.choices
-        choices = tuple({"value": str(v), "label": str(label)} for v, label in choices_src)
-        out.append(
-            ProjectedField(
-                name=f.name,
-                widget=widget,
-                label=f.label or f.name,
-                value=value,
-                description=f.description,
-                choices=choices,
-                secret=f.secret,
-                min=f.min,
-                max=f.max,
-                step=f.step,
-                required=(f.default is None and not f.secret),
-            )
-        )
-    return out
+    return CompiledSchema(schema, options_ttl=0).project(values)
+
+
+async def aproject_fields(
+    schema: Sequence[Field | Mapping[str, Any]],
+    values: Mapping[str, Any] | Awaitable[Mapping[str, Any] | None] | None = None,
+) -> list[ProjectedField]:
+    """Async :func:`project_fields`: ``values`` and each ``options_callable`` may be async.
+
+    Everything is awaited concurrently in one :class:`asyncio.TaskGroup`; the
+    rows are identical to the sync projection.
+    """
+    return await CompiledSchema(schema, options_ttl=0).aproject(values)
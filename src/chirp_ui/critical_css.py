@@ -0,0 +1,256 @@
+"""Critical-CSS extraction for above-the-fold shell components.
+
+Even a component subset (:mod:`chirp_ui.css_subset`) is a render-blocking
+``<link>``: first paint waits for the whole download. This module takes a
+rendered page — typically an ``app_shell_layout`` / ``shell_frame`` render —
+and computes the part of ``chirpui.css`` that page needs for first paint:
+
+1. Collect the ``chirpui-*`` classes in the page's markup (optionally only the
+   first ``fold_bytes`` of ``<body>``).
+2. Map them to partials through the same block → partial table the subset
+   resolver uses (:func:`~chirp_ui.css_subset.block_partials`), plus the foundation and
+   utility partials.
+3. Inside those partials, keep only the style rules whose selectors the page
+   can match, preserving the ``@layer`` / ``@media`` / ``@scope`` structure and
+   the layer-order statement so the cascade is identical to the full sheet.
+
+The result is inlined in ``<head>`` and the full stylesheet is preloaded, then
+promoted to a stylesheet by a small nonce'd ``<script>`` (no inline event
+handlers, so a CSP without script ``'unsafe-inline'`` still applies it;
+``<noscript>`` fallback)::
+
+    from chirp_ui.critical_css import extract_critical_css
+
+    # Once at startup — the shell chrome is the same on every page.
+    CRITICAL = extract_critical_css(render_shell_sample(), fold_bytes=30_000)
+    app.template_global("critical_css")(CRITICAL)
+
+``app_shell_layout.html`` and ``app_layout.html`` switch to
+:meth:`CriticalCss.head_tags` when a ``critical_css`` value is in scope.
+Stdlib only; the shipped stylesheet is parsed once per process.
+"""
+
+from __future__ import annotations
+
+import html as html_lib
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from chirp_ui._css_tree import CssNode, parse_css, split_top, strip_comments
+from chirp_ui.css_subset import (
+    DEFAULT_FOUNDATION_PARTIALS,
+    DEFAULT_UTILITY_PARTIALS,
+    block_partials,
+)
+
+__all__ = [
+    "CriticalCss",
+    "extract_critical_css",
+    "page_classes",
+]
+
+CHIRPUI_CSS = Path(__file__).resolve().parent / "templates" / "chirpui.css"
+
+_CLASS_ATTR_RE = re.compile(r"""\bclass\s*=\s*(?:"([^"]*)"|'([^']*)')""", re.IGNORECASE)
+_SECTION_RE = re.compile(r"/\* === (partials/[^ ]+) === \*/")
+_SELECTOR_CLASS_RE = re.compile(r"\.(chirpui-[A-Za-z0-9_-]+)")
+_KEYFRAMES_NAME_RE = re.compile(r"@(?:-webkit-)?keyframes\s+([^\s{]+)")
+_PSEUDO_LIST_RE = re.compile(r":(is|where|not|has|matches)\(")
+
+
+# Replaces each preloaded link with a fresh stylesheet link (script-inserted,
+# so not render-blocking). Lives in a nonce'd <script>, not an onload= handler.
+_PROMOTE_DEFERRED_JS = (
+    'document.querySelectorAll("link[data-chirpui-deferred]").forEach(function(l){'
+    'var s=document.createElement("link");s.rel="stylesheet";s.href=l.href;'
+    "l.replaceWith(s);});"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CriticalCss:
+    """Inline-ready critical stylesheet for one page shape."""
+
+    css: str
+    classes: frozenset[str]
+    partial_paths: tuple[str, ...]
+
+    @property
+    def size(self) -> int:
+        """UTF-8 byte size of :attr:`css`."""
+        return len(self.css.encode("utf-8"))
+
+    def head_tags(self, href: str = "/static/chirpui.css", nonce: str | None = None) -> str:
+        """Return the inline ``<style>`` plus the deferred full-stylesheet links.
+
+        The full sheet is fetched with ``rel=preload as=style`` and marked
+        ``data-chirpui-deferred``; the following ``<script>`` (carrying
+        ``nonce``) swaps each marked link for a script-inserted stylesheet,
+        which never blocks rendering. ``<noscript>`` keeps a blocking link
+        without JS.
+        """
+        href_attr = html_lib.escape(href, quote=True)
+        nonce_attr = f' nonce="{html_lib.escape(nonce, quote=True)}"' if nonce else ""
+        # A literal "</style" would end the element early.
+        css = self.css.replace("</style", "<\\/style")
+        return (
+            f"<style data-chirpui-critical{nonce_attr}>{css}</style>\n"
+            f'<link rel="preload" as="style" href="{href_attr}" data-chirpui-deferred>\n'
+            f"<script{nonce_attr}>{_PROMOTE_DEFERRED_JS}</script>\n"
+            f'<noscript><link rel="stylesheet" href="{href_attr}"></noscript>'
+        )
+
+
+def page_classes(markup: str, fold_bytes: int | None = None) -> frozenset[str]:
+    """Return the ``chirpui-*`` classes used in ``markup``.
+
+    With ``fold_bytes``, only the first ``fold_bytes`` characters after the
+    opening ``<body`` tag (or the start of a fragment) are considered.
+    """
+    if fold_bytes is not None:
+        start = markup.find("<body")
+        start = 0 if start == -1 else start
+        markup = markup[start : start + max(0, int(fold_bytes))]
+    found: set[str] = set()
+    for m in _CLASS_ATTR_RE.finditer(markup):
+        found.update(c for c in (m.group(1) or m.group(2)).split() if c.startswith("chirpui-"))
+    return frozenset(found)
+
+
+def _block_of(cls: str) -> str:
+    return cls.removeprefix("chirpui-").split("__", 1)[0].split("--", 1)[0]
+
+
+@lru_cache(maxsize=4)
+def _sections(css_text: str) -> tuple[tuple[CssNode, ...], dict[str, tuple[CssNode, ...]]]:
+    """Split a built stylesheet into (preamble nodes, partial → nodes)."""
+    text = css_text
+    marks = list(_SECTION_RE.finditer(text))
+    preamble_end = marks[0].start() if marks else len(text)
+    preamble = parse_css(strip_comments(text[:preamble_end]))
+    sections: dict[str, tuple[CssNode, ...]] = {}
+    for idx, m in enumerate(marks):
+        end = marks[idx + 1].start() if idx + 1 < len(marks) else len(text)
+        sections[m.group(1)] = parse_css(strip_comments(text[m.end() : end]))
+    return preamble, sections
+
+
+@lru_cache(maxsize=1)
+def _shipped_css() -> str:
+    return CHIRPUI_CSS.read_text(encoding="utf-8")
+
+
+def _selector_matches(selector: str, present: frozenset[str]) -> bool:
+    """Whether ``selector`` can match given the page's classes.
+
+    Required classes outside functional pseudo-classes must all be present.
+    ``:is()`` / ``:where()`` lists need one satisfiable branch. ``:not()`` /
+    ``:has()`` arguments are ignored (they never make a rule *need* a class).
+    """
+    out: list[str] = []
+    i = 0
+    while i < len(selector):
+        m = _PSEUDO_LIST_RE.match(selector, i)
+        if not m:
+            out.append(selector[i])
+            i += 1
+            continue
+        depth, j = 1, m.end()
+        while j < len(selector) and depth:
+            depth += {"(": 1, ")": -1}.get(selector[j], 0)
+            j += 1
+        args = selector[m.end() : j - 1]
+        if m.group(1) in ("is", "where", "matches") and not any(
+            _selector_matches(branch, present) for branch in split_top(args)
+        ):
+            return False
+        i = j
+    return all(c in present for c in _SELECTOR_CLASS_RE.findall("".join(out)))
+
+
+def _prune(nodes: tuple[CssNode, ...], present: frozenset[str]) -> tuple[CssNode, ...]:
+    kept: list[CssNode] = []
+    for node in nodes:
+        if node.children is not None:
+            children = _prune(node.children, present)
+            if children:
+                kept.append(CssNode(node.prelude, children=children))
+        elif node.body is None or node.prelude.startswith("@"):
+            kept.append(node)  # statements, @font-face, @property, @keyframes
+        elif any(_selector_matches(s, present) for s in split_top(node.prelude)):
+            kept.append(node)
+    return tuple(kept)
+
+
+def _walk(nodes: tuple[CssNode, ...]) -> Iterator[CssNode]:
+    for node in nodes:
+        if node.children is not None:
+            yield from _walk(node.children)
+        else:
+            yield node
+
+
+def _drop_unused_keyframes(nodes: tuple[CssNode, ...], used: frozenset[str]) -> tuple[CssNode, ...]:
+    kept: list[CssNode] = []
+    for node in nodes:
+        if node.children is not None:
+            children = _drop_unused_keyframes(node.children, used)
+            if children:
+                kept.append(CssNode(node.prelude, children=children))
+            continue
+        m = _KEYFRAMES_NAME_RE.match(node.prelude)
+        if m is None or m.group(1) in used:
+            kept.append(node)
+    return tuple(kept)
+
+
+def _serialize(nodes: tuple[CssNode, ...]) -> str:
+    out: list[str] = []
+    for node in nodes:
+        if node.children is not None:
+            out.append(f"{node.prelude}{{{_serialize(node.children)}}}")
+        elif node.body is None:
+            out.append(f"{node.prelude};")
+        else:
+            out.append(f"{node.prelude}{{{node.body}}}")
+    return "".join(out)
+
+
+def extract_critical_css(
+    markup: str,
+    *,
+    fold_bytes: int | None = None,
+    stylesheet: str | None = None,
+    include_utilities: bool = True,
+) -> CriticalCss:
+    """Compute the critical subset of ``stylesheet`` (default: shipped ``chirpui.css``).
+
+    ``stylesheet`` must be a build of ``scripts/build_chirpui_css.py`` (full or
+    subset): its ``/* === partials/... === */`` markers scope the pruning.
+    """
+    present = page_classes(markup, fold_bytes)
+    block_map = block_partials()
+    wanted: set[str] = set(DEFAULT_FOUNDATION_PARTIALS)
+    if include_utilities:
+        wanted |= DEFAULT_UTILITY_PARTIALS
+    for cls in present:
+        wanted |= block_map.get(_block_of(cls), frozenset())
+
+    preamble, sections = _sections(stylesheet if stylesheet is not None else _shipped_css())
+    partials = tuple(rel for rel in sections if rel in wanted)
+    kept = _prune(preamble, present)
+    for rel in partials:
+        kept += _prune(sections[rel], present)
+    # Keyframes ride along only when a kept declaration animates with them.
+    declarations = " ".join(
+        n.body for n in _walk(kept) if n.body and not _KEYFRAMES_NAME_RE.match(n.prelude)
+    )
+    names = {m.group(1) for n in _walk(kept) if (m := _KEYFRAMES_NAME_RE.match(n.prelude))}
+    used = frozenset(
+        name for name in names if re.search(rf"(?<![\w-]){re.escape(name)}(?![\w-])", declarations)
+    )
+    css = _serialize(_drop_unused_keyframes(kept, used))
+    return CriticalCss(css=css, classes=present, partial_paths=partials)
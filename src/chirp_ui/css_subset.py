@@ -26,6 +26,7 @@ __all__ = [
     "DEFAULT_FOUNDATION_PARTIALS",
     "DEFAULT_UTILITY_PARTIALS",
     "CssSubsetPlan",
+    "block_partials",
     "css_partial_root",
     "resolve_partial_paths",
     "validate_component_names",
@@ -62,7 +63,7 @@ def css_partial_root() -> Path:
 
 
 @lru_cache(maxsize=1)
-def _block_to_partials() -> dict[str, frozenset[str]]:
+def block_partials() -> dict[str, frozenset[str]]:
     """Map registry block name → partial filenames that define its root class."""
     # partial filename → classes
     per_partial: dict[str, set[str]] = {}
@@ -95,7 +96,7 @@ def validate_component_names(names: Sequence[str]) -> tuple[str, ...]:
     """
     if not names:
         raise ValueError("at least one component name is required for a CSS subset")
-    block_map = _block_to_partials()
+    block_map = block_partials()
     known = set(COMPONENTS) | set(block_map)
     normalized: list[str] = []
     for raw in names:
@@ -123,7 +124,7 @@ def resolve_partial_paths(
     Order follows numeric filename prefix (cascade order), same as the full build.
     """
     validate_component_names(components)
-    block_map = _block_to_partials()
+    block_map = block_partials()
     selected: set[str] = set(DEFAULT_FOUNDATION_PARTIALS)
     if include_utilities:
         selected |= DEFAULT_UTILITY_PARTIALS
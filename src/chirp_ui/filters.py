@@ -43,6 +43,7 @@ from typing import Any, Protocol, cast
 
 from kida.template import Markup
 
+from chirp_ui.components import COMPONENTS
 from chirp_ui.icons import ICON_REGISTRY
 from chirp_ui.icons import icon as _resolve_icon
 from chirp_ui.validation import (
@@ -353,8 +354,6 @@ def bem(
 
     *modifier* accepts a single string or a list of strings for additive flags.
     """
-    from chirp_ui.components import COMPONENTS
-
     desc = COMPONENTS.get(block)
 
     if variant:
@@ -923,67 +922,25 @@ def register_filters(app: TemplateFilterApp) -> None:
     Also registers template globals such as ``build_hx_attrs`` and the
     standalone-safe ``route_link_attrs`` helper when the app exposes
     ``template_global``.
+
+    Entries come from :data:`chirp_ui.template_registry.TEMPLATE_REGISTRY`;
+    for a bare kida ``Environment`` use
+    :func:`~chirp_ui.template_registry.install_template_registry`.
     """
-    app.template_filter("bem")(bem)
-    app.template_filter("field_errors")(field_errors)
-    app.template_filter("html_attrs")(html_attrs)
-    app.template_filter("icon")(icon)
-    app.template_filter("deprecate_param")(deprecate_param)
-    app.template_filter("validate_variant")(validate_variant)
-    app.template_filter("validate_variant_block")(validate_variant_block)
-    app.template_filter("validate_appearance_block")(validate_appearance_block)
-    app.template_filter("validate_tone_block")(validate_tone_block)
-    app.template_filter("validate_size")(validate_size)
-    app.template_filter("value_type")(value_type)
-    app.template_filter("sanitize_color")(sanitize_color)
-    app.template_filter("contrast_text")(contrast_text)
-    app.template_filter("resolve_color")(resolve_color)
-    app.template_filter("resolve_status_variant")(resolve_status_variant)
-    app.template_filter("shell_action_btn_variant")(shell_action_btn_variant)
-    if hasattr(app, "template_global"):
-        from chirp_ui.grid_state import (
-            column_aria_sort,
-            parse_sort,
-            selection_state,
-            sort_columns,
-            sort_query,
-        )
-        from chirp_ui.nav_pill import nav_pill_inline_style, segmented_pill_inline_style
-        from chirp_ui.route_tabs import tab_is_active
+    from chirp_ui.template_registry import TEMPLATE_REGISTRY, mark_pure_filters
 
+    mark_pure_filters()
+    for entry in TEMPLATE_REGISTRY:
+        if entry.kind == "filter":
+            app.template_filter(entry.name)(entry.func)
+    if hasattr(app, "template_global"):
         tg = cast(
             Callable[[str | None], Callable[[Callable[..., object]], Callable[..., object]]],
             app.template_global,
         )
-        tg("tab_is_active")(tab_is_active)
-        tg("nav_pill_inline_style")(nav_pill_inline_style)
-        tg("segmented_pill_inline_style")(segmented_pill_inline_style)
-        tg("build_hx_attrs")(build_hx_attrs)
-        tg("check_required_id")(check_required_id)
-        tg("chirpui_asset_path")(chirpui_asset_path)
-        tg("route_link_attrs")(make_route_link_attrs())
-        # Data-grid server-state projections (#200) — registered beside
-        # tab_is_active so data_grid can render aria_sort/next_url it never
-        # derives. See chirp_ui.grid_state.
-        tg("parse_sort")(parse_sort)
-        tg("sort_columns")(sort_columns)
-        tg("selection_state")(selection_state)
-        tg("column_aria_sort")(column_aria_sort)
-        tg("sort_query")(sort_query)
-        from chirp_ui.config_schema import Field, Widget, project_fields
-
-        # Config-form server-state projection — registered beside sort_columns
-        # so config_form can render widget/value/choices it never derives.
-        # See chirp_ui.config_schema.
-        tg("project_fields")(project_fields)
-        tg("config_field")(Field)
-        tg("Widget")(Widget)
-        from chirp_ui.shortcuts import shortcuts_by_category, shortcuts_json
-        from chirp_ui.text_fragment import build_text_fragment_url
-
-        tg("shortcuts_by_category")(shortcuts_by_category)
-        tg("shortcuts_json")(shortcuts_json)
-        tg("build_text_fragment_url")(build_text_fragment_url)
+        for entry in TEMPLATE_REGISTRY:
+            if entry.kind == "global":
+                tg(entry.name)(entry.func)
     else:
         warnings.warn(
             "chirp-ui: app has no template_global(); "
@@ -0,0 +1,169 @@
+"""Form-wide validation-error projection for ``forms.html``.
+
+Modeled on :mod:`chirp_ui.grid_state`: stdlib + dataclasses only, no ``import
+chirp`` and no ``import kida``.
+
+Every field macro in ``forms.html`` used to run ``errors | field_errors(name)``
+two or three times (wrapper class, ``aria-invalid``, the message loop), each
+time re-checking the shape of the errors mapping. :func:`form_state` normalizes
+a ValidationError-style mapping **once** into a :class:`FormState`, with a
+precomputed :class:`FieldState` per field carrying the error tuple and the
+``field-*``/``errors-*`` ids the macros wire into ``id``, ``aria-invalid`` and
+``aria-describedby``.
+
+``form(errors=...)`` provides the state to every field inside it
+(``provide``/``consume``), so fields no longer need ``errors=`` each::
+
+    {% call form("/signup", method="post", errors=errors) %}
+        {{ text_field("email", label="Email") }}
+        {{ password_field("password") }}
+    {% end %}
+
+:class:`FormState` is itself a read-only ``Mapping`` of field name to error
+messages, so it can be passed anywhere an ``errors`` dict is accepted
+(``form_error_summary``, ``field_errors``, an explicit ``errors=``).
+
+Example (Chirp route)::
+
+    from chirp_ui import form_state
+
+    state = form_state(exc.errors, names=("email", "password"))
+    state.field("email").invalid, state.invalid_fields
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+
+from chirp_ui.validation import ChirpUIValidationWarning, _warn
+
+__all__ = ["FieldState", "FormState", "field_state", "form_state"]
+
+
+@dataclass(frozen=True, slots=True)
+class FieldState:
+    """Render-ready error state and ARIA ids for one form field.
+
+    ``field_id`` is the wrapper id (``form_error_summary`` links to it),
+    ``errors_id`` the live region every control names in ``aria-describedby``.
+    ``aria_invalid`` is ``"true"`` or ``None`` so it drops straight into
+    ``html_attrs``.
+    """
+
+    name: str
+    errors: tuple[str, ...] = ()
+    field_id: str = ""
+    errors_id: str = ""
+    invalid: bool = False
+    aria_invalid: str | None = None
+
+    @classmethod
+    def build(cls, name: str, errors: tuple[str, ...] = ()) -> FieldState:
+        return cls(
+            name=name,
+            errors=errors,
+            field_id=f"field-{name}",
+            errors_id=f"errors-{name}",
+            invalid=bool(errors),
+            aria_invalid="true" if errors else None,
+        )
+
+
+def _messages(name: str, value: object) -> tuple[str, ...]:
+    """One field's messages, with the :func:`~chirp_ui.filters.field_errors` coercion."""
+    if value is None:
+        return ()
+    if isinstance(value, (list, tuple)):
+        return tuple(str(x) for x in value)
+    _warn(
+        f"chirp-ui: field_errors expected list/tuple for field {name!r}, "
+        f"got {type(value).__name__}; wrapping as [str(val)]",
+        category=ChirpUIValidationWarning,
+        stacklevel=4,
+    )
+    return (str(value),)
+
+
+@dataclass(frozen=True, slots=True)
+class FormState(Mapping[str, tuple[str, ...]]):
+    """Normalized errors for a whole form: ``{name: FieldState}`` built in one pass.
+
+    As a ``Mapping`` it yields only fields that have errors, in the order the
+    source mapping listed them.
+    """
+
+    fields: Mapping[str, FieldState]
+    invalid_fields: tuple[str, ...] = ()
+
+    def field(self, name: str) -> FieldState:
+        """The :class:`FieldState` for ``name`` (a clean state if it has no errors)."""
+        state = self.fields.get(name)
+        return state if state is not None else FieldState.build(name)
+
+    @property
+    def has_errors(self) -> bool:
+        return bool(self.invalid_fields)
+
+    @property
+    def error_count(self) -> int:
+        return len(self.invalid_fields)
+
+    def __getitem__(self, name: str) -> tuple[str, ...]:
+        state = self.fields.get(name)
+        if state is None or not state.invalid:
+            raise KeyError(name)
+        return state.errors
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.invalid_fields)
+
+    def __len__(self) -> int:
+        return len(self.invalid_fields)
+
+
+_EMPTY = FormState(fields={})
+
+
+def form_state(errors: object = None, *, names: Iterable[str] = ()) -> FormState:
+    """Normalize a ValidationError-style ``errors`` mapping once.
+
+    Non-mapping ``errors`` (``None``, ``""``) give an empty state. Values must
+    be lists/tuples of messages; anything else is wrapped as ``[str(val)]``
+    with a :class:`~chirp_ui.validation.ChirpUIValidationWarning`, exactly as
+    the ``field_errors`` filter does. ``names`` precomputes clean states for
+    declared fields that have no errors.
+    """
+    if isinstance(errors, FormState):
+        return errors
+    source: Mapping[object, object] = errors if isinstance(errors, Mapping) else {}
+    if not source and not names:
+        return _EMPTY
+    fields: dict[str, FieldState] = {}
+    invalid: list[str] = []
+    for name, value in source.items():
+        key = str(name)
+        messages = _messages(key, value)
+        fields[key] = FieldState.build(key, messages)
+        if messages:
+            invalid.append(key)
+    for name in names:
+        if name not in fields:
+            fields[name] = FieldState.build(name)
+    return FormState(fields=fields, invalid_fields=tuple(invalid))
+
+
+def field_state(name: str, errors: object = None) -> FieldState:
+    """The :class:`FieldState` for ``name`` from whatever ``errors`` a macro got.
+
+    Accepts a :class:`FormState` (O(1) lookup), a :class:`FieldState` (returned
+    as-is, e.g. handed from a field macro to ``field_wrapper``), a plain errors
+    mapping (only ``errors[name]`` is read), or ``None``.
+    """
+    if isinstance(errors, FieldState):
+        return errors
+    if isinstance(errors, FormState):
+        return errors.field(name)
+    if isinstance(errors, Mapping):
+        return FieldState.build(name, _messages(name, errors.get(name)))
+    return FieldState.build(name)
@@ -0,0 +1,414 @@
+"""Server-side fragment cache for OOB and suspense regions.
+
+Modeled on :mod:`chirp_ui.grid_state`: stdlib only, no ``import chirp`` and no
+``import kida``. Dashboards re-render the same deferred blocks (stats, counter
+badges, activity feeds) on every request even when the data changed minutes
+ago; :class:`FragmentCache` keeps rendered HTML keyed by a fragment key plus
+its ``vary`` values, with LRU eviction, per-entry TTL, and tag invalidation::
+
+    from chirp_ui.fragment_cache import FragmentCache, set_fragment_cache
+
+    cache = set_fragment_cache(FragmentCache(max_entries=2048, default_ttl=60))
+
+    # Suspense defer_map resolver: render once, serve from cache after that.
+    html = cache.fetch("team-stats", lambda: render_stats(team),
+                       vary=(team.id,), tags=(f"team:{team.id}",))
+
+    # On write, drop every fragment derived from the team.
+    cache.invalidate_tag(f"team:{team.id}")
+
+Templates use the same (active) cache through ``cached_fragment`` in
+``chirpui/oob.html`` and the ``cache_*`` params on ``oob_fragment`` /
+``suspense_slot``::
+
+    {% call cached_fragment("inbox-badge", ttl=30, vary=user.id, tags="inbox") %}
+        {{ counter_badge("inbox-count", count=unread) }}
+    {% end %}
+
+Storage is pluggable (:class:`FragmentStore`). :class:`MemoryStore` is the
+per-process default; :class:`FileStore` shares one cache across worker
+processes through a directory — ``FileStore.shared()`` places it under
+``/dev/shm`` where available, so entries live in shared memory rather than on
+disk. Expiry uses wall-clock time so file entries compare across processes.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol, Self, runtime_checkable
+
+__all__ = [
+    "CacheEntry",
+    "CacheInfo",
+    "FileStore",
+    "FragmentCache",
+    "FragmentStore",
+    "MemoryStore",
+    "cache_key",
+    "fragment_cache_get",
+    "fragment_cache_put",
+    "get_fragment_cache",
+    "set_fragment_cache",
+]
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL = 300.0
+# Separates the fragment key from its vary values in the stored key. A control
+# character so user keys ("stats", "team:4") cannot collide with vary tuples.
+_VARY_SEP = "\x1f"
+
+
+@dataclass(frozen=True, slots=True)
+class CacheEntry:
+    """One cached fragment: rendered ``html``, absolute expiry, and tags."""
+
+    html: str
+    expires_at: float | None = None
+    tags: tuple[str, ...] = ()
+
+    def expired(self, now: float) -> bool:
+        return self.expires_at is not None and now >= self.expires_at
+
+
+@dataclass(frozen=True, slots=True)
+class CacheInfo:
+    """Hit/miss counters, analogous to ``functools.lru_cache().cache_info()``."""
+
+    hits: int
+    misses: int
+    size: int
+
+
+@runtime_checkable
+class FragmentStore(Protocol):
+    """Storage backend for :class:`FragmentCache`.
+
+    ``get`` counts as a use for LRU purposes; ``set`` evicts the least
+    recently used entries once the store is over its bound.
+    """
+
+    def get(self, key: str) -> CacheEntry | None: ...
+
+    def set(self, key: str, entry: CacheEntry) -> None: ...
+
+    def delete(self, key: str) -> bool: ...
+
+    def items(self) -> Iterator[tuple[str, CacheEntry]]: ...
+
+    def clear(self) -> None: ...
+
+    def __len__(self) -> int: ...
+
+
+class MemoryStore:
+    """In-process LRU store (an ``OrderedDict`` under a lock)."""
+
+    __slots__ = ("_data", "_lock", "max_entries")
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._data: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                self._data.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._data[key] = entry
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._data.pop(key, None) is not None
+
+    def items(self) -> Iterator[tuple[str, CacheEntry]]:
+        with self._lock:
+            snapshot = list(self._data.items())
+        return iter(snapshot)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class FileStore:
+    """Directory-backed store shared by every process that opens the same path.
+
+    One JSON file per entry, named by a hash of the key and written via
+    ``os.replace`` so readers never see a partial file. File mtime is the LRU
+    clock: ``get`` touches the file, and ``set`` removes the oldest files once
+    the directory holds more than ``max_entries``. Unreadable files count as
+    misses and are removed.
+    """
+
+    __slots__ = ("directory", "max_entries")
+
+    def __init__(
+        self, directory: str | os.PathLike[str], max_entries: int = DEFAULT_MAX_ENTRIES
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_entries = max(1, int(max_entries))
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def shared(
+        cls, name: str = "chirpui-fragments", max_entries: int = DEFAULT_MAX_ENTRIES
+    ) -> Self:
+        """Open a store under ``/dev/shm`` (RAM-backed) or the temp dir as a fallback."""
+        root = Path("/dev/shm")
+        if not (root.is_dir() and os.access(root, os.W_OK)):
+            root = Path(tempfile.gettempdir())
+        return cls(root / name, max_entries=max_entries)
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+        return self.directory / f"{digest}.json"
+
+    def _files(self) -> list[Path]:
+        return [p for p in self.directory.iterdir() if p.suffix == ".json"]
+
+    def _read(self, path: Path) -> tuple[str, CacheEntry] | None:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            entry = CacheEntry(data["html"], data["expires_at"], tuple(data["tags"]))
+            return data["key"], entry
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError):  # fmt: skip
+            path.unlink(missing_ok=True)
+            return None
+
+    def get(self, key: str) -> CacheEntry | None:
+        path = self._path(key)
+        found = self._read(path)
+        if found is None or found[0] != key:
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return found[1]
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        payload = {
+            "key": key,
+            "html": entry.html,
+            "expires_at": entry.expires_at,
+            "tags": list(entry.tags),
+        }
+        path = self._path(key)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(payload, fh, separators=(",", ":"))
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self._evict()
+
+    def _evict(self) -> None:
+        files = self._files()
+        excess = len(files) - self.max_entries
+        if excess <= 0:
+            return
+        stamped = []
+        for p in files:
+            try:
+                stamped.append((p.stat().st_mtime, p))
+            except FileNotFoundError:
+                continue
+        stamped.sort()
+        for _, p in stamped[:excess]:
+            p.unlink(missing_ok=True)
+
+    def delete(self, key: str) -> bool:
+        path = self._path(key)
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return False
+        return True
+
+    def items(self) -> Iterator[tuple[str, CacheEntry]]:
+        for path in self._files():
+            found = self._read(path)
+            if found is not None:
+                yield found
+
+    def clear(self) -> None:
+        for path in self._files():
+            path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._files())
+
+
+def _coerce_tags(tags: str | Iterable[object] | None) -> tuple[str, ...]:
+    if not tags:
+        return ()
+    if isinstance(tags, str):
+        return (tags,)
+    return tuple(str(t) for t in tags if t not in (None, ""))
+
+
+def _vary_parts(vary: object) -> tuple[str, ...]:
+    if vary is None or vary == "":
+        return ()
+    if isinstance(vary, Mapping):
+        return tuple(f"{k}={vary[k]}" for k in sorted(vary, key=str))
+    if isinstance(vary, (str, bytes, int, float)):  # fmt: skip
+        return (str(vary),)
+    if isinstance(vary, Iterable):
+        return tuple(str(v) for v in vary)
+    return (str(vary),)
+
+
+def cache_key(key: str, vary: object = None) -> str:
+    """Return the stored key for ``key`` and its ``vary`` values.
+
+    ``vary`` may be a scalar, a sequence, or a mapping (ordered by key), so
+    ``vary=user.id``, ``vary=(user.id, locale)`` and ``vary={"u": user.id}``
+    all work from templates.
+    """
+    parts = _vary_parts(vary)
+    if not parts:
+        return str(key)
+    return _VARY_SEP.join((str(key), *parts))
+
+
+class FragmentCache:
+    """LRU + TTL cache of rendered fragments with tag invalidation.
+
+    ``ttl=None`` on a write uses ``default_ttl``; a ``default_ttl`` of ``None``
+    keeps entries until evicted or invalidated, and ``ttl <= 0`` skips the
+    write. ``clock`` is injectable for tests.
+    """
+
+    __slots__ = ("_clock", "_hits", "_misses", "default_ttl", "store")
+
+    def __init__(
+        self,
+        store: FragmentStore | None = None,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        default_ttl: float | None = DEFAULT_TTL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.store: FragmentStore = store if store is not None else MemoryStore(max_entries)
+        self.default_ttl = default_ttl
+        self._clock = clock
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: str, vary: object = None) -> str | None:
+        """Return cached HTML, or ``None`` on a miss or an expired entry."""
+        stored = cache_key(key, vary)
+        entry = self.store.get(stored)
+        if entry is not None and entry.expired(self._clock()):
+            self.store.delete(stored)
+            entry = None
+        if entry is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        return entry.html
+
+    def set(
+        self,
+        key: str,
+        html: object,
+        *,
+        ttl: float | None = None,
+        vary: object = None,
+        tags: str | Iterable[object] | None = None,
+    ) -> str:
+        """Store ``html`` and return it (as ``str``) so callers can emit it directly."""
+        text = str(html)
+        seconds = self.default_ttl if ttl is None else float(ttl)
+        if seconds is not None and seconds <= 0:
+            return text
+        expires_at = None if seconds is None else self._clock() + seconds
+        self.store.set(cache_key(key, vary), CacheEntry(text, expires_at, _coerce_tags(tags)))
+        return text
+
+    def fetch(
+        self,
+        key: str,
+        render: Callable[[], object],
+        *,
+        ttl: float | None = None,
+        vary: object = None,
+        tags: str | Iterable[object] | None = None,
+    ) -> str:
+        """Return the cached fragment, calling ``render()`` and storing it on a miss."""
+        hit = self.get(key, vary)
+        if hit is not None:
+            return hit
+        return self.set(key, render(), ttl=ttl, vary=vary, tags=tags)
+
+    def invalidate(self, key: str, vary: object = None) -> bool:
+        """Drop one fragment. Returns whether an entry was removed."""
+        return self.store.delete(cache_key(key, vary))
+
+    def invalidate_tag(self, *tags: str) -> int:
+        """Drop every fragment carrying any of ``tags``. Returns the count removed."""
+        wanted = set(tags)
+        doomed = [k for k, entry in self.store.items() if wanted.intersection(entry.tags)]
+        return sum(self.store.delete(k) for k in doomed)
+
+    def clear(self) -> None:
+        self.store.clear()
+        self._hits = self._misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self._hits, self._misses, len(self.store))
+
+
+_active = FragmentCache()
+_active_lock = threading.Lock()
+
+
+def get_fragment_cache() -> FragmentCache:
+    """Return the cache used by the ``cached_fragment`` template helpers."""
+    return _active
+
+
+def set_fragment_cache(cache: FragmentCache) -> FragmentCache:
+    """Install ``cache`` as the template-facing cache and return it."""
+    global _active
+    with _active_lock:
+        _active = cache
+    return cache
+
+
+def fragment_cache_get(key: str, vary: object = None) -> str | None:
+    """Template global: cached HTML for ``key``/``vary`` from the active cache."""
+    return _active.get(key, vary)
+
+
+def fragment_cache_put(
+    key: str,
+    html: object,
+    ttl: float | None = None,
+    vary: object = None,
+    tags: str | Iterable[object] | None = None,
+) -> str:
+    """Template global: store rendered ``html`` in the active cache and return it."""
+    return _active.set(key, html, ttl=ttl, vary=vary, tags=tags)
@@ -0,0 +1,112 @@
+"""Text width estimates from precomputed glyph advance tables.
+
+Server-rendered sliding pills (:mod:`chirp_ui.nav_pill`) need each nav item's
+width before the browser has laid anything out. A flat per-character width
+drifts badly between ``"Illinois"`` and ``"Mammoth"``; the tables in
+:mod:`chirp_ui._glyph_tables` give the real advance of every printable ASCII
+glyph in Helvetica/Arial (sans) and Courier (mono), the metric-compatible
+fallbacks at the end of each stack. Where one of those faces renders, the SSR
+estimate lands within a pixel or two; the system UI faces earlier in the stack
+(San Francisco, Segoe UI, Roboto) run a few percent off, which the client
+``syncPill()`` still corrects after layout — the estimate only keeps that
+correction small.
+
+Weights between the regular (400) and bold (700) tables, such as the 500
+``--chirpui-ui-font-weight-medium`` nav labels, are interpolated linearly.
+
+Tables are selected by font token (``--chirpui-ui-font-family``,
+``--chirpui-code-font-family`` and their aliases from ``002_reset.css``) or by
+a literal font stack, as a theme would set it. Regenerate them with
+``scripts/build_glyph_metrics.py``.
+
+Example::
+
+    from chirp_ui.glyph_metrics import text_width_em
+
+    text_width_em("Settings") * 0.8125  # rem at --chirpui-font-sm
+"""
+
+from __future__ import annotations
+
+import unicodedata
+from array import array
+from functools import lru_cache
+
+from chirp_ui._glyph_tables import FIRST_CODEPOINT, TABLES
+
+__all__ = ["FONT_TOKEN_TABLES", "font_table", "text_width_em"]
+
+#: Font-family tokens and the glyph table family that backs their stack.
+FONT_TOKEN_TABLES: dict[str, str] = {
+    "--chirpui-font-family": "sans",
+    "--chirpui-ui-font-family": "sans",
+    "--chirpui-prose-font-family": "sans",
+    "--chirpui-code-font-family": "mono",
+    "--chirpui-mono-font-family": "mono",
+    "--chirpui-font-mono": "mono",
+}
+
+_BOLD_WEIGHT = 600  # font_table(): nearest table
+_REGULAR, _BOLD = 400, 700  # text_width_em(): interpolation endpoints
+_WIDE = 1000  # East Asian wide/fullwidth glyphs are one em
+
+
+def _family(font: str) -> str:
+    """Table family for a token name (``ui-font-family`` or ``--chirpui-…``) or a font stack."""
+    token = font.strip()
+    if not token.startswith("--"):
+        token = f"--chirpui-{token}"
+    if token in FONT_TOKEN_TABLES:
+        return FONT_TOKEN_TABLES[token]
+    generic = font.rsplit(",", 1)[-1].strip().strip("\"'").lower()
+    return "mono" if generic == "monospace" or "mono" in generic else "sans"
+
+
+@lru_cache(maxsize=32)
+def _table_name(font: str, weight: int) -> str:
+    family = _family(font)
+    return f"{family}-bold" if weight >= _BOLD_WEIGHT else family
+
+
+def _advance_sum(text: str, name: str) -> int:
+    table = TABLES[name]
+    size = len(table)
+    total = 0
+    for ch in text:
+        i = ord(ch) - FIRST_CODEPOINT
+        if 0 <= i < size:
+            total += table[i]
+        elif unicodedata.combining(ch):
+            continue
+        elif unicodedata.east_asian_width(ch) in ("W", "F"):
+            total += _WIDE
+        else:
+            total += _FALLBACK[name]
+    return total
+
+
+def font_table(font: str = "--chirpui-ui-font-family", weight: int = 400) -> array[int]:
+    """Return the advance table (1/1000 em, from U+0020) for ``font`` at ``weight``."""
+    return TABLES[_table_name(font, weight)]
+
+
+# Average lowercase advance, used for glyphs outside the table (accented Latin etc.).
+_FALLBACK = {
+    name: round(sum(table[ord("a") - FIRST_CODEPOINT : ord("z") - FIRST_CODEPOINT + 1]) / 26)
+    for name, table in TABLES.items()
+}
+
+
+def text_width_em(text: str, font: str = "--chirpui-ui-font-family", *, weight: int = 400) -> float:
+    """Estimated advance width of ``text`` in em of its font size.
+
+    Weights between 400 and 700 blend the regular and bold tables linearly.
+    """
+    regular = _table_name(font, _REGULAR)
+    if weight <= _REGULAR:
+        return _advance_sum(text, regular) / 1000
+    bold = _table_name(font, _BOLD)
+    if weight >= _BOLD:
+        return _advance_sum(text, bold) / 1000
+    lo, hi = _advance_sum(text, regular), _advance_sum(text, bold)
+    return (lo + (hi - lo) * (weight - _REGULAR) / (_BOLD - _REGULAR)) / 1000
@@ -32,8 +32,8 @@ Example (Chirp route)::
                width="1fr", mobile_width="80px", resizable=True),
     ]
 
-``width``, ``mobile_width``, and ``resizable`` are layout hints for the future
-opt-in ARIA-grid renderer (issue #261). Table mode ignores them today.
+``width``, ``mobile_width``, and ``resizable`` are layout hints for the opt-in
+ARIA-grid renderer (issue #261). Table mode ignores them.
 
     sort = parse_sort(req.query.get("sort"), default_key="name",
                       allowed=tuple(c.key for c in COLS))
@@ -42,27 +42,68 @@ opt-in ARIA-grid renderer (issue #261). Table mode ignores them today.
                         extra_params={"q": req.query.get("q", "")})
     sel = selection_state(req.query.getlist("ids"),
                           page_ids=[u.id for u in rows], total=count_users())
+
+* **Window.** :func:`grid_window` turns a raw ``?scroll_top=`` offset into a
+  :class:`GridWindow` for ``data_grid(render_mode="aria_grid")``: the server
+  renders only the visible row slice plus spacer heights computed from the row
+  count and a fixed row height, so a 10k-row result set costs one window of
+  markup, not 10k ``<tr>`` elements::
+
+    win = grid_window(count_users(), req.query.get("scroll_top"), row_height=36)
+    rows = query_users(order_by=sort.key, offset=win.start, limit=win.size)
+
+* **Async.** :func:`asort_columns`, :func:`aselection_state` and
+  :func:`agrid_window` take the same arguments, but any of the I/O-backed ones
+  (columns, selected/page ids, ``total``) may be awaitables. They are awaited
+  concurrently in one :class:`asyncio.TaskGroup`, and the result is the exact
+  projection the sync helper returns::
+
+    sel = await aselection_state(session_ids(req), page_ids=[u.id for u in rows],
+                                 total=acount_users())
 """
 
-from collections.abc import Iterable, Mapping, Sequence
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Mapping, Sequence, Sized
 from dataclasses import dataclass
-from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from functools import lru_cache
+from typing import Protocol, runtime_checkable
+from urllib.parse import parse_qsl, quote_plus, urlencode, urlsplit, urlunsplit
+
+from chirp_ui.awaitables import await_value
 
 __all__ = [
     "Column",
     "ColumnSort",
+    "GridRow",
     "GridSort",
+    "GridWindow",
+    "RecordRows",
+    "RowSource",
     "SelectionState",
+    "UrlTemplate",
+    "agrid_window",
+    "aselection_state",
+    "asort_columns",
     "column_aria_sort",
+    "grid_rows",
+    "grid_template_columns",
+    "grid_window",
     "parse_sort",
+    "record_rows",
+    "row_count",
     "selection_state",
     "sort_columns",
     "sort_query",
+    "url_template",
 ]
 
 _ASC = "asc"
 _DESC = "desc"
 _DIRECTIONS = (_ASC, _DESC)
+# Auto track for columns without a ``width`` hint: shares the remaining inline
+# size but may shrink below its content (the ``minmax(0, …)`` overflow guard).
+_AUTO_TRACK = "minmax(0, 1fr)"
+_SELECT_TRACK = "var(--chirpui-data-grid-select-width, 2.75rem)"
 
 
 @dataclass(frozen=True, slots=True)
@@ -77,9 +118,9 @@ class Column:
     arbitrary column. A ``frozen`` flag was deliberately *not* shipped so the
     public surface advertises no pinning contract the renderer cannot honor.
 
-    ``width``, ``mobile_width``, and ``resizable`` seed the ARIA-grid-over-div
-    variant (issue #261). Real-``<table>`` mode ignores them — callers can set
-    them now without changing table rendering.
+    ``width``, ``mobile_width``, and ``resizable`` drive the ARIA-grid-over-div
+    variant (issue #261) via :func:`grid_template_columns`. Real-``<table>``
+    mode ignores them — callers can set them without changing table rendering.
     """
 
     key: str
@@ -106,6 +147,8 @@ class ColumnSort:
     The macro reads :attr:`aria_sort` and :attr:`next_url` directly; it never
     derives sort state. ``aria_sort`` is one of ``"ascending"``,
     ``"descending"``, ``"none"``; ``next_url`` is the fully-built toggle URL.
+    The :class:`Column` width hints ride along so the ARIA-grid renderer can
+    build its track list from projected columns.
     """
 
     key: str
@@ -115,6 +158,9 @@ class ColumnSort:
     aria_sort: str
     is_active: bool
     next_url: str
+    width: str | None = None
+    mobile_width: str | None = None
+    resizable: bool = False
 
 
 @dataclass(frozen=True, slots=True)
@@ -160,6 +206,185 @@ class SelectionState:
         return str(row_id) in self.selected
 
 
+@dataclass(frozen=True, slots=True)
+class GridWindow:
+    """The visible row slice for the virtualized ARIA-grid renderer (issue #261).
+
+    ``start``/``stop`` are the half-open row range the server renders (overscan
+    included); ``total`` is the full result-set size and ``row_height`` the
+    fixed row block size in pixels. ``scroll_top`` is the clamped offset the
+    viewport requested, measured from the first data row (header excluded) —
+    not the overscanned ``start`` row's offset, which is :attr:`top_spacer`.
+    The spacer props reserve the scroll height of the rows that are *not*
+    rendered, so the scrollbar stays honest.
+    """
+
+    start: int
+    stop: int
+    total: int
+    row_height: int
+    scroll_top: int = 0
+
+    @property
+    def size(self) -> int:
+        """Number of rows in the window (the ``LIMIT`` for the row query)."""
+        return self.stop - self.start
+
+    @property
+    def top_spacer(self) -> int:
+        """Pixel height reserved above the window for rows ``[0, start)``."""
+        return self.start * self.row_height
+
+    @property
+    def bottom_spacer(self) -> int:
+        """Pixel height reserved below the window for rows ``[stop, total)``."""
+        return (self.total - self.stop) * self.row_height
+
+    def aria_rowindex(self, index0: int) -> int:
+        """Return the 1-based ``aria-rowindex`` of the ``index0``-th window row.
+
+        Row 1 is the header row, so the first data row of the result set is 2.
+        """
+        return self.start + index0 + 2
+
+
+@dataclass(frozen=True, slots=True)
+class UrlTemplate:
+    """A ``base_url`` + ``extra_params`` query, pre-encoded once, with one open slot.
+
+    Built by :func:`url_template`. Everything except ``param`` is split, parsed,
+    merged, and percent-encoded up front, so :meth:`url` is a string
+    concatenation per call — :func:`sort_columns` builds one per projection
+    instead of re-parsing the base query for every column.
+
+    The same object feeds the other URL-building macros: :meth:`pattern` is a
+    ``pagination(url_pattern=...)`` string, and :attr:`action` +
+    :attr:`hidden_fields` let a GET ``filter_bar`` / ``filter_row`` preserve
+    the active sort (or any other carried param) across a filter submit.
+    """
+
+    head: str
+    query: str
+    param: str
+    tail: str
+    hidden_fields: tuple[tuple[str, str], ...]
+
+    @property
+    def action(self) -> str:
+        """The URL without query or fragment (a GET form's ``action``)."""
+        return self.head
+
+    def url(self, value: object) -> str:
+        """Return the full URL with ``param`` set to ``value``."""
+        return self._join(f"{quote_plus(self.param)}={quote_plus(str(value))}")
+
+    def pattern(self, placeholder: str = "{page}") -> str:
+        """Return the URL with ``param`` set to a literal, unencoded ``placeholder``.
+
+        ``url_template("/users", "page", {"sort": "-name"}).pattern()`` →
+        ``"/users?sort=-name&page={page}"``, the ``pagination`` ``url_pattern``.
+        """
+        return self._join(f"{quote_plus(self.param)}={placeholder}")
+
+    def _join(self, slot: str) -> str:
+        query = f"{self.query}&{slot}" if self.query else slot
+        return f"{self.head}?{query}{self.tail}"
+
+
+@dataclass(frozen=True, slots=True)
+class GridRow:
+    """One body row as the ``data_grid`` macros render it.
+
+    ``id`` is the stable row id (checkbox value, selection key); ``label`` the
+    plain-text accessible name for the select checkbox; ``cells`` the cell
+    values in column order. ``cells`` may be a lazy iterator — the macro walks
+    it exactly once.
+    """
+
+    id: str
+    label: str
+    cells: Iterable[object]
+
+
+@runtime_checkable
+class RowSource(Protocol):
+    """Anything that yields :class:`GridRow` values for ``data_grid(rows=...)``.
+
+    :func:`record_rows` is the stock implementation; implement
+    :meth:`grid_rows` directly to stream from a cursor or a custom row type.
+    A ``rows`` value that is not a ``RowSource`` is treated as the legacy
+    list-of-cell-lists (with parallel ``row_ids`` / ``row_labels``).
+    """
+
+    def grid_rows(self, start: int = 0) -> Iterator[GridRow]:
+        """Yield rows; ``start`` offsets the positional id fallback."""
+        ...
+
+
+@dataclass(frozen=True, slots=True)
+class RecordRows:
+    """A :class:`RowSource` over raw records (dataclasses, DB rows, dicts).
+
+    Built by :func:`record_rows`. Nothing is copied: each record is projected
+    into a :class:`GridRow` as the macro iterates, and each cell is read from
+    the record (``record[key]`` for mappings, ``getattr`` otherwise) only when
+    the macro reaches it. Truthiness and ``len()`` follow ``records`` when it
+    is sized. A one-shot iterator (DB cursor, generator) is always truthy and
+    has no length: ``len()`` and :meth:`ids` raise ``TypeError`` rather than
+    guess or consume it, so pass ``selection=`` with a ``total`` for the
+    select-all count and collect page ids from the records yourself.
+    """
+
+    records: Iterable[object]
+    keys: tuple[str, ...]
+    id_key: str = "id"
+    label_key: str | None = None
+    getters: Mapping[str, Callable[[object], object]] | None = None
+
+    def __bool__(self) -> bool:
+        return len(self.records) > 0 if isinstance(self.records, Sized) else True
+
+    def __len__(self) -> int:
+        return len(self._sized("len()"))
+
+    def __iter__(self) -> Iterator[GridRow]:
+        return self.grid_rows()
+
+    def grid_rows(self, start: int = 0) -> Iterator[GridRow]:
+        """Yield one :class:`GridRow` per record, reading cells lazily."""
+        for index, record in enumerate(self.records, start):
+            raw_id = _record_value(record, self.id_key)
+            row_id = str(raw_id) if raw_id not in (None, "") else str(index)
+            raw_label = _record_value(record, self.label_key) if self.label_key else None
+            label = str(raw_label) if raw_label not in (None, "") else row_id
+            yield GridRow(id=row_id, label=label, cells=self._cells(record))
+
+    def ids(self) -> Iterator[str]:
+        """Yield the row ids (e.g. ``selection_state(page_ids=source.ids())``).
+
+        Sized ``records`` only: iterating a one-shot source here would leave
+        nothing for the grid to render.
+        """
+        self._sized("ids()")
+        return (row.id for row in self.grid_rows())
+
+    def _sized(self, what: str) -> Sized:
+        records = self.records
+        if not isinstance(records, Sized):
+            raise TypeError(
+                f"RecordRows.{what} needs sized records (a list or tuple), got "
+                f"{type(records).__name__}; pass selection=selection_state(..., total=...) instead"
+            )
+        return records
+
+    def _cells(self, record: object) -> Iterator[object]:
+        getters = self.getters or {}
+        for key in self.keys:
+            getter = getters.get(key)
+            value = getter(record) if getter is not None else _record_value(record, key)
+            yield "" if value is None else value
+
+
 def _normalize_direction(direction: str | None) -> str:
     return direction if direction in _DIRECTIONS else _ASC
 
@@ -196,28 +421,41 @@ def parse_sort(
     return GridSort(key, direction)
 
 
-def _build_url(
-    base_url: str, sort_value: str, param: str, extra_params: Mapping[str, str] | None
-) -> str:
-    """Return ``base_url`` with ``param`` set to ``sort_value``, preserving query.
-
-    Existing query params on ``base_url`` are kept; ``extra_params`` (e.g. an
-    active filter query) are merged in so a sort click does not drop a filter.
-    Empty ``extra_params`` values are dropped.
+def url_template(
+    base_url: str,
+    param: str = "sort",
+    extra_params: Mapping[str, str] | None = None,
+) -> UrlTemplate:
+    """Return the :class:`UrlTemplate` for ``base_url`` with ``param`` left open.
+
+    Existing query params on ``base_url`` are kept (any prior ``param`` value is
+    dropped); ``extra_params`` (e.g. an active filter query) are merged in,
+    replacing same-named base params, so a sort click does not drop a filter.
+    Empty ``extra_params`` values are dropped. Templates are cached by
+    ``(base_url, param, extra_params)``, so repeated renders of the same grid
+    state reuse one parse.
     """
+    extra = tuple(
+        (str(k), str(v)) for k, v in (extra_params or {}).items() if v is not None and v != ""
+    )
+    return _url_template(base_url, param, extra)
+
+
+@lru_cache(maxsize=256)
+def _url_template(base_url: str, param: str, extra: tuple[tuple[str, str], ...]) -> UrlTemplate:
     split = urlsplit(base_url)
-    pairs: list[tuple[str, str]] = [
-        (k, v) for k, v in parse_qsl(split.query, keep_blank_values=False) if k != param
+    replaced = {param} | {k for k, _ in extra}
+    pairs = [
+        (k, v) for k, v in parse_qsl(split.query, keep_blank_values=False) if k not in replaced
     ]
-    if extra_params:
-        for k, v in extra_params.items():
-            if v is None or v == "":
-                continue
-            pairs = [(pk, pv) for pk, pv in pairs if pk != k]
-            pairs.append((str(k), str(v)))
-    pairs.append((param, sort_value))
-    query = urlencode(pairs)
-    return urlunsplit((split.scheme, split.netloc, split.path, query, split.fragment))
+    pairs.extend(extra)
+    return UrlTemplate(
+        head=urlunsplit((split.scheme, split.netloc, split.path, "", "")),
+        query=urlencode(pairs),
+        param=param,
+        tail=f"#{split.fragment}" if split.fragment else "",
+        hidden_fields=tuple((k, v) for k, v in pairs if k != param),
+    )
 
 
 def column_aria_sort(column_key: str, sort: GridSort) -> str:
@@ -264,6 +502,7 @@ def sort_columns(
     single-sort + single ``aria-sort`` invariant is structural, not asserted in
     a template branch.
     """
+    template = url_template(base_url, param, extra_params)
     out: list[ColumnSort] = []
     for raw in columns:
         col = _coerce_column(raw)
@@ -276,11 +515,7 @@ def sort_columns(
             aria_sort = "none"
         # Toggle: active ascending -> request descending; otherwise request ascending.
         next_value = f"-{col.key}" if is_active and sort.direction == _ASC else col.key
-        next_url = (
-            _build_url(base_url, next_value, param, extra_params)
-            if col.sortable and col.key
-            else ""
-        )
+        next_url = template.url(next_value) if col.sortable and col.key else ""
         out.append(
             ColumnSort(
                 key=col.key,
@@ -290,11 +525,155 @@ def sort_columns(
                 aria_sort=aria_sort,
                 is_active=is_active,
                 next_url=next_url,
+                width=col.width,
+                mobile_width=col.mobile_width,
+                resizable=col.resizable,
             )
         )
     return out
 
 
+def grid_template_columns(
+    columns: Sequence[Column | ColumnSort | Mapping[str, object]],
+    *,
+    selectable: bool = False,
+    mobile: bool = False,
+) -> str:
+    """Return the CSS ``grid-template-columns`` track list for ``columns``.
+
+    Each column contributes its ``width`` hint (``mobile_width`` first when
+    ``mobile=True``, falling back to ``width``); columns without a hint share
+    the remaining space as ``minmax(0, 1fr)``. ``selectable`` prepends the
+    fixed select-checkbox track. Widths are developer-authored CSS lengths —
+    never pass request input here.
+    """
+    tracks = [_SELECT_TRACK] if selectable else []
+    for raw in columns:
+        col = raw if isinstance(raw, (Column, ColumnSort)) else _coerce_column(raw)
+        width = (col.mobile_width or col.width) if mobile else col.width
+        tracks.append(width or _AUTO_TRACK)
+    return " ".join(tracks)
+
+
+def _coerce_int(raw: str | float | None, default: int) -> int:
+    if raw is None:
+        return default
+    try:
+        return int(float(raw))
+    except (TypeError, ValueError, OverflowError):  # fmt: skip
+        return default
+
+
+def grid_window(
+    total: int,
+    scroll_top: str | float | None = None,
+    *,
+    row_height: int = 36,
+    viewport_rows: int = 20,
+    overscan: int = 10,
+) -> GridWindow:
+    """Compute the row window to render for a scroll-offset request.
+
+    ``scroll_top`` is the raw ``?scroll_top=`` value the ARIA-grid viewport
+    sends on scroll (pixels from the first data row, header excluded; possibly
+    fractional). Missing, malformed, negative, or past-the-end offsets clamp
+    into ``[0, total * row_height]`` — the :func:`parse_sort` analog, defensive
+    against arbitrary query input. The window spans the ``viewport_rows``
+    visible rows plus ``overscan`` rows on each side so small scrolls stay inside the rendered slice without a fetch.
+    """
+    total = max(0, int(total))
+    row_height = max(1, int(row_height))
+    viewport_rows = max(1, int(viewport_rows))
+    overscan = max(0, int(overscan))
+    offset = min(max(0, _coerce_int(scroll_top, 0)), total * row_height)
+    first = min(offset // row_height, max(0, total - 1))
+    start = max(0, first - overscan)
+    stop = min(total, first + viewport_rows + overscan)
+    return GridWindow(start=start, stop=stop, total=total, row_height=row_height, scroll_top=offset)
+
+
+def _record_value(record: object, key: str | None) -> object:
+    if not key:
+        return None
+    if isinstance(record, Mapping):
+        return record.get(key)
+    return getattr(record, key, None)
+
+
+def record_rows(
+    records: Iterable[object],
+    columns: Sequence[Column | ColumnSort | Mapping[str, object]],
+    *,
+    id_key: str = "id",
+    label_key: str | None = None,
+    getters: Mapping[str, Callable[[object], object]] | None = None,
+) -> RecordRows:
+    """Project raw ``records`` through ``columns`` as a lazy :class:`RowSource`.
+
+    Replaces the ``rows=[[u.name, u.status] for u in users]`` + parallel
+    ``row_ids`` / ``row_labels`` copies: pass ``rows=record_rows(users, COLS,
+    label_key="name")`` and the macro reads each cell off the record by its
+    column ``key`` as it renders. ``getters`` maps a column key to a callable
+    for computed cells. ``None`` values render as empty cells; a missing id
+    falls back to the row position.
+    """
+    keys = tuple(
+        col.key if isinstance(col, (Column, ColumnSort)) else _coerce_column(col).key
+        for col in columns
+    )
+    return RecordRows(
+        records=records, keys=keys, id_key=id_key, label_key=label_key, getters=getters
+    )
+
+
+def row_count(rows: RowSource | Iterable[object] | None) -> int | None:
+    """Return the number of rows in ``rows``, or ``None`` when it has no length.
+
+    ``data_grid``'s count for the select-all total and ``aria-rowcount``. A
+    :class:`RecordRows` over a list counts its records; over a one-shot
+    iterator (DB cursor, generator) — like any unsized ``rows`` — it is
+    ``None``, never ``0``, so the macro can fall back to ``total_rows=``.
+    """
+    if rows is None:
+        return 0
+    if isinstance(rows, RecordRows):
+        rows = rows.records
+    return len(rows) if isinstance(rows, Sized) else None
+
+
+def grid_rows(
+    rows: RowSource | Iterable[Sequence[object]] | None,
+    row_ids: Sequence[object] | None = None,
+    row_labels: Sequence[object] | None = None,
+    start: int = 0,
+) -> Iterator[GridRow]:
+    """Normalize ``data_grid``'s ``rows`` argument into :class:`GridRow` values.
+
+    The single loop source for the row macros: a :class:`RowSource` streams
+    its own rows; a legacy list of cell lists is zipped lazily with the
+    parallel ``row_ids`` / ``row_labels`` (id falls back to ``start`` + the
+    row position, label to the id — never the rendered first cell). Items
+    that are already :class:`GridRow` pass through, so pre-normalized batches
+    (see :mod:`chirp_ui.render_stream`) render unchanged.
+    """
+    if rows is None:
+        return
+    if isinstance(rows, RowSource):
+        yield from rows.grid_rows(start)
+        return
+    n_ids = len(row_ids) if row_ids is not None else 0
+    n_labels = len(row_labels) if row_labels is not None else 0
+    for index, cells in enumerate(rows):
+        if isinstance(cells, GridRow):
+            yield cells
+            continue
+        row_id = (
+            str(row_ids[index]) if row_ids is not None and index < n_ids else str(start + index)
+        )
+        raw_label = row_labels[index] if row_labels is not None and index < n_labels else None
+        yield GridRow(id=row_id, label=str(raw_label) if raw_label else row_id, cells=cells)
+
+
 def _coerce_column(raw: Column | Mapping[str, object]) -> Column:
     """Accept a :class:`Column` or a plain dict (caller convenience)."""
     if isinstance(raw, Column):
@@ -326,3 +705,57 @@ def selection_state(
     selected = frozenset(str(s) for s in (selected_ids or ()))
     page = tuple(str(p) for p in page_ids)
     return SelectionState(selected=selected, page_ids=page, total=total)
+
+
+async def asort_columns(
+    columns: Sequence[Column | Mapping[str, object]]
+    | Awaitable[Sequence[Column | Mapping[str, object]]],
+    sort: GridSort | Awaitable[GridSort],
+    base_url: str,
+    *,
+    param: str = "sort",
+    extra_params: Mapping[str, str] | Awaitable[Mapping[str, str] | None] | None = None,
+) -> list[ColumnSort]:
+    """Async :func:`sort_columns`: ``columns``/``sort``/``extra_params`` may be awaitables."""
+    async with asyncio.TaskGroup() as tg:
+        cols = tg.create_task(await_value(columns))
+        resolved_sort = tg.create_task(await_value(sort))
+        extra = tg.create_task(await_value(extra_params))
+    return sort_columns(
+        cols.result(), resolved_sort.result(), base_url, param=param, extra_params=extra.result()
+    )
+
+
+async def aselection_state(
+    selected_ids: Iterable[str] | Awaitable[Iterable[str] | None] | None,
+    page_ids: Iterable[str] | Awaitable[Iterable[str]],
+    total: int | Awaitable[int | None] | None = None,
+) -> SelectionState:
+    """Async :func:`selection_state`: ids and the ``total`` count may be awaitables.
+
+    The count query and the id lookups run concurrently, so an expensive
+    ``COUNT(*)`` no longer serializes behind the page fetch.
+    """
+    async with asyncio.TaskGroup() as tg:
+        selected = tg.create_task(await_value(selected_ids))
+        page = tg.create_task(await_value(page_ids))
+        count = tg.create_task(await_value(total))
+    return selection_state(selected.result(), page.result(), count.result())
+
+
+async def agrid_window(
+    total: int | Awaitable[int],
+    scroll_top: str | float | None = None,
+    *,
+    row_height: int = 36,
+    viewport_rows: int = 20,
+    overscan: int = 10,
+) -> GridWindow:
+    """Async :func:`grid_window`: ``total`` may be an awaitable count."""
+    return grid_window(
+        await await_value(total),
+        scroll_top,
+        row_height=row_height,
+        viewport_rows=viewport_rows,
+        overscan=overscan,
+    )
@@ -5,6 +5,7 @@ Usage::
     python -m chirp_ui.inspect              # JSON report
     python -m chirp_ui.inspect --summary    # compact table
     python -m chirp_ui.inspect --tokens     # token catalog only
+    python -m chirp_ui.inspect --token-usage accent  # who reads --chirpui-accent
     python -m chirp_ui.inspect --components # component descriptors only
     python -m chirp_ui.inspect --provides   # {% provide %} statements + annotations
     python -m chirp_ui.inspect --consumes   # consume() calls + annotations
@@ -19,7 +20,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from chirp_ui.components import COMPONENTS, design_system_report
-from chirp_ui.tokens import TOKEN_CATALOG
+from chirp_ui.tokens import TOKEN_CATALOG, token_index
 
 _TEMPLATES_DIR = Path(__file__).parent / "templates" / "chirpui"
 
@@ -339,6 +340,31 @@ def _print_tokens() -> None:
         print()
 
 
+def _print_token_usage(token: str) -> None:
+    index = token_index()
+    if not token.startswith("--"):
+        token = f"--chirpui-{token}"
+    declarations = index.declarations.get(token, ())
+    usages = index.usages.get(token, ())
+    if not declarations and not usages:
+        print(f"{token}: not found in chirpui.css")
+        return
+    print(f"{token}")
+    print("=" * 60)
+    print(f"Declared ({len(declarations)}):")
+    for site in declarations:
+        print(f"  chirpui.css:{site.line}  {site.partial or '-'}  {site.selector}")
+    print(f"Used ({len(usages)}):")
+    for site in usages:
+        print(
+            f"  chirpui.css:{site.line}  {site.partial or '-'}  {site.selector} {{ {site.declared} }}"
+        )
+    dependents = sorted(index.dependent_tokens(token))
+    print(f"Dependent tokens ({len(dependents)}): {', '.join(dependents) or '(none)'}")
+    print(f"Blocks: {', '.join(index.blocks_using(token, transitive=True)) or '(none)'}")
+    print(f"Partials: {', '.join(index.partials_using(token, transitive=True)) or '(none)'}")
+
+
 def _print_provides() -> None:
     records = list_provides()
     print(f"chirp-ui provide statements ({len(records)} total)")
@@ -403,6 +429,11 @@ def main(argv: list[str] | None = None) -> None:
     group.add_argument("--summary", action="store_true", help="compact summary table")
     group.add_argument("--components", action="store_true", help="component descriptors only")
     group.add_argument("--tokens", action="store_true", help="token catalog only")
+    group.add_argument(
+        "--token-usage",
+        metavar="TOKEN",
+        help="declarations, var() usages, and dependent blocks/partials of one token",
+    )
     group.add_argument(
         "--provides", action="store_true", help="{% provide %} statements + annotations"
     )
@@ -421,6 +452,8 @@ def main(argv: list[str] | None = None) -> None:
         _print_components()
     elif args.tokens:
         _print_tokens()
+    elif args.token_usage:
+        _print_token_usage(args.token_usage)
     elif args.provides:
         _print_provides()
     elif args.consumes:
@@ -0,0 +1,203 @@
+"""Compiled route matching for nav definitions (route tabs, sidebars, nav trees).
+
+:func:`~chirp_ui.route_tabs.tab_is_active` is evaluated once per item per
+render, so a sidebar or docs ``nav_tree`` with *n* entries pays *n* dict/attr
+lookups and string prefix tests on every request. :class:`NavIndex` compiles a
+nav definition once into a path-segment trie; one :meth:`NavIndex.lookup`
+walks at most ``len(path.split("/"))`` nodes and returns the active item, its
+ancestors in the definition, and the sliding-pill offsets for the top-level
+item that contains it.
+
+Matching keeps :func:`tab_is_active` semantics per item (``match="exact"`` by
+default, ``"prefix"`` for ``href`` or ``href + "/..."``; empty ``href`` never
+matches). Where several items would match, the index picks exactly one: an
+exact match wins over a prefix match, and a deeper prefix wins over a shallower
+one. Items may nest under ``children`` (the :mod:`nav_tree` shape).
+
+Nav definitions are treated as immutable: :func:`nav_index` caches one index
+per definition object, so build a new list rather than mutating it in place.
+
+Example (template)::
+
+    {% set nav = nav_index(tab_items) %}
+    {{ route_tabs(tab_items, current_path, is_active=nav.is_active) }}
+
+Example (Python)::
+
+    from chirp_ui import nav_index
+
+    hit = nav_index(DOCS_NAV).lookup("/docs/forms/validation")
+    hit.item["title"], [a["title"] for a in hit.ancestors], hit.pill_style
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+
+from chirp_ui.nav_pill import _PILL_NONE, _item_get, _pill_vars, estimate_nav_item_width_em
+
+__all__ = ["NavIndex", "NavMatch", "nav_index"]
+
+
+@dataclass(frozen=True, slots=True)
+class NavMatch:
+    """Result of :meth:`NavIndex.lookup` for one path.
+
+    ``ancestors`` runs from the top-level item down to the parent of ``item``;
+    ``position`` is the index of the top-level item that holds the match, and
+    ``pill_x``/``pill_w`` are its sliding-pill offsets in rem.
+    """
+
+    item: object
+    ancestors: tuple[object, ...]
+    position: int
+    pill_x: float
+    pill_w: float
+    pill_h: float
+
+    @property
+    def trail(self) -> tuple[object, ...]:
+        """``ancestors`` followed by ``item`` (breadcrumb order)."""
+        return (*self.ancestors, self.item)
+
+    @property
+    def pill_style(self) -> str:
+        """Inline ``--chirpui-pill-*`` vars, same format as ``nav_pill_inline_style``."""
+        return _pill_vars(self.pill_x, self.pill_w, self.pill_h)
+
+
+@dataclass(slots=True)
+class _Node:
+    children: dict[str, _Node] = field(default_factory=dict)
+    exact: NavMatch | None = None
+    prefix: NavMatch | None = None
+
+
+class NavIndex:
+    """Path-segment trie over a (possibly nested) nav definition."""
+
+    __slots__ = ("_last", "_root", "items", "size")
+
+    def __init__(
+        self,
+        items: Iterable[object],
+        *,
+        children_key: str = "children",
+        kind: str = "route_tab",
+        font: str = "--chirpui-ui-font-family",
+        gap_em: float = 0.5,
+        block_size_em: float = 2.0,
+    ) -> None:
+        self.items: tuple[object, ...] = tuple(items)
+        self._root = _Node()
+        self._last: tuple[str, NavMatch | None] | None = None
+        self.size = 0
+        x = 0.0
+        for position, item in enumerate(self.items):
+            w = estimate_nav_item_width_em(item, kind=kind, font=font)
+            self._add(item, (), position, x, w, block_size_em, children_key)
+            x = round(x + w + gap_em, 3)
+
+    def _add(
+        self,
+        item: object,
+        ancestors: tuple[object, ...],
+        position: int,
+        x: float,
+        w: float,
+        h: float,
+        children_key: str,
+    ) -> None:
+        self.size += 1
+        href = str(_item_get(item, "href") or "")
+        if href:
+            node = self._root
+            for segment in href.split("/"):
+                node = node.children.setdefault(segment, _Node())
+            entry = NavMatch(item, ancestors, position, x, w, h)
+            if (_item_get(item, "match") or "exact") == "prefix":
+                node.prefix = node.prefix or entry
+            else:
+                node.exact = node.exact or entry
+        for child in _item_get(item, children_key) or ():
+            self._add(child, (*ancestors, item), position, x, w, h, children_key)
+
+    def lookup(self, current_path: str) -> NavMatch | None:
+        """Return the single active :class:`NavMatch` for ``current_path``, or None."""
+        last = self._last
+        if last is not None and last[0] == current_path:
+            return last[1]
+        node = self._root
+        best: NavMatch | None = None
+        for segment in current_path.split("/"):
+            child = node.children.get(segment)
+            if child is None:
+                break
+            node = child
+            best = node.prefix or best
+        else:
+            best = node.exact or best
+        self._last = (current_path, best)
+        return best
+
+    def is_active(self, item: object, current_path: str) -> bool:
+        """Drop-in for ``tab_is_active``: True only for the matched item itself."""
+        hit = self.lookup(current_path)
+        return hit is not None and hit.item is item
+
+    def in_trail(self, item: object, current_path: str) -> bool:
+        """True for the matched item and every ancestor (e.g. ``open`` branches)."""
+        hit = self.lookup(current_path)
+        return hit is not None and any(t is item for t in hit.trail)
+
+    def pill_style(self, current_path: str) -> str:
+        """Sliding-pill vars for the top-level item holding the match."""
+        hit = self.lookup(current_path)
+        return _PILL_NONE if hit is None else hit.pill_style
+
+
+_CACHE_SIZE = 64
+_cache: OrderedDict[int, tuple[object, NavIndex]] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def nav_index(
+    items: Sequence[object] | NavIndex,
+    *,
+    children_key: str = "children",
+    kind: str = "route_tab",
+    font: str = "--chirpui-ui-font-family",
+    gap_em: float = 0.5,
+    block_size_em: float = 2.0,
+) -> NavIndex:
+    """Return the cached :class:`NavIndex` for a nav definition.
+
+    Keyed by the identity of ``items`` (held strongly so the id stays unique
+    while cached); the keyword options only apply when the index is built and
+    must not vary between calls for the same definition.
+    """
+    if isinstance(items, NavIndex):
+        return items
+    key = id(items)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None and cached[0] is items:
+            _cache.move_to_end(key)
+            return cached[1]
+    index = NavIndex(
+        items,
+        children_key=children_key,
+        kind=kind,
+        font=font,
+        gap_em=gap_em,
+        block_size_em=block_size_em,
+    )
+    with _cache_lock:
+        _cache[key] = (items, index)
+        _cache.move_to_end(key)
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return index
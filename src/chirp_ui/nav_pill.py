@@ -1,7 +1,10 @@
 """Sliding-pill nav indicator helpers (#255).
 
 Server-side CSS custom-property estimates for first paint; shell runtime
-``syncPill()`` refines to measured pixels on client navigation.
+``syncPill()`` refines to measured pixels on client navigation. Label widths
+come from the glyph advance tables in :mod:`chirp_ui.glyph_metrics`, picked by
+the ``font`` token (a theme that swaps ``--chirpui-ui-font-family`` for a
+monospace stack passes that stack instead).
 """
 
 from __future__ import annotations
@@ -9,10 +12,27 @@ from __future__ import annotations
 from collections.abc import Callable, Iterable
 from typing import Any, cast
 
+from chirp_ui.glyph_metrics import text_width_em
 from chirp_ui.route_tabs import tab_is_active
 
 _PillItem = dict[str, Any] | object
 
+# Route tabs and segmented options both set labels at --chirpui-font-sm,
+# weight --chirpui-ui-font-weight-medium.
+_LABEL_FONT_REM = 0.8125
+_LABEL_WEIGHT = 500
+
+_PILL_NONE = (
+    "--chirpui-pill-x:0rem;--chirpui-pill-y:0rem;--chirpui-pill-w:0rem;--chirpui-pill-h:0rem"
+)
+
+
+def _pill_vars(x: float, w: float, h: float) -> str:
+    return (
+        f"--chirpui-pill-x:{x}rem;--chirpui-pill-y:0rem;"
+        f"--chirpui-pill-w:{w}rem;--chirpui-pill-h:{h}rem"
+    )
+
 
 def _item_get(item: _PillItem, key: str, default: Any = None) -> Any:
     if isinstance(item, dict):
@@ -21,10 +41,15 @@ def _item_get(item: _PillItem, key: str, default: Any = None) -> Any:
     return getattr(item, key, default)
 
 
-def estimate_nav_item_width_em(item: _PillItem, *, kind: str = "route_tab") -> float:
-    """Heuristic width in rem for SSR pill placement before client measurement."""
+def estimate_nav_item_width_em(
+    item: _PillItem, *, kind: str = "route_tab", font: str = "--chirpui-ui-font-family"
+) -> float:
+    """Width in rem for SSR pill placement before client measurement.
+
+    ``font`` is a font-family token or stack; see :func:`glyph_metrics.text_width_em`.
+    """
     label = str(_item_get(item, "label", "") or "")
-    char_w = 0.55
+    label_w = text_width_em(label, font, weight=_LABEL_WEIGHT) * _LABEL_FONT_REM
     if kind == "segmented":
         padding_x = 1.0
         icon_w = 0.75 if _item_get(item, "icon") else 0.0
@@ -40,7 +65,7 @@ def estimate_nav_item_width_em(item: _PillItem, *, kind: str = "route_tab") -> f
             else 0.0
         )
     gaps = 0.5 * sum(bool(x) for x in (icon_w, badge_w))
-    return padding_x + max(len(label), 1) * char_w + icon_w + badge_w + gaps
+    return round(padding_x + label_w + icon_w + badge_w + gaps, 3)
 
 
 def nav_pill_inline_style(
@@ -51,20 +76,18 @@ def nav_pill_inline_style(
     gap_em: float = 0.5,
     block_size_em: float = 2.0,
     match: str = "route",
+    font: str = "--chirpui-ui-font-family",
 ) -> str:
     """Return inline ``style`` for ``--chirpui-pill-*`` vars from item list."""
     active_fn = is_active or tab_is_active
     x = 0.0
     for item in items:
-        w = estimate_nav_item_width_em(item)
+        w = estimate_nav_item_width_em(item, font=font)
         on = bool(_item_get(item, "active")) if match == "flag" else active_fn(item, current_path)
         if on:
-            return (
-                f"--chirpui-pill-x:{x}rem;--chirpui-pill-y:0rem;"
-                f"--chirpui-pill-w:{w}rem;--chirpui-pill-h:{block_size_em}rem"
-            )
-        x += w + gap_em
-    return "--chirpui-pill-x:0rem;--chirpui-pill-y:0rem;--chirpui-pill-w:0rem;--chirpui-pill-h:0rem"
+            return _pill_vars(x, w, block_size_em)
+        x = round(x + w + gap_em, 3)
+    return _PILL_NONE
 
 
 def segmented_pill_inline_style(items: Iterable[_PillItem]) -> str:
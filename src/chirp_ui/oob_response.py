@@ -0,0 +1,159 @@
+"""Coalesced out-of-band response builder for multi-region htmx updates.
+
+A mutation handler often has to refresh several regions at once — the main
+target, a couple of ``counter_badge`` counts, a toast, a ``suspense_slot``
+fill — and apps build that by rendering ``oob_fragment`` / ``oob_toast`` /
+``counter_badge`` one template call at a time and concatenating strings. When
+two code paths both bump the inbox badge, the response carries two swaps for
+the same id.
+
+:class:`OobResponse` collects the updates first, keyed by target id:
+
+* **Last write wins.** A second update for the same id replaces the first, so
+  duplicate badge/region updates collapse to one swap.
+* **Stable order.** An id keeps the position of its first update; toasts
+  (which append to the toast container rather than replace a target) are
+  never collapsed unless given a ``key``.
+* **One pass.** :meth:`OobResponse.render` renders every update with a single
+  ``oob_updates`` macro call (``chirpui/oob.html``); :meth:`OobResponse.stream`
+  yields the main content first, then the updates in batches, for a chunked
+  response.
+
+Example (Chirp route)::
+
+    from chirp_ui import OobResponse
+
+    @app.post("/messages/{id}/read")
+    def mark_read(req, id):
+        resp = OobResponse(main=render_row(id))
+        resp.badge("inbox-count", count=unread_count())
+        resp.fill("activity", render_activity())
+        resp.toast("Marked as read", variant="success")
+        resp.badge("inbox-count", count=unread_count())   # collapses into one swap
+        return resp.render(env)
+
+``env`` is any kida ``Environment`` with chirp-ui registered, as for
+:mod:`chirp_ui.render_stream`. Fragment ``html`` must already be rendered,
+trusted markup: it is emitted unescaped.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any, Protocol, Self
+
+from chirp_ui.render_stream import DEFAULT_BATCH_SIZE, render_macro, stream_macro
+
+__all__ = ["OobResponse"]
+
+_TEMPLATE = "chirpui/oob.html"
+_MACRO = "oob_updates"
+
+
+class _RenderEnv(Protocol):
+    def from_string(self, source: str) -> Any: ...
+
+
+class OobResponse:
+    """Ordered, deduplicated OOB updates plus the main swap content; see module docs."""
+
+    __slots__ = ("_seq", "_updates", "main")
+
+    def __init__(self, main: str = "") -> None:
+        self.main = main
+        self._updates: dict[object, dict[str, object]] = {}
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._updates)
+
+    def __contains__(self, id: object) -> bool:
+        return id in self._updates
+
+    def __bool__(self) -> bool:
+        return bool(self.main or self._updates)
+
+    @property
+    def updates(self) -> list[dict[str, object]]:
+        """The collapsed updates in render order (the ``oob_updates`` argument)."""
+        return list(self._updates.values())
+
+    def _put(self, key: object, update: dict[str, object]) -> Self:
+        self._updates[key] = update
+        return self
+
+    def fragment(
+        self, id: str, html: str, *, swap: str = "true", tag: str = "div", cls: str = ""
+    ) -> Self:
+        """``oob_fragment(id, swap=...)`` around pre-rendered ``html``."""
+        return self._put(
+            id,
+            {"kind": "fragment", "id": id, "html": str(html), "swap": swap, "tag": tag, "cls": cls},
+        )
+
+    def fill(self, id: str, html: str) -> Self:
+        """Replace a ``suspense_slot``'s skeleton with ``html`` (``innerHTML`` swap)."""
+        return self.fragment(id, html, swap="innerHTML")
+
+    def badge(
+        self, id: str, count: int = 0, *, variant: str = "", max_count: int = 99, cls: str = ""
+    ) -> Self:
+        """``counter_badge(id, count=..., oob=true)``."""
+        return self._put(
+            id,
+            {
+                "kind": "badge",
+                "id": id,
+                "count": count,
+                "variant": variant,
+                "max_count": max_count,
+                "cls": cls,
+            },
+        )
+
+    def toast(
+        self,
+        message: str,
+        *,
+        variant: str = "info",
+        dismissible: bool = True,
+        container_id: str = "chirpui-toasts",
+        cls: str = "",
+        key: object = None,
+    ) -> Self:
+        """``oob_toast(message, ...)``. Toasts stack; pass ``key`` to collapse repeats."""
+        if key is None:
+            self._seq += 1
+            key = ("toast", self._seq)
+        else:
+            key = ("toast", key)
+        return self._put(
+            key,
+            {
+                "kind": "toast",
+                "message": message,
+                "variant": variant,
+                "dismissible": dismissible,
+                "container_id": container_id,
+                "cls": cls,
+            },
+        )
+
+    def discard(self, id: object) -> None:
+        """Drop a queued update (a toast by its ``key``)."""
+        self._updates.pop(id, None)
+        self._updates.pop(("toast", id), None)
+
+    def render(self, env: _RenderEnv) -> str:
+        """``main`` followed by every update, rendered in one ``oob_updates`` call."""
+        if not self._updates:
+            return self.main
+        return self.main + render_macro(env, _TEMPLATE, _MACRO, {"updates": self.updates})
+
+    def stream(self, env: _RenderEnv, *, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[str]:
+        """Yield ``main`` (when set), then the updates ``batch_size`` at a time."""
+        if self.main:
+            yield self.main
+        yield from stream_macro(
+            env, _TEMPLATE, _MACRO, self.updates, items_param="updates", batch_size=batch_size
+        )
@@ -14,31 +14,12 @@ from pathlib import Path
 from typing import Any
 
 from kida import Environment, FileSystemLoader
+from kida.bytecode_cache import BytecodeCache
 from kida.template import Markup
 
-from chirp_ui.filters import (
-    _serialize_attr_value,
-    build_hx_attrs,
-    check_required_id,
-    contrast_text,
-    deprecate_param,
-    make_route_link_attrs,
-    resolve_color,
-    resolve_status_variant,
-    sanitize_color,
-    shell_action_btn_variant,
-    value_type,
-)
-from chirp_ui.grid_state import (
-    column_aria_sort,
-    parse_sort,
-    selection_state,
-    sort_columns,
-    sort_query,
-)
+from chirp_ui.filters import _serialize_attr_value
 from chirp_ui.icons import icon as icon_filter
-from chirp_ui.nav_pill import nav_pill_inline_style, segmented_pill_inline_style
-from chirp_ui.route_tabs import tab_is_active
+from chirp_ui.template_registry import install_template_registry
 from chirp_ui.validation import ChirpUIValidationWarning, _warn
 
 TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
@@ -222,56 +203,36 @@ def _primitive_attrs_stub(
     return Markup(f'{base} data-island-primitive="{html.escape(primitive, quote=True)}"')
 
 
-def make_preview_env() -> Environment:
-    """Return a Kida environment wired for chirp-ui template previews."""
+def make_preview_env(*, bytecode_cache: BytecodeCache | bool | None = None) -> Environment:
+    """Return a Kida environment wired for chirp-ui template previews.
+
+    ``bytecode_cache`` is passed to kida unchanged (``None`` keeps its default
+    cache next to the templates; see :func:`chirp_ui.template_cache`).
+    """
     env = Environment(
         loader=FileSystemLoader(str(TEMPLATES_DIR)),
         autoescape=True,
+        bytecode_cache=bytecode_cache,
     )
-    env.update_filters(
-        {
-            "field_errors": _field_errors_stub,
-            "bem": _bem_stub,
-            "html_attrs": _html_attrs_stub,
-            "icon": icon_filter,
-            "validate_variant": _validate_variant_stub,
-            "validate_variant_block": _validate_variant_block_stub,
-            "validate_appearance_block": _validate_appearance_block_stub,
-            "validate_tone_block": _validate_tone_block_stub,
-            "validate_size": _validate_size_stub,
-            "value_type": value_type,
-            "sanitize_color": sanitize_color,
-            "contrast_text": contrast_text,
-            "resolve_color": resolve_color,
-            "deprecate_param": deprecate_param,
-            "resolve_status_variant": resolve_status_variant,
-            "shell_action_btn_variant": shell_action_btn_variant,
-        }
-    )
-    env.add_global("build_hx_attrs", build_hx_attrs)
-    env.add_global("check_required_id", check_required_id)
-    env.add_global("route_link_attrs", make_route_link_attrs())
+    install_template_registry(env)
+    # The tests/conftest.py stubs stand in for the validating filters; they
+    # are not the registry functions, so they must not be constant-folded.
+    stubs = {
+        "field_errors": _field_errors_stub,
+        "bem": _bem_stub,
+        "html_attrs": _html_attrs_stub,
+        "icon": icon_filter,
+        "validate_variant": _validate_variant_stub,
+        "validate_variant_block": _validate_variant_block_stub,
+        "validate_appearance_block": _validate_appearance_block_stub,
+        "validate_tone_block": _validate_tone_block_stub,
+        "validate_size": _validate_size_stub,
+    }
+    env.update_filters(stubs)
+    if hasattr(env, "pure_filters"):
+        env.pure_filters = env.pure_filters - set(stubs)
     env.add_global("island_attrs", _island_attrs_stub)
     env.add_global("primitive_attrs", _primitive_attrs_stub)
-    env.add_global("parse_sort", parse_sort)
-    env.add_global("sort_columns", sort_columns)
-    env.add_global("selection_state", selection_state)
-    env.add_global("column_aria_sort", column_aria_sort)
-    env.add_global("sort_query", sort_query)
-    from chirp_ui.config_schema import Field, Widget, project_fields
-
-    env.add_global("project_fields", project_fields)
-    env.add_global("config_field", Field)
-    env.add_global("Widget", Widget)
-    env.add_global("tab_is_active", tab_is_active)
-    env.add_global("nav_pill_inline_style", nav_pill_inline_style)
-    env.add_global("segmented_pill_inline_style", segmented_pill_inline_style)
-    from chirp_ui.shortcuts import shortcuts_by_category, shortcuts_json
-    from chirp_ui.text_fragment import build_text_fragment_url
-
-    env.add_global("shortcuts_by_category", shortcuts_by_category)
-    env.add_global("shortcuts_json", shortcuts_json)
-    env.add_global("build_text_fragment_url", build_text_fragment_url)
     env.add_global(
         "csrf_field",
         lambda: Markup('<input type="hidden" name="_csrf_token" value="preview">'),
@@ -0,0 +1,379 @@
+"""Chunked (streaming) render helpers for long row/item macros.
+
+A full ``template.render()`` builds the whole page in memory before the first
+byte leaves the server: a 20k-row admin export waits for the last DB row. These
+generators yield HTML in row batches instead — the container's opening markup
+first, then one rendered batch per ``batch_size`` rows pulled from the
+(possibly lazy) source, then the closing markup — for a chunked-transfer /
+generator response::
+
+    @app.get("/audit/export")
+    def export(req):
+        events = db.iter_events(order_by="-at")          # server-side cursor
+        return Stream(stream_table(env, ([e.at, e.actor, e.action] for e in events),
+                                   headers=["When", "Who", "What"]))
+
+    # Load-more fragment: bare <tr> rows, then the OOB sentinel (#231).
+    return Stream(stream_grid_rows(env, cols, record_rows(cursor, COLS),
+                                   selection_id="users", load_more_url=next_url,
+                                   has_more=has_more))
+
+Each batch is a normal macro call (``list_items``, ``table_rows``,
+``timeline_items``, ``data_grid_rows``), so streamed and non-streamed output
+share one template. Wrapper markup comes from rendering the container macro
+once in its slot form around a marker and splitting there. ``env`` is any kida
+``Environment`` with the chirp-ui loader and filters/globals registered (the
+app's template environment, or :func:`chirp_ui.preview_env.make_preview_env`).
+Each batch goes through kida's ``Template.render_stream``; :func:`astream_macro`
+is the async variant over ``render_stream_async`` for async row sources (an
+async DB cursor) and async templates. Compiled call templates are cached on the
+environment itself, so they live and die with it.
+
+:func:`render_macro` (one macro call to a string) and :func:`stream_wrapped`
+(container head, streamed body batches, tail) are the building blocks the
+other render helpers (:mod:`chirp_ui.sse`, :mod:`chirp_ui.suspense`,
+:mod:`chirp_ui.typeahead`, ...) share.
+"""
+
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator, Mapping
+from itertools import islice
+from typing import Any, Protocol
+
+from chirp_ui.grid_state import grid_rows
+
+__all__ = [
+    "DEFAULT_BATCH_SIZE",
+    "astream_macro",
+    "render_macro",
+    "stream_grid_rows",
+    "stream_list",
+    "stream_macro",
+    "stream_table",
+    "stream_timeline",
+    "stream_wrapped",
+]
+
+DEFAULT_BATCH_SIZE = 100
+# Slot body used to split a container macro into head/tail markup. An HTML
+# comment so it is inert even if a future template echoes it unescaped.
+_MARKER = "<!--chirpui:stream-body-->"
+# Per-environment cache of compiled call templates, stored on the env so it is
+# released with it (a module-level cache keyed on the env would pin it).
+_CACHE_ATTR = "_chirpui_call_templates"
+
+
+class _TemplateEnv(Protocol):
+    def from_string(self, source: str) -> Any: ...
+
+
+def _batches(items: Iterable[object], size: int) -> Iterator[list[object]]:
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+async def _abatches(
+    items: AsyncIterable[object] | Iterable[object], size: int
+) -> AsyncIterator[list[object]]:
+    if not isinstance(items, AsyncIterable):
+        for batch in _batches(items, size):
+            yield batch
+        return
+    batch: list[object] = []
+    async for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _call_source(template: str, macro: str, params: tuple[str, ...], *, slot: bool) -> str:
+    for name in (macro, *params):
+        if not name.isidentifier():
+            raise ValueError(f"not a valid macro/param name: {name!r}")
+    args = ", ".join(f"{p}={p}" for p in params)
+    head = f'{{% from "{template}" import {macro} %}}'
+    if slot:
+        return f"{head}{{% call {macro}({args}) %}}{_MARKER}{{% end %}}"
+    return f"{head}{{{{ {macro}({args}) }}}}"
+
+
+def _compiled(
+    env: _TemplateEnv, template: str, macro: str, params: tuple[str, ...], slot: bool
+) -> Any:
+    cache: dict[tuple[str, str, tuple[str, ...], bool], Any] | None = getattr(
+        env, _CACHE_ATTR, None
+    )
+    if cache is None:
+        cache = {}
+        setattr(env, _CACHE_ATTR, cache)
+    key = (template, macro, params, slot)
+    compiled = cache.get(key)
+    if compiled is None:
+        compiled = cache[key] = env.from_string(_call_source(template, macro, params, slot=slot))
+    return compiled
+
+
+def render_macro(
+    env: _TemplateEnv,
+    template: str,
+    macro: str,
+    kwargs: Mapping[str, object],
+    *,
+    slot: bool = False,
+) -> str:
+    """Render ``macro(**kwargs)`` from ``template`` to a string.
+
+    ``slot=True`` calls it in ``{% call %}`` form with an inert marker comment
+    as the default slot body. The call template is compiled once per
+    environment and argument-name set.
+    """
+    params = tuple(sorted(kwargs))
+    return str(_compiled(env, template, macro, params, slot).render(**kwargs))
+
+
+def _shell(
+    env: _TemplateEnv, template: str, macro: str, kwargs: Mapping[str, object]
+) -> tuple[str, str]:
+    """Render ``macro`` in slot form and split it into (head, tail) markup."""
+    html = render_macro(env, template, macro, kwargs, slot=True)
+    head, sep, tail = html.partition(_MARKER)
+    if not sep:
+        raise ValueError(f"{template}:{macro} did not render its default slot")
+    return head, tail
+
+
+def stream_macro(
+    env: _TemplateEnv,
+    template: str,
+    macro: str,
+    items: Iterable[object],
+    *,
+    items_param: str = "items",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    start_param: str | None = None,
+    **kwargs: object,
+) -> Iterator[str]:
+    """Yield ``macro(items_param=batch, **kwargs)`` once per batch of ``items``.
+
+    The generic building block: ``items`` is consumed lazily, ``batch_size``
+    rows at a time. ``start_param`` (when the macro has one) receives the
+    absolute offset of each batch so positional ids/labels stay global.
+    """
+    size = max(1, int(batch_size))
+    offset = 0
+    for batch in _batches(items, size):
+        call = {**kwargs, items_param: batch}
+        if start_param:
+            call[start_param] = offset
+        yield from _compiled(env, template, macro, tuple(sorted(call)), False).render_stream(**call)
+        offset += len(batch)
+
+
+async def astream_macro(
+    env: _TemplateEnv,
+    template: str,
+    macro: str,
+    items: AsyncIterable[object] | Iterable[object],
+    *,
+    items_param: str = "items",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    start_param: str | None = None,
+    **kwargs: object,
+) -> AsyncIterator[str]:
+    """Async :func:`stream_macro`: ``items`` may be an async iterable.
+
+    Rows are pulled ``batch_size`` at a time without blocking the loop and
+    each batch renders through ``render_stream_async``, so macros that
+    ``await`` or ``async for`` inside work too.
+    """
+    size = max(1, int(batch_size))
+    offset = 0
+    async for batch in _abatches(items, size):
+        call = {**kwargs, items_param: batch}
+        if start_param:
+            call[start_param] = offset
+        compiled = _compiled(env, template, macro, tuple(sorted(call)), False)
+        async for chunk in compiled.render_stream_async(**call):
+            yield chunk
+        offset += len(batch)
+
+
+def stream_grid_rows(
+    env: _TemplateEnv,
+    columns: Iterable[object],
+    rows: Iterable[object],
+    *,
+    row_ids: list[object] | None = None,
+    row_labels: list[object] | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    selection_id: str = "grid",
+    load_more_url: str | None = None,
+    has_more: bool = False,
+    load_more_label: str = "Load more",
+    load_more_trigger: str = "click",
+    load_more_swap: str = "beforeend",
+    **kwargs: object,
+) -> Iterator[str]:
+    """Stream the ``data_grid_rows`` load-more fragment in row batches.
+
+    ``rows`` is anything ``data_grid(rows=...)`` accepts — best a lazy
+    :func:`~chirp_ui.grid_state.record_rows` source over a DB cursor. Rows are
+    normalized once (so fallback ids stay global across batches), streamed as
+    bare ``<tr>`` batches, and the OOB load-more sentinel is emitted last.
+    ``kwargs`` pass through to ``data_grid_rows`` (``selectable``,
+    ``select_name``, ``selection``).
+    """
+    cols = list(columns)
+    normalized = grid_rows(rows, row_ids, row_labels)
+    yield from stream_macro(
+        env,
+        "chirpui/data_grid.html",
+        "data_grid_rows",
+        normalized,
+        items_param="rows",
+        batch_size=batch_size,
+        columns=cols,
+        selection_id=selection_id,
+        **kwargs,
+    )
+    if load_more_url:
+        yield render_macro(
+            env,
+            "chirpui/data_grid.html",
+            "grid_load_more",
+            {
+                "selection_id": selection_id,
+                "load_more_url": load_more_url,
+                "has_more": has_more,
+                "load_more_label": load_more_label,
+                "load_more_trigger": load_more_trigger,
+                "load_more_swap": load_more_swap,
+                "oob": True,
+            },
+        )
+
+
+def stream_wrapped(
+    env: _TemplateEnv,
+    template: str,
+    container: str,
+    container_kwargs: Mapping[str, object],
+    body_macro: str,
+    items: Iterable[object],
+    *,
+    items_param: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    start_param: str | None = None,
+    **body_kwargs: object,
+) -> Iterator[str]:
+    """Yield ``container``'s head markup, ``body_macro`` batches, then its tail.
+
+    ``container`` must render its default slot (see :func:`render_macro`);
+    the body batches are :func:`stream_macro` calls of ``body_macro``.
+    """
+    head, tail = _shell(env, template, container, container_kwargs)
+    yield head
+    yield from stream_macro(
+        env,
+        template,
+        body_macro,
+        items,
+        items_param=items_param,
+        batch_size=batch_size,
+        start_param=start_param,
+        **body_kwargs,
+    )
+    yield tail
+
+
+def stream_list(
+    env: _TemplateEnv,
+    items: Iterable[object],
+    *,
+    linked: bool = False,
+    bordered: bool = False,
+    cls: str = "",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[str]:
+    """Stream ``list_group(items)``: the ``<ul>``, ``<li>`` batches, ``</ul>``."""
+    yield from stream_wrapped(
+        env,
+        "chirpui/list.html",
+        "list_group",
+        {"bordered": bordered, "cls": cls},
+        "list_items",
+        items,
+        items_param="items",
+        batch_size=batch_size,
+        linked=linked,
+    )
+
+
+def stream_table(
+    env: _TemplateEnv,
+    rows: Iterable[object],
+    *,
+    align: list[str] | None = None,
+    selectable: bool = False,
+    select_name: str = "ids",
+    selection: object = None,
+    row_id: object = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    **table_kwargs: object,
+) -> Iterator[str]:
+    """Stream ``table(rows=...)``: wrapper + ``<thead>``, ``<tr>`` batches, close.
+
+    ``table_kwargs`` are the remaining ``table`` params (``headers``,
+    ``striped``, ``sticky_header``, ``widths``, ...).
+    """
+    container = {
+        **table_kwargs,
+        "align": align,
+        "selectable": selectable,
+        "selection": selection,
+    }
+    yield from stream_wrapped(
+        env,
+        "chirpui/table.html",
+        "table",
+        container,
+        "table_rows",
+        rows,
+        items_param="rows",
+        batch_size=batch_size,
+        start_param="start",
+        align=align,
+        selectable=selectable,
+        select_name=select_name,
+        selection=selection,
+        row_id=row_id,
+    )
+
+
+def stream_timeline(
+    env: _TemplateEnv,
+    items: Iterable[Mapping[str, object]],
+    *,
+    link_mode: str = "overlay",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    **timeline_kwargs: object,
+) -> Iterator[str]:
+    """Stream ``timeline(items=...)``: the wrapper, item batches, close.
+
+    ``timeline_kwargs`` are the remaining ``timeline`` params (``hoverable``,
+    ``density``, ``variant``, ``cls``).
+    """
+    yield from stream_wrapped(
+        env,
+        "chirpui/timeline.html",
+        "timeline",
+        {**timeline_kwargs, "link_mode": link_mode},
+        "timeline_items",
+        items,
+        items_param="items",
+        batch_size=batch_size,
+        link_mode=link_mode,
+    )
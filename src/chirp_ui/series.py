@@ -0,0 +1,229 @@
+"""Server-side series projection for sparklines and small charts.
+
+Modeled on :mod:`chirp_ui.grid_state`: stdlib + dataclasses only, no ``import
+chirp`` and no ``import kida``.
+
+``ascii_sparkline`` used to loop over every value in the template, take
+``min``/``max`` with filters and put ``values | join(', ')`` into its
+``aria-label``, so a 50k-point metric series rendered megabytes of HTML.
+:func:`project_series` reduces a series to at most ``width`` points once, in
+Python, and returns a :class:`Series` with the kept values, their 0-7 bar
+level (the eight ``▁``-``█`` glyphs) and a summarized aria label. Render cost
+is then bounded by the sparkline width, not the data size.
+
+Two reducers:
+
+* ``"lttb"`` (default) — Largest-Triangle-Three-Buckets keeps the points that
+  preserve the visual shape of the line; first and last points are kept.
+* ``"minmax"`` — each bucket keeps its minimum and maximum in source order, so
+  spikes and dips always survive (better for error/latency series).
+
+Levels are normalized against the min/max of the **whole** source series, so a
+downsampled sparkline uses the same scale as the full one.
+
+Example (template)::
+
+    {{ ascii_sparkline(values=latency_ms, width=80, method="minmax") }}
+
+Example (Chirp route)::
+
+    from chirp_ui import project_series
+
+    s = project_series(latency_ms, width=80)
+    bar_chart(items=s.rows)          # one row per kept point
+    animated_counter(s.last)         # latest value
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+from chirp_ui.validation import ChirpUIValidationWarning, _warn
+
+__all__ = [
+    "BAR_GLYPHS",
+    "DEFAULT_WIDTH",
+    "SERIES_METHODS",
+    "Series",
+    "lttb_indices",
+    "minmax_indices",
+    "project_series",
+]
+
+#: The eight block glyphs ``ascii_sparkline`` renders, indexed by level 0-7.
+BAR_GLYPHS = ("▁", "▂", "▃", "▄", "▅", "▆", "▇", "█")
+
+#: Default maximum number of points kept by :func:`project_series`.
+DEFAULT_WIDTH = 120
+
+SERIES_METHODS = ("lttb", "minmax")
+
+# Series up to this length list every value in the aria label, as before.
+_ARIA_LIST_MAX = 16
+
+
+@dataclass(frozen=True, slots=True)
+class Series:
+    """A render-ready (possibly downsampled) series.
+
+    ``indices`` are the positions of ``values`` in the source series, ``count``
+    its original length; ``vmin``/``vmax`` span the whole source.
+    """
+
+    values: tuple[float, ...]
+    indices: tuple[int, ...]
+    levels: tuple[int, ...]
+    count: int
+    vmin: float
+    vmax: float
+    aria_label: str
+    labels: tuple[str, ...] = ()
+
+    @property
+    def downsampled(self) -> bool:
+        return len(self.values) < self.count
+
+    @property
+    def first(self) -> float | None:
+        return self.values[0] if self.values else None
+
+    @property
+    def last(self) -> float | None:
+        return self.values[-1] if self.values else None
+
+    @property
+    def bars(self) -> str:
+        """The sparkline as one string of block glyphs."""
+        return "".join(BAR_GLYPHS[level] for level in self.levels)
+
+    @property
+    def rows(self) -> tuple[dict[str, object], ...]:
+        """``{label, value}`` items for ``bar_chart(items=...)``.
+
+        Labels come from ``labels`` (by source index) or are the source index.
+        """
+        labels = self.labels
+        return tuple(
+            {"label": labels[i] if i < len(labels) else str(i), "value": v}
+            for i, v in zip(self.indices, self.values, strict=True)
+        )
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def lttb_indices(values: Sequence[float], threshold: int) -> list[int]:
+    """Indices of the points Largest-Triangle-Three-Buckets keeps (``x`` = index)."""
+    n = len(values)
+    if threshold >= n:
+        return list(range(n))
+    if threshold < 3:
+        return [0, n - 1][: max(threshold, 0)]
+    kept = [0]
+    every = (n - 2) / (threshold - 2)
+    a = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * every) + 1
+        end = int((bucket + 1) * every) + 1
+        next_end = min(int((bucket + 2) * every) + 1, n)
+        # Average of the next bucket (the last point for the final bucket).
+        if end >= n - 1:
+            avg_x, avg_y = float(n - 1), float(values[n - 1])
+        else:
+            span = next_end - end
+            avg_x = (end + next_end - 1) / 2
+            avg_y = sum(values[end:next_end]) / span
+        ax, ay = a, values[a]
+        best, best_area = start, -1.0
+        for i in range(start, end):
+            area = abs((ax - avg_x) * (values[i] - ay) - (ax - i) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = i, area
+        kept.append(best)
+        a = best
+    kept.append(n - 1)
+    return kept
+
+
+def minmax_indices(values: Sequence[float], width: int) -> list[int]:
+    """Indices of each bucket's min and max, in source order (at most ``width``)."""
+    n = len(values)
+    if width >= n:
+        return list(range(n))
+    buckets = max(width // 2, 1)
+    kept: list[int] = []
+    for bucket in range(buckets):
+        start = bucket * n // buckets
+        end = (bucket + 1) * n // buckets
+        lo = hi = start
+        for i in range(start + 1, end):
+            v = values[i]
+            if v < values[lo]:
+                lo = i
+            elif v > values[hi]:
+                hi = i
+        kept.extend(sorted({lo, hi}))
+    # One bucket still yields two points; never exceed the requested width.
+    return kept[: max(width, 0)]
+
+
+def _num(value: float) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return f"{value:.4g}" if isinstance(value, float) else str(value)
+
+
+def _aria(source: Sequence[float], vmin: float, vmax: float) -> str:
+    if len(source) <= _ARIA_LIST_MAX:
+        return "Sparkline: " + ", ".join(str(v) for v in source)
+    return (
+        f"Sparkline: {len(source)} points, min {_num(vmin)}, max {_num(vmax)}, "
+        f"last {_num(source[-1])}"
+    )
+
+
+def project_series(
+    values: Iterable[float] | Series,
+    *,
+    width: int | None = DEFAULT_WIDTH,
+    method: str = "lttb",
+    labels: Iterable[object] = (),
+) -> Series:
+    """Downsample ``values`` to at most ``width`` points and normalize to bar levels.
+
+    A :class:`Series` is returned unchanged. ``width=None`` keeps every point.
+    Unknown ``method`` values fall back to ``"lttb"`` with a
+    :class:`~chirp_ui.validation.ChirpUIValidationWarning` (``ValueError`` in
+    strict mode), as ``ascii_sparkline(method=...)`` does.
+    """
+    if isinstance(values, Series):
+        return values
+    if method not in SERIES_METHODS:
+        _warn(
+            f"chirp-ui: series method {method!r} not in {SERIES_METHODS!r}; using 'lttb'",
+            category=ChirpUIValidationWarning,
+        )
+        method = "lttb"
+    source = values if isinstance(values, Sequence) else tuple(values)
+    count = len(source)
+    vmin = min(source) if count else 0
+    vmax = max(source) if count else 1
+    vrange = vmax - vmin if vmax != vmin else 1
+    if width is None or count <= width:
+        indices: Sequence[int] = range(count)
+    elif method == "minmax":
+        indices = minmax_indices(source, width)
+    else:
+        indices = lttb_indices(source, width)
+    kept = tuple(source[i] for i in indices)
+    return Series(
+        values=kept,
+        indices=tuple(indices),
+        levels=tuple(int((v - vmin) / vrange * 7) for v in kept),
+        count=count,
+        vmin=vmin,
+        vmax=vmax,
+        aria_label=_aria(source, vmin, vmax),
+        labels=tuple(str(label) for label in labels),
+    )
@@ -0,0 +1,434 @@
+"""Shared SSE fan-out broker for ``streaming_bubble`` and ``sse_status``.
+
+Stdlib only (asyncio), no ``import chirp`` and no ``import kida``. The
+``streaming_bubble`` / ``streaming_block`` / ``model_card`` macros connect one
+``sse-connect`` stream per client and swap each ``fragment`` event in (the
+stream ends on the ``done`` event, ``sse_close="done"``). Serving that with one
+generator per connection means N clients poll the source N times and render
+every fragment N times. :class:`SSEBroker` runs one upstream producer per
+topic instead and fans its events out:
+
+* **Render once.** Each event is rendered (:meth:`SSEBroker.publish_fragment`)
+  and encoded to its wire frame once; every subscriber queues the same string.
+* **Bounded queues.** Each subscriber has its own queue of ``queue_size``
+  frames. When a slow client's queue is full, ``policy="drop"`` drops its
+  oldest frame; ``policy="coalesce"`` merges the new frame into the last queued
+  one of the same event name (right for ``beforeend`` swaps such as
+  ``streaming_bubble``, where appending A then B equals appending A+B) and only
+  drops when the names differ.
+* **Replay.** The last ``replay`` events per topic stay in a ring buffer;
+  a reconnecting ``EventSource`` sends ``Last-Event-ID`` and gets everything
+  after it before live events. The replayed backlog is queued whole, outside
+  the ``queue_size`` bound, so backpressure never drops part of it.
+* **Producer lifecycle.** A producer registered with :meth:`SSEBroker.register`
+  starts with the first subscriber and runs exactly once: when the last
+  subscriber leaves it keeps running for ``linger`` seconds, so a reconnecting
+  ``EventSource`` resumes it (replaying what it missed) instead of restarting
+  it from the top. If nobody comes back it is cancelled and the topic closed.
+  When it finishes the topic is closed (``done`` event); when it raises, the
+  error is logged and the topic gets an ``error`` event before ``done``.
+* **Reaping.** A closed topic without subscribers is dropped ``linger``
+  seconds after it closed; until then late reconnects still get its replay
+  and :meth:`SSEBroker.publish` to it raises ``RuntimeError``.
+
+Example (Chirp routes)::
+
+    from chirp_ui import SSEBroker
+
+    broker = SSEBroker(replay=512, queue_size=64, policy="coalesce")
+
+    def answer(chat_id):
+        async def produce():
+            async for token in llm.stream(chat_id):
+                yield token                            # a "fragment" event
+        return produce
+
+    @app.get("/chat/{chat_id}/stream")
+    async def stream(req, chat_id):
+        broker.register(f"chat:{chat_id}", answer(chat_id))
+        return EventStream(broker.stream(f"chat:{chat_id}",
+                                         last_event_id=req.headers.get("Last-Event-ID")))
+
+    # Anywhere on the loop: render once, deliver to every subscriber.
+    broker.publish_fragment("jobs", env, "chirpui/sse_status.html", "sse_status",
+                            {"state": "connected"}, event="status")
+
+``publish``/``close`` are plain (non-blocking) methods and must run on the
+event loop thread; from worker threads use ``loop.call_soon_threadsafe``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Mapping
+from dataclasses import dataclass
+from typing import Any, Protocol, Self
+
+from chirp_ui.render_stream import render_macro
+
+__all__ = [
+    "POLICIES",
+    "SSEBroker",
+    "SSEEvent",
+    "Subscription",
+    "encode_event",
+]
+
+#: Backpressure policies for a full subscriber queue.
+POLICIES = ("drop", "coalesce")
+
+#: What a producer may yield: fragment HTML, or ``(event, data)``.
+ProducerItem = str | tuple[str, str]
+Producer = Callable[[], AsyncIterable[ProducerItem]]
+
+_KEEPALIVE = ": keepalive\n\n"
+
+_log = logging.getLogger(__name__)
+
+
+class _RenderEnv(Protocol):
+    def from_string(self, source: str) -> Any: ...
+
+
+def encode_event(data: str, *, event: str = "", id: str = "") -> str:
+    """Encode one SSE frame; multi-line ``data`` becomes several ``data:`` lines."""
+    lines = []
+    if id:
+        lines.append(f"id: {id}")
+    if event:
+        lines.append(f"event: {event}")
+    lines.extend(f"data: {line}" for line in data.split("\n"))
+    return "\n".join(lines) + "\n\n"
+
+
+@dataclass(frozen=True, slots=True)
+class SSEEvent:
+    """A published event; ``wire`` is its encoded frame, shared by all subscribers."""
+
+    id: str
+    event: str
+    data: str
+    wire: str
+
+    @classmethod
+    def build(cls, data: str, *, event: str, id: str) -> SSEEvent:
+        return cls(id=id, event=event, data=data, wire=encode_event(data, event=event, id=id))
+
+
+class Subscription:
+    """One client's bounded view of a topic; async-iterate it for wire frames.
+
+    Iteration ends when the topic is closed (after the ``done`` frame) or the
+    subscription is closed. ``dropped`` counts frames lost to backpressure.
+    """
+
+    __slots__ = (
+        "_broker",
+        "_closed",
+        "_queue",
+        "_ready",
+        "dropped",
+        "keepalive",
+        "policy",
+        "size",
+        "topic",
+    )
+
+    def __init__(
+        self,
+        broker: SSEBroker,
+        topic: str,
+        *,
+        size: int,
+        policy: str,
+        keepalive: float | None,
+    ) -> None:
+        self._broker = broker
+        self.topic = topic
+        self.size = max(1, size)
+        self.policy = policy
+        self.keepalive = keepalive
+        self.dropped = 0
+        self._queue: deque[SSEEvent] = deque()
+        self._ready = asyncio.Event()
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _backfill(self, events: list[SSEEvent]) -> None:
+        # The replayed backlog bypasses the bound and widens it by its length,
+        # so the first live frames do not evict it.
+        self._queue.extend(events)
+        self.size += len(events)
+        if events:
+            self._ready.set()
+
+    def _offer(self, ev: SSEEvent) -> None:
+        queue = self._queue
+        if len(queue) >= self.size:
+            last = queue[-1]
+            if self.policy == "coalesce" and last.event == ev.event:
+                queue[-1] = SSEEvent.build(last.data + ev.data, event=ev.event, id=ev.id)
+                self._ready.set()
+                return
+            queue.popleft()
+            self.dropped += 1
+        queue.append(ev)
+        self._ready.set()
+
+    def _finish(self) -> None:
+        self._closed = True
+        self._ready.set()
+
+    def close(self) -> None:
+        """Leave the topic; frames already queued are discarded."""
+        if not self._closed:
+            self._finish()
+            self._queue.clear()
+        self._broker._unsubscribe(self)
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> str:
+        while not self._queue:
+            if self._closed:
+                raise StopAsyncIteration
+            self._ready.clear()
+            if self.keepalive is None:
+                await self._ready.wait()
+                continue
+            try:
+                await asyncio.wait_for(self._ready.wait(), self.keepalive)
+            except TimeoutError:
+                return _KEEPALIVE
+        return self._queue.popleft().wire
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        self.close()
+
+
+class _Topic:
+    __slots__ = ("closed", "history", "idle", "next_id", "producer", "subscribers", "task")
+
+    def __init__(self, replay: int) -> None:
+        self.history: deque[SSEEvent] = deque(maxlen=max(0, replay))
+        self.subscribers: set[Subscription] = set()
+        self.producer: Producer | None = None
+        self.task: asyncio.Task[None] | None = None
+        self.idle: asyncio.TimerHandle | None = None
+        self.next_id = 1
+        self.closed = False
+
+
+class SSEBroker:
+    """Per-topic fan-out with bounded subscriber queues and replay; see module docs."""
+
+    __slots__ = ("_topics", "keepalive", "linger", "policy", "queue_size", "replay")
+
+    def __init__(
+        self,
+        *,
+        replay: int = 256,
+        queue_size: int = 64,
+        policy: str = "drop",
+        keepalive: float | None = None,
+        linger: float = 5.0,
+    ) -> None:
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be one of {POLICIES}, got {policy!r}")
+        self.replay = replay
+        self.queue_size = queue_size
+        self.policy = policy
+        self.keepalive = keepalive
+        self.linger = linger
+        self._topics: dict[str, _Topic] = {}
+
+    def _topic(self, name: str) -> _Topic:
+        topic = self._topics.get(name)
+        if topic is None:
+            topic = self._topics[name] = _Topic(self.replay)
+        return topic
+
+    def subscriber_count(self, topic: str) -> int:
+        t = self._topics.get(topic)
+        return len(t.subscribers) if t else 0
+
+    def register(self, topic: str, producer: Producer) -> None:
+        """Set the upstream producer for ``topic`` (no-op while one is registered).
+
+        ``producer()`` returns an async iterable of fragment HTML strings (sent
+        as ``fragment`` events) or ``(event, data)`` pairs. It is called once,
+        runs while the topic has subscribers (plus ``linger`` seconds after the
+        last one leaves) and closes the topic when it finishes or raises.
+        """
+        t = self._topic(topic)
+        if t.producer is None:
+            t.producer = producer
+            if t.subscribers:
+                self._start(topic, t)
+
+    def publish(self, topic: str, data: str, *, event: str = "fragment") -> SSEEvent:
+        """Encode ``data`` once, buffer it for replay and queue it for every subscriber.
+
+        Raises ``RuntimeError`` for a closed topic that has not been reaped yet.
+        """
+        t = self._topic(topic)
+        if t.closed:
+            raise RuntimeError(f"SSE topic {topic!r} is closed")
+        ev = SSEEvent.build(str(data), event=event, id=str(t.next_id))
+        t.next_id += 1
+        t.history.append(ev)
+        for sub in t.subscribers:
+            sub._offer(ev)
+        return ev
+
+    def publish_fragment(
+        self,
+        topic: str,
+        env: _RenderEnv,
+        template: str,
+        macro: str,
+        kwargs: Mapping[str, object] | None = None,
+        *,
+        event: str = "fragment",
+    ) -> SSEEvent:
+        """Render ``macro(**kwargs)`` once and :meth:`publish` the HTML."""
+        html = render_macro(env, template, macro, kwargs or {})
+        return self.publish(topic, html.strip(), event=event)
+
+    def close(self, topic: str, *, event: str = "done", data: str = "") -> None:
+        """Publish the closing event (``sse_close="done"``) and end every subscription."""
+        t = self._topics.get(topic)
+        if t is None or t.closed:
+            return
+        self.publish(topic, data, event=event)
+        t.closed = True
+        self._stop(t)
+        for sub in t.subscribers:
+            sub._finish()
+        t.subscribers.clear()
+        self._schedule_idle(topic, t)
+
+    def subscribe(
+        self,
+        topic: str,
+        *,
+        last_event_id: str | None = None,
+        queue_size: int | None = None,
+        policy: str | None = None,
+    ) -> Subscription:
+        """Join ``topic``, replaying buffered events after ``last_event_id``.
+
+        An id older than the buffer replays all of it; a missing or foreign id
+        replays nothing. Subscribing to a closed topic replays and then ends.
+        """
+        if policy is not None and policy not in POLICIES:
+            raise ValueError(f"policy must be one of {POLICIES}, got {policy!r}")
+        t = self._topic(topic)
+        sub = Subscription(
+            self,
+            topic,
+            size=self.queue_size if queue_size is None else queue_size,
+            policy=policy or self.policy,
+            keepalive=self.keepalive,
+        )
+        sub._backfill(self._replay(t, last_event_id))
+        if t.closed:
+            sub._finish()
+            return sub
+        t.subscribers.add(sub)
+        if t.idle is not None:
+            t.idle.cancel()
+            t.idle = None
+        if t.producer is not None and t.task is None:
+            self._start(topic, t)
+        return sub
+
+    async def stream(self, topic: str, *, last_event_id: str | None = None) -> AsyncIterator[str]:
+        """Async generator of wire frames for a streaming response; unsubscribes on exit."""
+        async with self.subscribe(topic, last_event_id=last_event_id) as sub:
+            async for frame in sub:
+                yield frame
+
+    @staticmethod
+    def _replay(t: _Topic, last_event_id: str | None) -> list[SSEEvent]:
+        if not last_event_id:
+            return []
+        try:
+            last = int(last_event_id)
+        except ValueError:
+            return []
+        return [ev for ev in t.history if int(ev.id) > last]
+
+    def _unsubscribe(self, sub: Subscription) -> None:
+        t = self._topics.get(sub.topic)
+        if t is None:
+            return
+        t.subscribers.discard(sub)
+        if not t.subscribers and t.task is not None:
+            self._schedule_idle(sub.topic, t)
+
+    def _schedule_idle(self, name: str, t: _Topic) -> None:
+        if t.idle is not None:
+            t.idle.cancel()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            t.idle = None
+            return
+        t.idle = loop.call_later(self.linger, self._expire, name, t)
+
+    def _expire(self, name: str, t: _Topic) -> None:
+        t.idle = None
+        if t.subscribers or self._topics.get(name) is not t:
+            return
+        if t.closed:
+            del self._topics[name]
+        elif t.task is not None:
+            # Nobody reconnected within the grace period: stop the producer.
+            self.close(name)
+
+    def _start(self, name: str, t: _Topic) -> None:
+        t.task = asyncio.get_running_loop().create_task(self._run(name, t))
+
+    @staticmethod
+    def _stop(t: _Topic) -> None:
+        task, t.task = t.task, None
+        if task is not None and task is not _current_task():
+            task.cancel()
+
+    async def _run(self, name: str, t: _Topic) -> None:
+        assert t.producer is not None
+        try:
+            async for item in t.producer():
+                if isinstance(item, tuple):
+                    event, data = item
+                    self.publish(name, data, event=event)
+                else:
+                    self.publish(name, item)
+        except Exception:
+            _log.exception("SSE producer for topic %r failed", name)
+            if t.task is _current_task():
+                self.publish(name, "", event="error")
+                self.close(name)
+            return
+        if t.task is _current_task():
+            self.close(name)
+
+
+def _current_task() -> asyncio.Task[Any] | None:
+    with contextlib.suppress(RuntimeError):
+        return asyncio.current_task()
+    return None
@@ -0,0 +1,139 @@
+"""Concurrent resolver for ``suspense_slot`` / ``suspense_group`` deferred blocks.
+
+``chirpui/suspense.html`` renders the shell immediately (skeletons in
+``suspense_slot`` regions) and expects the deferred blocks to arrive later as
+OOB swaps. :func:`resolve_deferred` produces that tail of the response: it
+maps slot ids to awaitables, runs them all at once as tasks, and yields each
+slot's OOB fill the moment its source resolves — the fastest query is on the
+wire while the slowest is still running. A slot that times out or raises is
+logged (with its slot id) and gets a fallback fill instead, and when every slot
+is done the ``suspense_group`` busy state is cleared (``suspense_group_done``).
+
+The generator yields outside any task group or cancel scope, so the consumer
+may stop early; ``aclose()`` it (``contextlib.aclosing``) to cancel the
+sources still running rather than leaving that to garbage collection.
+
+Example (Chirp route)::
+
+    from chirp_ui.suspense import DeferredBlock, resolve_deferred
+
+    @app.get("/dashboard")
+    async def dashboard(req):
+        async def page():
+            yield env.get_template("dashboard.html").render(user=req.user)  # the shell
+            async for fill in resolve_deferred(env, {
+                "stats": DeferredBlock(load_stats(req.user), "stats.html", "stats_card",
+                                       param="stats", timeout=2),
+                "activity": render_activity(req.user),        # awaitable of HTML
+            }, timeout=5, group_id="dashboard"):
+                yield fill
+        return Stream(page())
+
+A source is an awaitable (or a zero-argument callable returning one). Its
+result is rendered with ``template``/``macro`` (the result passed as
+``param``) when given, else used as the fill's HTML. Fills are rendered with
+:class:`~chirp_ui.oob_response.OobResponse` (``innerHTML`` swap into the slot).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+from chirp_ui.oob_response import OobResponse
+from chirp_ui.render_stream import render_macro
+
+__all__ = ["DEFAULT_FALLBACK", "DeferredBlock", "resolve_deferred"]
+
+#: Fill for a slot whose source timed out or raised (matches the streaming
+#: components' fallback copy).
+DEFAULT_FALLBACK = '<p class="chirpui-text-muted" role="alert">Content unavailable</p>'
+
+Source = Awaitable[object] | Callable[[], Awaitable[object]]
+
+_log = logging.getLogger(__name__)
+
+
+class _RenderEnv(Protocol):
+    def from_string(self, source: str) -> Any: ...
+
+
+@dataclass(frozen=True, slots=True)
+class DeferredBlock:
+    """One deferred slot: its source, how to render the result, and its limits.
+
+    ``timeout`` (seconds) overrides the ``resolve_deferred`` default;
+    ``fallback`` overrides :data:`DEFAULT_FALLBACK`.
+    """
+
+    source: Source
+    template: str | None = None
+    macro: str | None = None
+    param: str = "data"
+    kwargs: Mapping[str, object] = field(default_factory=dict)
+    timeout: float | None = None
+    fallback: str | None = None
+
+    def render(self, env: _RenderEnv, value: object) -> str:
+        if self.template and self.macro:
+            return render_macro(env, self.template, self.macro, {**self.kwargs, self.param: value})
+        return "" if value is None else str(value)
+
+
+async def _settle(
+    env: _RenderEnv,
+    slot_id: str,
+    block: DeferredBlock,
+    timeout: float | None,
+    fallback: str,
+) -> tuple[str, str]:
+    source = block.source
+    limit = block.timeout if block.timeout is not None else timeout
+    # Timeouts and source/render errors degrade the slot, never the page —
+    # the same contract as the slot's own {% try %}/{% fallback %}.
+    try:
+        async with asyncio.timeout(limit):
+            value = await (source() if callable(source) else source)
+        return slot_id, block.render(env, value)
+    except TimeoutError:
+        _log.warning("suspense slot %r timed out after %ss; rendering fallback", slot_id, limit)
+    except Exception:
+        _log.exception("suspense slot %r failed; rendering fallback", slot_id)
+    return slot_id, block.fallback if block.fallback is not None else fallback
+
+
+async def resolve_deferred(
+    env: _RenderEnv,
+    blocks: Mapping[str, DeferredBlock | Source],
+    *,
+    timeout: float | None = None,
+    group_id: str | None = None,
+    fallback: str = DEFAULT_FALLBACK,
+) -> AsyncIterator[str]:
+    """Yield one OOB fill per slot in completion order, then the busy-clear.
+
+    ``blocks`` maps ``suspense_slot`` ids to :class:`DeferredBlock` or bare
+    sources. ``timeout`` is the per-slot default in seconds (``None`` waits).
+    ``group_id`` is the ``suspense_group(id=...)`` to mark done at the end.
+    Closing the generator early cancels the sources still pending.
+    """
+    pending = {
+        slot_id: b if isinstance(b, DeferredBlock) else DeferredBlock(b)
+        for slot_id, b in blocks.items()
+    }
+    tasks = [
+        asyncio.create_task(_settle(env, slot_id, block, timeout, fallback))
+        for slot_id, block in pending.items()
+    ]
+    try:
+        for settled in asyncio.as_completed(tasks):
+            slot_id, html = await settled
+            yield OobResponse().fill(slot_id, html).render(env)
+    finally:
+        for task in tasks:
+            task.cancel()
+    if group_id:
+        yield render_macro(env, "chirpui/suspense.html", "suspense_group_done", {"id": group_id})
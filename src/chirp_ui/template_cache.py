@@ -0,0 +1,100 @@
+"""Persistent compile cache and warm-up for the packaged ``chirpui/*`` templates.
+
+Kida only auto-enables its on-disk bytecode cache for a ``FileSystemLoader``.
+Templates served through :func:`chirp_ui.get_loader` (a ``PackageLoader``,
+usually inside a ``ChoiceLoader``) are therefore re-lexed, parsed and compiled
+in every new process, and ``forms.html`` / ``shell_frame.html`` /
+``data_grid.html`` alone make the first request after a deploy slow.
+
+:func:`template_cache` returns a kida ``BytecodeCache`` for these templates.
+Entries are keyed by the chirp-ui version (one cache directory per release),
+the kida version and Python ABI (kida's filename tag) and the template source
+hash, so a stale entry is never loaded after an upgrade or an edit. The
+directory is ``$CHIRPUI_TEMPLATE_CACHE`` if set, else
+``$XDG_CACHE_HOME/chirp-ui/templates`` (``~/.cache`` by default).
+
+:func:`warm_templates` compiles every packaged template into an environment:
+call it at boot to fill the disk cache, or in a pre-fork server's master so the
+compiled templates are shared copy-on-write by every worker::
+
+    from kida import ChoiceLoader, Environment, FileSystemLoader
+    import chirp_ui
+
+    env = Environment(
+        loader=ChoiceLoader([FileSystemLoader("templates"), chirp_ui.get_loader()]),
+        bytecode_cache=chirp_ui.template_cache(),
+    )
+    chirp_ui.register_filters(app)  # or env.update_filters(...)
+    chirp_ui.warm_templates(env)
+
+``warm_templates()`` without an environment compiles into the preview
+environment (:func:`chirp_ui.preview_env.make_preview_env`) backed by
+:func:`template_cache`, which is enough to populate the disk cache from a
+build step (``python -c "import chirp_ui; chirp_ui.warm_templates()"``).
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from kida.bytecode_cache import BytecodeCache
+
+if TYPE_CHECKING:
+    from kida import Environment
+
+__all__ = ["CACHE_DIR_ENV", "template_cache", "template_cache_dir", "warm_templates"]
+
+#: Environment variable that overrides the cache root directory.
+CACHE_DIR_ENV = "CHIRPUI_TEMPLATE_CACHE"
+
+_TEMPLATE_SUFFIXES = (".html", ".kida")
+
+
+def template_cache_dir(directory: str | os.PathLike[str] | None = None) -> Path:
+    """Return the per-release cache directory under ``directory`` (or the default root)."""
+    from chirp_ui import __version__
+
+    if directory is not None:
+        root = Path(directory)
+    elif os.environ.get(CACHE_DIR_ENV):
+        root = Path(os.environ[CACHE_DIR_ENV])
+    else:
+        xdg = os.environ.get("XDG_CACHE_HOME")
+        root = (Path(xdg) if xdg else Path.home() / ".cache") / "chirp-ui" / "templates"
+    return root.expanduser() / f"chirpui-{__version__}"
+
+
+def template_cache(directory: str | os.PathLike[str] | None = None) -> BytecodeCache:
+    """Return a kida ``BytecodeCache`` for chirp-ui templates (see module docs)."""
+    return BytecodeCache(template_cache_dir(directory))
+
+
+def _packaged_templates() -> list[str]:
+    from chirp_ui import get_loader
+
+    return [
+        name
+        for name in get_loader().list_templates()
+        if name.startswith("chirpui/") and name.endswith(_TEMPLATE_SUFFIXES)
+    ]
+
+
+def warm_templates(env: Environment | None = None) -> int:
+    """Compile every packaged ``chirpui/*`` template into ``env``; return the count.
+
+    ``env`` must resolve ``chirpui/...`` names (``get_loader()`` in its loader
+    chain) and have the chirp-ui filters registered, since kida rejects unknown
+    filters at compile time. Templates already compiled in ``env`` are cache
+    hits; with a ``bytecode_cache`` configured, the rest load from disk or are
+    written there for the next process.
+    """
+    if env is None:
+        from chirp_ui.preview_env import make_preview_env
+
+        env = make_preview_env(bytecode_cache=template_cache())
+    names = _packaged_templates()
+    for name in names:
+        env.get_template(name)
+    return len(names)
@@ -0,0 +1,226 @@
+"""Declarative table of the filters and globals chirp-ui templates call.
+
+:func:`~chirp_ui.filters.register_filters` used to register each filter and
+global with its own decorator call and import five modules inside the function
+on every app start. :data:`TEMPLATE_REGISTRY` lists every entry once — name,
+callable, kind (``"filter"`` / ``"global"``) and whether it is *pure* — and
+:data:`FILTERS`, :data:`GLOBALS` and :data:`PURE_FILTERS` are precomputed from
+it at import. :func:`install_template_registry` installs the lot into a kida
+``Environment`` with one ``update_filters`` and one globals dict update::
+
+    from kida import ChoiceLoader, Environment, FileSystemLoader
+    import chirp_ui
+
+    env = Environment(loader=ChoiceLoader([FileSystemLoader("templates"),
+                                           chirp_ui.get_loader()]))
+    chirp_ui.install_template_registry(env)
+
+A pure filter is deterministic and reads no request or process state, so
+kida's partial evaluator may constant-fold it when every argument is a literal —
+for example ``"#0af" | contrast_text`` inside a macro body. Only ``html_attrs``,
+``sanitize_color``, ``contrast_text`` and ``value_type`` qualify: the
+validating filters (``bem``, ``validate_*``, ``icon``, ``field_errors``) read
+the strict-mode ContextVar or warn per call, ``icon`` also reads the mutable
+:data:`~chirp_ui.icons.ICON_REGISTRY`, ``resolve_color`` reads
+:func:`~chirp_ui.filters.register_colors` and ``deprecate_param`` warns on every
+use. :func:`install_template_registry` adds the pure names to
+``env.pure_filters``, and both it and :func:`~chirp_ui.filters.register_filters`
+set kida's ``_kida_pure`` marker on those functions (nothing is marked at
+import), so Chirp apps registering them through ``template_filter`` get the
+same treatment.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Literal, Protocol
+
+from chirp_ui.chart_state import project_bars, project_donut, project_metric_grid
+from chirp_ui.config_schema import Field, Widget, project_fields
+from chirp_ui.filters import (
+    bem,
+    build_hx_attrs,
+    check_required_id,
+    chirpui_asset_path,
+    contrast_text,
+    deprecate_param,
+    field_errors,
+    html_attrs,
+    icon,
+    make_route_link_attrs,
+    resolve_color,
+    resolve_status_variant,
+    sanitize_color,
+    shell_action_btn_variant,
+    validate_appearance_block,
+    validate_size,
+    validate_tone_block,
+    validate_variant,
+    validate_variant_block,
+    value_type,
+)
+from chirp_ui.form_state import field_state, form_state
+from chirp_ui.fragment_cache import fragment_cache_get, fragment_cache_put
+from chirp_ui.grid_state import (
+    column_aria_sort,
+    grid_rows,
+    grid_template_columns,
+    grid_window,
+    parse_sort,
+    record_rows,
+    row_count,
+    selection_state,
+    sort_columns,
+    sort_query,
+    url_template,
+)
+from chirp_ui.nav_index import nav_index
+from chirp_ui.nav_pill import nav_pill_inline_style, segmented_pill_inline_style
+from chirp_ui.route_tabs import tab_is_active
+from chirp_ui.series import project_series
+from chirp_ui.shortcuts import shortcuts_by_category, shortcuts_json
+from chirp_ui.text_fragment import build_text_fragment_url
+
+__all__ = [
+    "FILTERS",
+    "GLOBALS",
+    "PURE_FILTERS",
+    "TEMPLATE_REGISTRY",
+    "TemplateEntry",
+    "install_template_registry",
+    "mark_pure_filters",
+]
+
+Kind = Literal["filter", "global"]
+
+
+class _KidaEnv(Protocol):
+    globals: dict[str, Any]
+    pure_filters: set[str]
+
+    def update_filters(self, filters: dict[str, Callable[..., Any]]) -> None: ...
+
+
+@dataclass(frozen=True, slots=True)
+class TemplateEntry:
+    """One template filter or global: name, callable, kind, purity."""
+
+    name: str
+    func: Callable[..., Any]
+    kind: Kind = "filter"
+    pure: bool = False
+
+
+def _filter(name: str, func: Callable[..., Any], *, pure: bool = False) -> TemplateEntry:
+    return TemplateEntry(name, func, "filter", pure)
+
+
+def _global(name: str, func: Callable[..., Any]) -> TemplateEntry:
+    return TemplateEntry(name, func, "global")
+
+
+TEMPLATE_REGISTRY: tuple[TemplateEntry, ...] = (
+    _filter("bem", bem),
+    _filter("field_errors", field_errors),
+    _filter("html_attrs", html_attrs, pure=True),
+    _filter("icon", icon),
+    _filter("deprecate_param", deprecate_param),
+    _filter("validate_variant", validate_variant),
+    _filter("validate_variant_block", validate_variant_block),
+    _filter("validate_appearance_block", validate_appearance_block),
+    _filter("validate_tone_block", validate_tone_block),
+    _filter("validate_size", validate_size),
+    _filter("value_type", value_type, pure=True),
+    _filter("sanitize_color", sanitize_color, pure=True),
+    _filter("contrast_text", contrast_text, pure=True),
+    _filter("resolve_color", resolve_color),
+    _filter("resolve_status_variant", resolve_status_variant),
+    _filter("shell_action_btn_variant", shell_action_btn_variant),
+    _global("tab_is_active", tab_is_active),
+    _global("nav_pill_inline_style", nav_pill_inline_style),
+    _global("segmented_pill_inline_style", segmented_pill_inline_style),
+    # Compiled trie over a nav definition: one lookup gives the active
+    # item, its ancestors and pill offsets. See chirp_ui.nav_index.
+    _global("nav_index", nav_index),
+    _global("build_hx_attrs", build_hx_attrs),
+    _global("check_required_id", check_required_id),
+    _global("chirpui_asset_path", chirpui_asset_path),
+    _global("route_link_attrs", make_route_link_attrs()),
+    # Data-grid server-state projections (#200) so data_grid can render
+    # aria_sort/next_url it never derives. See chirp_ui.grid_state.
+    _global("parse_sort", parse_sort),
+    _global("sort_columns", sort_columns),
+    _global("selection_state", selection_state),
+    _global("column_aria_sort", column_aria_sort),
+    _global("sort_query", sort_query),
+    _global("grid_window", grid_window),
+    _global("grid_template_columns", grid_template_columns),
+    # Pre-encoded query template shared by sort headers, pagination
+    # url_pattern, and filter_bar/filter_row(preserve=...).
+    _global("url_template", url_template),
+    # Lazy row projection: data_grid iterates grid_rows(rows, ...) so a
+    # record_rows() source streams cells straight off the records.
+    _global("grid_rows", grid_rows),
+    _global("record_rows", record_rows),
+    _global("row_count", row_count),
+    # Config-form server-state projection. See chirp_ui.config_schema.
+    _global("project_fields", project_fields),
+    _global("config_field", Field),
+    _global("Widget", Widget),
+    # forms.html error wiring: form(errors=...) provides one FormState,
+    # each field macro reads its FieldState. See chirp_ui.form_state.
+    _global("form_state", form_state),
+    _global("field_state", field_state),
+    # Server-side fragment cache behind cached_fragment / oob_fragment /
+    # suspense_slot(cache_key=...). See chirp_ui.fragment_cache.
+    _global("fragment_cache_get", fragment_cache_get),
+    _global("fragment_cache_put", fragment_cache_put),
+    # bar_chart / donut / metric_grid(items=...) interpolate these
+    # precomputed rows. See chirp_ui.chart_state.
+    _global("project_bars", project_bars),
+    _global("project_donut", project_donut),
+    _global("project_metric_grid", project_metric_grid),
+    # ascii_sparkline downsampling + bar levels. See chirp_ui.series.
+    _global("project_series", project_series),
+    _global("shortcuts_by_category", shortcuts_by_category),
+    _global("shortcuts_json", shortcuts_json),
+    _global("build_text_fragment_url", build_text_fragment_url),
+)
+
+#: Read-only views precomputed from :data:`TEMPLATE_REGISTRY`.
+FILTERS: Mapping[str, Callable[..., Any]] = MappingProxyType(
+    {e.name: e.func for e in TEMPLATE_REGISTRY if e.kind == "filter"}
+)
+GLOBALS: Mapping[str, Callable[..., Any]] = MappingProxyType(
+    {e.name: e.func for e in TEMPLATE_REGISTRY if e.kind == "global"}
+)
+PURE_FILTERS: frozenset[str] = frozenset(
+    e.name for e in TEMPLATE_REGISTRY if e.kind == "filter" and e.pure
+)
+
+# kida.pure() wraps the function (one extra call per use); the marker alone
+# is what kida's add_filter / env.filters[...] look for.
+_KIDA_PURE = "_kida_pure"
+
+
+def mark_pure_filters() -> None:
+    """Set kida's ``_kida_pure`` marker on every pure entry (idempotent)."""
+    for entry in TEMPLATE_REGISTRY:
+        if entry.pure:
+            setattr(entry.func, _KIDA_PURE, True)
+
+
+def install_template_registry(env: _KidaEnv) -> None:
+    """Install every chirp-ui filter and global into a kida ``Environment``.
+
+    One copy-on-write ``update_filters`` call, one globals dict replacement
+    and one ``pure_filters`` union (skipped on kida builds without partial
+    evaluation), so compiled templates see the whole table at once.
+    """
+    mark_pure_filters()
+    env.update_filters(dict(FILTERS))
+    env.globals = {**env.globals, **GLOBALS}
+    if hasattr(env, "pure_filters"):
+        env.pure_filters = env.pure_filters | PURE_FILTERS
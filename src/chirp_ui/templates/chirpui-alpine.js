@@ -924,10 +924,14 @@
             query: "",
             activeId: "",
             multiple: false,
+            remote: false,
             selected: [],
             _suppressOpen: false,
             init: function () {
                 this.multiple = this.$root.dataset.multiple === "true";
+                // search_url mode: the server returns already-ranked options,
+                // so the query never filters them client-side.
+                this.remote = this.$root.dataset.remote === "true";
                 this.query = this.$refs.input.value || "";
             },
             _options: function () {
@@ -954,7 +958,7 @@
                         return false;
                     }
                     var label = (o.dataset.label || "").toLowerCase();
-                    return !q || label.indexOf(q) !== -1;
+                    return self.remote || !q || label.indexOf(q) !== -1;
                 });
             },
             _enabledVisible: function () {
@@ -969,7 +973,7 @@
                     return false;
                 }
                 var q = this.query.trim().toLowerCase();
-                return !q || (label || "").toLowerCase().indexOf(q) !== -1;
+                return this.remote || !q || (label || "").toLowerCase().indexOf(q) !== -1;
             },
             visibleCount: function () {
                 return this._visible().length;
@@ -2761,6 +2765,72 @@
         };
     });
 
+    // ARIA-grid window (#261). The data_grid viewport renders one server-side
+    // window of fixed-height rows between two aria-hidden spacers. On scroll
+    // (throttled in the template) we compute the visible row range and — only
+    // when it leaves the rendered [start, stop) window — write the pixel
+    // offset into the hidden input and fire `chirpui:grid-window`, the
+    // viewport's hx-trigger. hx-sync="this:replace" drops superseded fetches,
+    // so a fast fling costs one request for where the user landed.
+    register("chirpuiGridWindow", function () {
+        return {
+            rowHeight: 36,
+            start: 0,
+            stop: 0,
+            total: 0,
+            init: function () {
+                this.rowHeight = parseInteger(this.$root.dataset.rowHeight, 36) || 36;
+                var grid = this.$root.querySelector("[role='grid']");
+                this.total = grid ? Math.max(0, parseInteger(grid.getAttribute("aria-rowcount"), 1) - 1) : 0;
+                this.readWindow();
+                var self = this;
+                this._onAfterSettle = function (event) {
+                    var target = event && event.detail ? event.detail.target : null;
+                    if (target && self.$root.contains(target)) {
+                        self.readWindow();
+                    }
+                };
+                document.body.addEventListener("htmx:afterSettle", this._onAfterSettle);
+            },
+            destroy: function () {
+                if (this._onAfterSettle) {
+                    document.body.removeEventListener("htmx:afterSettle", this._onAfterSettle);
+                    this._onAfterSettle = null;
+                }
+            },
+            // Re-read the rendered window from the top spacer's data attributes
+            // (set by data_grid_window) after the initial render and each swap.
+            readWindow: function () {
+                var spacer = this.$root.querySelector("[data-window-start]");
+                this.start = spacer ? parseInteger(spacer.dataset.windowStart, 0) : 0;
+                this.stop = spacer ? parseInteger(spacer.dataset.windowStop, this.total) : this.total;
+            },
+            // The header rowgroup sits above the rows in the scroll content, so
+            // the posted offset is measured from the first data row. A sticky
+            // header also covers the top of the viewport, hiding that many
+            // pixels of rows at the bottom of the visible range.
+            onScroll: function () {
+                var head = this.$root.querySelector(".chirpui-data-grid__head");
+                var header = head ? head.offsetHeight : 0;
+                var sticky = !!head && head.classList.contains("chirpui-data-grid__head--sticky");
+                var scrollTop = Math.max(0, this.$root.scrollTop);
+                var top = sticky ? scrollTop : Math.max(0, scrollTop - header);
+                var bottom = scrollTop + this.$root.clientHeight - header;
+                var first = Math.floor(top / this.rowHeight);
+                var last = Math.ceil(Math.max(0, bottom) / this.rowHeight);
+                var above = first < this.start;
+                var below = last > this.stop && this.stop < this.total;
+                if (!above && !below) {
+                    return;
+                }
+                if (this.$refs.offset) {
+                    this.$refs.offset.value = String(Math.round(top));
+                }
+                this.$root.dispatchEvent(new CustomEvent("chirpui:grid-window"));
+            },
+        };
+    });
+
     register("chirpuiToast", function (config) {
         config = config || {};
         var dismissMs = parseInteger(config.duration, 0);
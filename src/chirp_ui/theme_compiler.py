@@ -0,0 +1,302 @@
+"""Compile token-only theme packs into flattened per-mode token sheets.
+
+A theme pack (``themes/<name>.css``) is layered over the full token set that
+``chirpui.css`` already declares, so the browser cascades two token sets per
+mode and walks ``var()`` indirections such as ``--chirpui-error:
+var(--chirpui-danger)`` at runtime. :func:`compile_theme_pack` resolves both
+sheets for one mode ahead of time and emits only what the pack changes:
+
+* a token whose resolved value equals the base value for that mode is dropped;
+* ``var(--chirpui-*)`` references to tokens the pack sets to a static value are
+  replaced by that value (chains are followed; fallbacks and ``var()`` to
+  tokens the pack leaves alone stay as written);
+* every token must be in :data:`~chirp_ui.tokens.TOKEN_CATALOG`.
+
+Compiled sheets keep the pack's selectors, so ``data-theme`` still decides
+which tokens apply: the pack's unconditional tokens stay on ``:root``, each
+mode's deltas go under ``[data-theme="light"]`` / ``[data-theme="dark"]``, and
+``system`` deltas under ``:root[data-theme="system"]`` inside the matching
+``prefers-color-scheme`` query. A ``data-theme`` the pack does not style (such
+as ``oled``) gets only the ``:root`` tokens, as with the source pack. The
+``system`` sheet carries every mode and replaces the pack; the ``light`` and
+``dark`` sheets carry ``:root`` plus that one mode, for apps that pin it. The
+compiled files live at
+``themes/compiled/<name>.<mode>.css`` (see :meth:`ThemePack.compiled_path
+<chirp_ui.theme_packs.ThemePack.compiled_path>`) and are regenerated by
+``scripts/build_theme_packs.py``.
+
+Usage::
+
+    from chirp_ui.theme_compiler import compile_theme_pack
+    from chirp_ui.theme_packs import get_theme_pack
+
+    css = compile_theme_pack(get_theme_pack("ember"), "dark")
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator, Mapping
+from functools import lru_cache
+from pathlib import Path
+
+from chirp_ui._css_tree import CssNode, parse_css, split_top, strip_comments
+from chirp_ui.critical_css import CHIRPUI_CSS
+from chirp_ui.theme_packs import THEME_PACKS, ThemePack
+from chirp_ui.tokens import TOKEN_CATALOG
+
+__all__ = ["COMPILED_MODES", "compile_theme_pack", "compiled_theme_packs", "resolve_tokens"]
+
+COMPILED_MODES: tuple[str, ...] = ("light", "dark", "system")
+STATIC_ROOT = CHIRPUI_CSS.parent
+
+_SCHEME_MEDIA_RE = re.compile(r"^@media\s*\(\s*prefers-color-scheme\s*:\s*(light|dark)\s*\)$")
+_NOT_THEME_RE = re.compile(r"""^:root:not\(\[data-theme=["']?(\w+)["']?\]\)$""")
+_THEME_ATTR_RE = re.compile(r"""^(?::root)?\[data-theme=["']?(\w+)["']?\]$""")
+_VAR_RE = re.compile(r"var\(\s*(--chirpui-[a-z0-9-]+)\s*\)")
+_LIGHT_DARK_RE = re.compile(r"^light-dark\((.*)\)$")
+
+
+def _selector_applies(selector: str, mode: str) -> bool:
+    """Whether ``selector`` targets the root element when ``data-theme=mode``.
+
+    An empty ``mode`` asks for the unconditional root selectors only.
+    """
+    selector = selector.strip()
+    if selector in (":root", "html"):
+        return True
+    if not mode:
+        return False
+    if m := _THEME_ATTR_RE.match(selector):
+        return m.group(1) == mode
+    if m := _NOT_THEME_RE.match(selector):
+        return m.group(1) != mode
+    return False
+
+
+def _declarations(body: str) -> Iterator[tuple[str, str]]:
+    for decl in split_top(body, ";"):
+        name, sep, value = decl.partition(":")
+        if sep and name.strip().startswith("--chirpui-"):
+            yield name.strip(), " ".join(value.split())
+
+
+def _scheme_value(value: str, scheme: str) -> str:
+    """Pick the ``light-dark()`` branch for ``scheme`` (other values unchanged)."""
+    if scheme not in ("light", "dark"):
+        return value
+    if m := _LIGHT_DARK_RE.match(value):
+        branches = split_top(m.group(1))
+        if len(branches) == 2:
+            return branches[0 if scheme == "light" else 1].strip()
+    return value
+
+
+def _collect(nodes: tuple[CssNode, ...], mode: str, scheme: str, out: dict[str, str]) -> None:
+    for node in nodes:
+        if node.children is not None:
+            media = _SCHEME_MEDIA_RE.match(node.prelude)
+            if node.prelude.startswith(("@layer", "@supports")) or (
+                media and media.group(1) == scheme
+            ):
+                _collect(node.children, mode, scheme, out)
+            continue
+        if node.body is None or node.prelude.startswith("@"):
+            continue
+        if any(_selector_applies(s, mode) for s in split_top(node.prelude)):
+            # light-dark() follows color-scheme, which data-theme="light" /
+            # "dark" pin regardless of the OS scheme.
+            color_scheme = mode if mode in ("light", "dark") else scheme
+            for name, value in _declarations(node.body):
+                out[name] = _scheme_value(value, color_scheme)
+
+
+def resolve_tokens(css: str, mode: str, scheme: str | None = None) -> dict[str, str]:
+    """Return the ``--chirpui-*`` values ``css`` sets on the root element.
+
+    ``mode`` is the ``data-theme`` value; ``scheme`` the active
+    ``prefers-color-scheme`` (defaults to ``mode`` for ``light``/``dark``).
+    ``mode=""`` with ``scheme=""`` returns only the unconditional ``:root``
+    declarations (no ``data-theme`` selector, no scheme query).
+    Later declarations win, matching source order within one layer;
+    ``@supports`` blocks are assumed to apply.
+    """
+    if scheme is None:
+        if mode not in ("light", "dark"):
+            raise ValueError(f"resolve_tokens(mode={mode!r}) needs scheme='light' or 'dark'")
+        scheme = mode
+    out: dict[str, str] = {}
+    _collect(parse_css(strip_comments(css)), mode, scheme, out)
+    return out
+
+
+@lru_cache(maxsize=16)
+def _base_tokens(css: str, mode: str, scheme: str) -> Mapping[str, str]:
+    return resolve_tokens(css, mode, scheme)
+
+
+def _collapse(value: str, tokens: Mapping[str, str], seen: frozenset[str] = frozenset()) -> str:
+    """Inline ``var(--x)`` where ``--x`` resolves to a ``var()``-free value."""
+
+    def sub(m: re.Match[str]) -> str:
+        name = m.group(1)
+        if name in seen or name not in tokens:
+            return m.group(0)
+        resolved = _collapse(tokens[name], tokens, seen | {name})
+        return m.group(0) if "var(" in resolved else resolved
+
+    return _VAR_RE.sub(sub, value)
+
+
+def _check_catalog(tokens: Mapping[str, str]) -> None:
+    unknown = sorted(set(tokens) - TOKEN_CATALOG.keys())
+    if unknown:
+        raise ValueError(f"theme pack sets tokens missing from TOKEN_CATALOG: {', '.join(unknown)}")
+
+
+def _flat(tokens: Mapping[str, str]) -> dict[str, str]:
+    return {name: _collapse(value, tokens) for name, value in tokens.items()}
+
+
+# (mode, data-theme, scheme, wrapping query, selector) — the pack blocks a
+# compiled sheet mirrors, in output order.
+_MODE_BLOCKS: tuple[tuple[str, str, str, str | None, str], ...] = (
+    ("light", "light", "light", None, '[data-theme="light"]'),
+    ("dark", "dark", "dark", None, '[data-theme="dark"]'),
+    (
+        "system",
+        "system",
+        "light",
+        "@media (prefers-color-scheme: light)",
+        ':root[data-theme="system"]',
+    ),
+    (
+        "system",
+        "system",
+        "dark",
+        "@media (prefers-color-scheme: dark)",
+        ':root[data-theme="system"]',
+    ),
+)
+
+
+def _compiled_blocks(
+    pack_css: str, base_css: str, modes: tuple[str, ...]
+) -> list[tuple[str | None, str, dict[str, str]]]:
+    """Return ``(query, selector, tokens)`` blocks for ``modes``, deltas only."""
+    root_pack = resolve_tokens(pack_css, "", "")
+    _check_catalog(root_pack)
+    root_flat = _flat(root_pack)
+    blocks = [
+        (theme, scheme, query, selector)
+        for mode, theme, scheme, query, selector in _MODE_BLOCKS
+        if mode in modes
+    ]
+    bases = {
+        (theme, scheme): _base_tokens(base_css, theme, scheme)
+        for theme, scheme in (
+            ("light", "light"),
+            ("dark", "dark"),
+            ("system", "light"),
+            ("system", "dark"),
+        )
+    }
+    # A :root token can be dropped only if every mode's base already has it.
+    root = {
+        name: value
+        for name, value in root_flat.items()
+        if any(base.get(name) not in (root_pack[name], value) for base in bases.values())
+    }
+    per_block: list[dict[str, str]] = []
+    for theme, scheme, _query, _selector in blocks:
+        pack = resolve_tokens(pack_css, theme, scheme)
+        _check_catalog(pack)
+        base = bases[theme, scheme]
+        flat = _flat(pack)
+        per_block.append(
+            {
+                name: value
+                for name, value in flat.items()
+                if root.get(name, base.get(name)) not in (pack[name], value)
+            }
+        )
+    # [data-theme="light"|"dark"] also match nested regions: a token one of
+    # them overrides is set in both, so a nested region never inherits the
+    # other mode's value. The system blocks only ever match :root.
+    varying: set[str] = set()
+    for (theme, *_), tokens in zip(blocks, per_block, strict=True):
+        if theme != "system":
+            varying |= tokens.keys()
+    out: list[tuple[str | None, str, dict[str, str]]] = [(None, ":root", root)]
+    for (theme, scheme, query, selector), tokens in zip(blocks, per_block, strict=True):
+        flat = _flat(resolve_tokens(pack_css, theme, scheme))
+        if theme != "system":
+            tokens.update({name: flat[name] for name in varying if name in flat})
+        ordered = {name: tokens[name] for name in flat if name in tokens}
+        out.append((query, selector, ordered))
+    return out
+
+
+def _block(selector: str, decls: Mapping[str, str], indent: str) -> list[str]:
+    lines = [f"{indent}{selector} {{"]
+    lines += [f"{indent}    {name}: {value};" for name, value in decls.items()]
+    return [*lines, f"{indent}}}"]
+
+
+def compile_theme_pack(
+    pack: ThemePack,
+    mode: str,
+    *,
+    pack_css: str | None = None,
+    base_css: str | None = None,
+) -> str:
+    """Return the flattened token sheet for ``pack`` in ``mode``.
+
+    ``pack_css`` defaults to the shipped ``pack.path`` source and ``base_css``
+    to the shipped ``chirpui.css``; the output is deterministic for a given
+    pair. ``system`` covers every mode in ``pack.modes``; ``light`` / ``dark``
+    cover ``:root`` plus that mode.
+    """
+    if mode not in COMPILED_MODES or mode not in pack.modes:
+        raise ValueError(f"theme pack {pack.name!r} has no {mode!r} mode")
+    if pack_css is None:
+        pack_css = (STATIC_ROOT / pack.path).read_text(encoding="utf-8")
+    if base_css is None:
+        base_css = CHIRPUI_CSS.read_text(encoding="utf-8")
+
+    lines = [
+        f"/* chirp-ui {pack.label} theme pack — compiled {mode} tokens.",
+        " *",
+        f" * GENERATED from {pack.path} by scripts/build_theme_packs.py; do not hand-edit.",
+        " * Load after /static/chirpui.css instead of the source pack.",
+        " */",
+        "",
+        "@layer app.theme {",
+    ]
+    modes = tuple(m for m in COMPILED_MODES if m in pack.modes) if mode == "system" else (mode,)
+    first = True
+    for query, selector, tokens in _compiled_blocks(pack_css, base_css, modes):
+        if not tokens:
+            continue
+        if not first:
+            lines.append("")
+        first = False
+        if query is None:
+            lines += _block(selector, tokens, "    ")
+        else:
+            lines += [f"    {query} {{", *_block(selector, tokens, "        "), "    }"]
+    return "\n".join([*lines, "}", ""])
+
+
+def compiled_theme_packs(
+    packs: tuple[ThemePack, ...] | None = None, *, base_css: str | None = None
+) -> dict[Path, str]:
+    """Return ``{output path: compiled css}`` for every pack and mode."""
+    if base_css is None:
+        base_css = CHIRPUI_CSS.read_text(encoding="utf-8")
+    return {
+        STATIC_ROOT / pack.compiled_path(mode): compile_theme_pack(pack, mode, base_css=base_css)
+        for pack in (THEME_PACKS if packs is None else packs)
+        for mode in pack.modes
+        if mode in COMPILED_MODES
+    }
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
+from pathlib import Path
 
 __all__ = ["THEME_PACKS", "ThemePack", "get_theme_pack", "list_theme_packs"]
 
+_STATIC_ROOT = Path(__file__).parent / "templates"
+
 
 @dataclass(frozen=True, slots=True)
 class ThemePack(Mapping[str, object]):
@@ -30,6 +33,19 @@ class ThemePack(Mapping[str, object]):
             "maturity": self.maturity,
         }
 
+    def compiled_path(self, mode: str = "system") -> str:
+        """Static-root-relative path of the pre-resolved token sheet for ``mode``.
+
+        Built by ``scripts/build_theme_packs.py`` (see :mod:`chirp_ui.theme_compiler`).
+        """
+        if mode not in self.modes:
+            raise ValueError(f"theme pack {self.name!r} has no {mode!r} mode")
+        return f"themes/compiled/{self.name}.{mode}.css"
+
+    def compiled_size(self, mode: str = "system") -> int:
+        """Byte size of the shipped compiled sheet for ``mode``."""
+        return (_STATIC_ROOT / self.compiled_path(mode)).stat().st_size
+
     def __getitem__(self, key: str) -> object:
         return self.as_mapping()[key]
 
@@ -19,11 +19,20 @@ Categories
 * **component** — per-component override knobs (scoped)
 """
 
+import hashlib
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
-__all__ = ["TOKEN_CATALOG", "TokenDef", "extract_css_tokens"]
+__all__ = [
+    "TOKEN_CATALOG",
+    "TokenDef",
+    "TokenIndex",
+    "TokenSite",
+    "extract_css_tokens",
+    "token_index",
+]
 
 
 @dataclass(frozen=True, slots=True)
@@ -515,12 +524,168 @@ TOKEN_CATALOG: dict[str, TokenDef] = {
     name: TokenDef(name, cat, scope) for name, cat, scope in _TOKEN_DATA
 }
 
-_PROP_RE = re.compile(r"^\s*(--chirpui-[a-z0-9-]+)\s*:", re.MULTILINE)
+_PROP_RE = re.compile(r"^\s*(--chirpui-[a-z0-9-]+)\s*:")
+_VAR_USE_RE = re.compile(r"var\(\s*(--chirpui-[a-z0-9-]+)")
+_PARTIAL_MARK_RE = re.compile(r"/\* === (partials/[^ ]+) === \*/")
+_BLOCK_CLASS_RE = re.compile(r"\.chirpui-([a-z0-9]+(?:-[a-z0-9]+)*)")
+_MASK_RE = re.compile(r"/\*.*?\*/|\"[^\"\n]*\"|'[^'\n]*'", re.DOTALL)
+_STRUCTURE_RE = re.compile(r"[{};]")
+
+_CHIRPUI_CSS = Path(__file__).parent / "templates" / "chirpui.css"
+
+
+@dataclass(frozen=True, slots=True)
+class TokenSite:
+    """One place a token appears in the stylesheet.
+
+    ``line`` is 1-based in the indexed file; ``partial`` is the source partial
+    (``"partials/045_card.css"``) when the file carries build markers;
+    ``selector`` is the innermost style rule and ``scope`` the enclosing
+    ``@scope`` prelude, if any. For usages, ``declared`` is the property whose
+    value holds the ``var()``. ``own_line`` marks declarations that start their
+    own line — the catalog convention; one-line modifier rules such as
+    ``.chirpui-donut--sm { --chirpui-donut-size: 2.5rem; }`` set private knobs.
+    """
+
+    token: str
+    line: int
+    partial: str | None
+    selector: str
+    scope: str | None = None
+    declared: str | None = None
+    own_line: bool = True
+
+
+@dataclass(frozen=True, slots=True)
+class TokenIndex:
+    """Declarations and ``var()`` usages of every ``--chirpui-*`` token.
+
+    Built by :func:`token_index` and cached per CSS content hash. Lookups are
+    dictionary reads, so subset/pruning stages and theme tooling can ask
+    "who consumes this token" without rescanning the 700 KB stylesheet.
+    """
+
+    digest: str
+    declarations: dict[str, tuple[TokenSite, ...]]
+    usages: dict[str, tuple[TokenSite, ...]]
+
+    def declared(self) -> frozenset[str]:
+        """Every token with at least one declaration."""
+        return frozenset(self.declarations)
+
+    def dependent_tokens(self, token: str) -> frozenset[str]:
+        """Tokens whose declared value references ``token``, transitively."""
+        seen: set[str] = set()
+        stack = [token]
+        while stack:
+            for site in self.usages.get(stack.pop(), ()):
+                name = site.declared
+                if name and name.startswith("--chirpui-") and name not in seen | {token}:
+                    seen.add(name)
+                    stack.append(name)
+        return frozenset(seen)
+
+    def _sites(self, token: str, transitive: bool) -> Iterator[TokenSite]:
+        names = {token, *self.dependent_tokens(token)} if transitive else {token}
+        for name in names:
+            yield from self.usages.get(name, ())
+
+    def partials_using(self, token: str, *, transitive: bool = False) -> tuple[str, ...]:
+        """Sorted partials whose rules read ``token`` (optionally via other tokens)."""
+        return tuple(sorted({s.partial for s in self._sites(token, transitive) if s.partial}))
+
+    def blocks_using(self, token: str, *, transitive: bool = False) -> tuple[str, ...]:
+        """Sorted component blocks (``card``, ``btn``…) whose selectors read ``token``."""
+        blocks: set[str] = set()
+        for site in self._sites(token, transitive):
+            for cls in _BLOCK_CLASS_RE.findall(f"{site.scope or ''} {site.selector}"):
+                blocks.add(cls.split("__", 1)[0].split("--", 1)[0])
+        return tuple(sorted(blocks))
+
+    def tokens_used_by(self, partial: str) -> frozenset[str]:
+        """Tokens read anywhere in ``partial``."""
+        return frozenset(
+            name for name, sites in self.usages.items() if any(s.partial == partial for s in sites)
+        )
+
+
+def _mask(match: re.Match[str]) -> str:
+    text = match.group(0)
+    if text.startswith("/*"):
+        return re.sub(r"[^\n]", " ", text)
+    return text[0] + " " * (len(text) - 2) + text[-1]
+
+
+def _build_index(css: str, digest: str) -> TokenIndex:
+    marks = [(m.start(), m.group(1)) for m in _PARTIAL_MARK_RE.finditer(css)]
+    masked = _MASK_RE.sub(_mask, css)
+    declarations: dict[str, list[TokenSite]] = {}
+    usages: dict[str, list[TokenSite]] = {}
+    preludes: list[str] = []
+    mark_idx, partial = 0, None
+    line, line_pos, start = 1, 0, 0
+
+    for m in _STRUCTURE_RE.finditer(masked):
+        segment = masked[start : m.start()]
+        lead = len(segment) - len(segment.lstrip())
+        seg_at = start + lead
+        while mark_idx < len(marks) and marks[mark_idx][0] < seg_at:
+            partial = marks[mark_idx][1]
+            mark_idx += 1
+        line += masked.count("\n", line_pos, seg_at)
+        line_pos = seg_at
+        if m.group(0) == "{":
+            preludes.append(" ".join(segment.split()))
+        else:
+            selector = next((p for p in reversed(preludes) if not p.startswith("@")), "")
+            scope = next((p for p in reversed(preludes) if p.startswith("@scope")), None)
+            prop = _PROP_RE.match(segment)
+            declared = prop.group(1) if prop else segment.partition(":")[0].strip() or None
+            if prop:
+                own_line = not masked[masked.rfind("\n", 0, seg_at) + 1 : seg_at].strip()
+                site = TokenSite(prop.group(1), line, partial, selector, scope, own_line=own_line)
+                declarations.setdefault(prop.group(1), []).append(site)
+            for use in _VAR_USE_RE.finditer(segment):
+                use_line = line + segment.count("\n", lead, use.start())
+                site = TokenSite(use.group(1), use_line, partial, selector, scope, declared)
+                usages.setdefault(use.group(1), []).append(site)
+            if m.group(0) == "}" and preludes:
+                preludes.pop()
+        start = m.end()
+
+    return TokenIndex(
+        digest,
+        {k: tuple(v) for k, v in declarations.items()},
+        {k: tuple(v) for k, v in usages.items()},
+    )
+
+
+_INDEX_BY_DIGEST: dict[str, TokenIndex] = {}
+_DIGEST_BY_STAT: dict[Path, tuple[tuple[int, int], str]] = {}
+
+
+def token_index(css_path: Path | None = None) -> TokenIndex:
+    """Return the :class:`TokenIndex` for ``css_path`` (default: shipped chirpui.css).
+
+    Indexes are cached by SHA-256 of the file contents; an unchanged file
+    (same size and mtime) is not even re-read.
+    """
+    path = (css_path or _CHIRPUI_CSS).resolve()
+    stat = path.stat()
+    stat_key = (stat.st_mtime_ns, stat.st_size)
+    cached = _DIGEST_BY_STAT.get(path)
+    if cached is not None and cached[0] == stat_key and cached[1] in _INDEX_BY_DIGEST:
+        return _INDEX_BY_DIGEST[cached[1]]
+    data = path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    index = _INDEX_BY_DIGEST.get(digest)
+    if index is None:
+        index = _INDEX_BY_DIGEST[digest] = _build_index(data.decode("utf-8"), digest)
+    _DIGEST_BY_STAT[path] = (stat_key, digest)
+    return index
 
 
 def extract_css_tokens(css_path: Path | None = None) -> set[str]:
-    """Parse chirpui.css and return the set of declared --chirpui-* property names."""
-    if css_path is None:
-        css_path = Path(__file__).parent / "templates" / "chirpui.css"
-    css = css_path.read_text(encoding="utf-8")
-    return {m.group(1) for m in _PROP_RE.finditer(css)}
+    """Return the --chirpui-* property names declared on their own line in chirpui.css."""
+    index = token_index(css_path)
+    return {name for name, sites in index.declarations.items() if any(s.own_line for s in sites)}
@@ -0,0 +1,188 @@
+"""Lazy-loading projection for ``tree_view``, ``nav_tree`` and ``file_tree``.
+
+Modeled on :mod:`chirp_ui.grid_state`: stdlib + dataclasses only, no ``import
+chirp`` and no ``import kida``.
+
+The tree macros render the whole nested ``children`` structure up front, so a
+40k-node file explorer is a multi-megabyte page. With ``lazy_url=`` they render
+a collapsed branch as an empty ``<details>`` whose placeholder fetches the
+branch's children (``lazy_url?node=<id>``) the first time it is opened; only
+branches whose id is in ``expanded`` (and, for ``nav_tree``, ``open``/``active``
+items) are rendered inline.
+
+:class:`TreeIndex` is the server half: it flattens a nested tree once into an
+id-addressable map and serves :class:`TreePage` slices of any branch, pruned to
+``depth`` levels (deeper branches keep ``has_children=True`` and an empty
+``children`` list, so the macros render them as lazy placeholders)::
+
+    from chirp_ui import TreeIndex
+
+    FILES = TreeIndex(load_file_tree())          # once, at startup / on change
+
+    # Page: roots plus the path to the current file, everything else lazy.
+    expanded = FILES.expanded_path(req.query.get("file"))
+    page = FILES.page(depth=1, expanded=expanded)
+    {{ tree_view(page.items, lazy_url="/files/tree", expanded=expanded) }}
+
+    # /files/tree?node=<id>: one branch, one level.
+    page = FILES.page(req.query["node"])
+    {{ tree_view(page.items, lazy_url="/files/tree") }}
+
+Nodes are mappings with ``id`` (configurable) and ``children``; ``nav_tree``
+items without an ``id`` can be indexed by ``id_key="href"``. Lookups accept an
+id or its ``str()`` form, so the string ``?node=42`` finds the node whose id is
+the int ``42``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+__all__ = ["TreeIndex", "TreePage"]
+
+
+@dataclass(frozen=True, slots=True)
+class TreePage:
+    """Direct children of ``parent`` (``None`` for the roots), pruned for rendering.
+
+    ``items`` are shallow copies of the source nodes; ``total`` counts every
+    child of ``parent`` so ``has_more`` / ``next_offset`` can drive a
+    "load more" request when ``limit`` was set.
+    """
+
+    parent: object
+    items: tuple[Mapping[str, Any], ...]
+    depth: int
+    offset: int
+    total: int
+
+    @property
+    def has_more(self) -> bool:
+        return self.offset + len(self.items) < self.total
+
+    @property
+    def next_offset(self) -> int | None:
+        return self.offset + len(self.items) if self.has_more else None
+
+
+class TreeIndex:
+    """A nested tree flattened into ``{id: node}`` with parent links and depths."""
+
+    __slots__ = (
+        "_children",
+        "_depth",
+        "_nodes",
+        "_parent",
+        "_str_ids",
+        "children_key",
+        "id_key",
+        "roots",
+    )
+
+    def __init__(
+        self,
+        nodes: Iterable[Mapping[str, Any]],
+        *,
+        id_key: str = "id",
+        children_key: str = "children",
+    ) -> None:
+        self.id_key = id_key
+        self.children_key = children_key
+        self.roots: tuple[Mapping[str, Any], ...] = tuple(nodes)
+        self._nodes: dict[object, Mapping[str, Any]] = {}
+        self._parent: dict[object, object] = {}
+        self._depth: dict[object, int] = {}
+        self._children: dict[object, Sequence[Mapping[str, Any]]] = {None: self.roots}
+        self._str_ids: dict[str, object] = {}
+        stack: list[tuple[Mapping[str, Any], object, int]] = [
+            (node, None, 0) for node in reversed(self.roots)
+        ]
+        while stack:
+            node, parent, depth = stack.pop()
+            key = node.get(id_key)
+            children = node.get(children_key) or ()
+            if key is not None:
+                self._nodes[key] = node
+                self._parent[key] = parent
+                self._depth[key] = depth
+                self._children[key] = children
+                self._str_ids.setdefault(str(key), key)
+            stack.extend((child, key, depth + 1) for child in reversed(children))
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def _key(self, node_id: object) -> object:
+        """The indexed id for ``node_id`` or its string form (query params)."""
+        if node_id is None or node_id in self._nodes:
+            return node_id
+        return self._str_ids.get(str(node_id), node_id)
+
+    def __contains__(self, node_id: object) -> bool:
+        return self._key(node_id) in self._nodes
+
+    def node(self, node_id: object) -> Mapping[str, Any] | None:
+        return self._nodes.get(self._key(node_id))
+
+    def depth_of(self, node_id: object) -> int | None:
+        """0 for roots; ``None`` for unknown ids."""
+        return self._depth.get(self._key(node_id))
+
+    def ancestors(self, node_id: object) -> tuple[object, ...]:
+        """Ids from the root down to the parent of ``node_id``."""
+        out: list[object] = []
+        parent = self._parent.get(self._key(node_id))
+        while parent is not None:
+            out.append(parent)
+            parent = self._parent.get(parent)
+        return tuple(reversed(out))
+
+    def expanded_path(self, node_id: object) -> frozenset[object]:
+        """The ``expanded`` set that reveals ``node_id``: its ancestors and itself."""
+        node_id = self._key(node_id)
+        if node_id not in self._nodes:
+            return frozenset()
+        return frozenset((*self.ancestors(node_id), node_id))
+
+    def _prune(
+        self, node: Mapping[str, Any], levels: int, expanded: Collection[object]
+    ) -> Mapping[str, Any]:
+        children = node.get(self.children_key) or ()
+        if not children:
+            return dict(node)
+        if levels <= 1 and node.get(self.id_key) not in expanded:
+            return {**node, self.children_key: [], "has_children": True}
+        pruned = [self._prune(child, levels - 1, expanded) for child in children]
+        return {**node, self.children_key: pruned, "has_children": True}
+
+    def page(
+        self,
+        node_id: object = None,
+        *,
+        depth: int = 1,
+        offset: int = 0,
+        limit: int | None = None,
+        expanded: Collection[object] = (),
+    ) -> TreePage:
+        """Children of ``node_id`` (roots when ``None``), ``depth`` levels deep.
+
+        Branches at the depth limit are cut to ``children=[]`` plus
+        ``has_children=True`` unless their id is in ``expanded``, whose
+        children are then included (recursively, with the same rule). Unknown
+        ids give an empty page.
+        """
+        node_id = self._key(node_id)
+        expanded = {self._key(e) for e in expanded}
+        children = self._children.get(node_id, ())
+        start = max(offset, 0)
+        window = children[start:] if limit is None else children[start : start + max(limit, 0)]
+        levels = max(depth, 1)
+        return TreePage(
+            parent=node_id,
+            items=tuple(self._prune(child, levels, expanded) for child in window),
+            depth=levels,
+            offset=start,
+            total=len(children),
+        )
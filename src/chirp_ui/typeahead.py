@@ -0,0 +1,238 @@
+"""Server-side typeahead index for ``combobox`` and ``command_palette``.
+
+``combobox`` ships every option to the client and filters in Alpine, and
+``command_palette`` leaves its ``search_url`` endpoint to the app; neither
+scales past a few hundred options. :class:`TypeaheadIndex` is built once from
+an option list (dicts or objects with ``label``/``value``, plus optional
+``keywords``) and answers a query with the ranked top *k*:
+
+* **Prefix trie.** Every word of the label (and keywords) is inserted into a
+  character trie; each query word narrows the candidates to options with a
+  word starting with it, so ``"uni st"`` finds ``"United States"``.
+* **Trigram fallback.** When prefix matching yields fewer than *k* hits, options
+  sharing enough character trigrams with the query fill the rest, so typos
+  (``"untied"``) still match.
+* **Ranking.** Exact label > label prefix > word prefixes > trigram similarity,
+  shorter labels and source order breaking ties; only a *k*-sized heap is kept
+  (:func:`heapq.nsmallest`), never a full sort of the candidates.
+
+Stdlib only, no ``import chirp``; the markup half is :func:`typeahead_fragment`,
+which renders ``combobox_options`` / ``command_palette_results`` for a query
+through any kida environment with chirp-ui registered.
+
+Example (Chirp routes)::
+
+    from chirp_ui import TypeaheadIndex, typeahead_fragment
+
+    COUNTRIES = TypeaheadIndex(country_options)
+
+    @app.get("/countries/search")
+    def search(req):
+        return typeahead_fragment(env, COUNTRIES, req.query.get("q", ""),
+                                  id="chirpui-combobox-country")
+
+    {{ combobox(name="country", options=[], search_url="/countries/search") }}
+"""
+
+from __future__ import annotations
+
+import heapq
+import unicodedata
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from chirp_ui.render_stream import render_macro
+
+__all__ = ["DEFAULT_LIMIT", "TypeaheadHit", "TypeaheadIndex", "typeahead_fragment"]
+
+#: Default number of results returned by :meth:`TypeaheadIndex.search`.
+DEFAULT_LIMIT = 10
+
+# Minimum share of the query's trigrams an option must contain to match fuzzily.
+_MIN_SIMILARITY = 0.34
+
+# Rank tiers (higher is better); trigram similarity stays below _WORDS.
+_EXACT, _PREFIX, _WORDS = 3.0, 2.0, 1.0
+
+
+def _get(item: object, key: str, default: Any = None) -> Any:
+    if isinstance(item, Mapping):
+        return item.get(key, default)
+    return getattr(item, key, default)
+
+
+def _fold(text: str) -> str:
+    """Casefold and strip accents, so ``"Émile"`` matches ``"emile"``."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
+
+
+def _words(text: str) -> list[str]:
+    return "".join(ch if ch.isalnum() else " " for ch in text).split()
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass(frozen=True, slots=True)
+class TypeaheadHit:
+    """One ranked result. ``item`` is the source option (dict or object).
+
+    :meth:`get` reads ``label``/``value`` from the hit and anything else from
+    ``item``, so hits drop into macros written for option dicts.
+    """
+
+    label: str
+    value: str
+    score: float
+    item: object
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key == "label":
+            return self.label
+        if key == "value":
+            return self.value
+        return _get(self.item, key, default)
+
+
+class _Trie:
+    __slots__ = ("children", "ids")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Trie] = {}
+        self.ids: set[int] = set()
+
+
+class _SearchEnv(Protocol):
+    def from_string(self, source: str) -> Any: ...
+
+
+class TypeaheadIndex:
+    """Prefix trie + trigram index over an option list; see module docs."""
+
+    __slots__ = ("_folded", "_labels", "_root", "_trigrams", "_values", "items")
+
+    def __init__(
+        self,
+        options: Iterable[object],
+        *,
+        label_key: str = "label",
+        value_key: str = "value",
+        keywords_key: str = "keywords",
+    ) -> None:
+        self.items: tuple[object, ...] = tuple(options)
+        self._labels: list[str] = []
+        self._values: list[str] = []
+        self._folded: list[str] = []
+        self._root = _Trie()
+        self._trigrams: dict[str, list[int]] = {}
+        for i, item in enumerate(self.items):
+            raw_value = _get(item, value_key)
+            raw_label = _get(item, label_key)
+            label = str(raw_label if raw_label is not None else raw_value or "")
+            folded = _fold(label)
+            self._labels.append(label)
+            self._values.append(str(raw_value if raw_value is not None else label))
+            self._folded.append(folded)
+            keywords = _get(item, keywords_key) or ()
+            if isinstance(keywords, str):
+                keywords = (keywords,)
+            terms = {*_words(folded), *(w for kw in keywords for w in _words(_fold(str(kw))))}
+            for word in terms:
+                self._insert(word, i)
+            for gram in _trigrams(folded):
+                self._trigrams.setdefault(gram, []).append(i)
+
+    def _insert(self, word: str, i: int) -> None:
+        node = self._root
+        for ch in word:
+            node = node.children.setdefault(ch, _Trie())
+            node.ids.add(i)
+
+    def _prefixed(self, word: str) -> set[int]:
+        node = self._root
+        for ch in word:
+            child = node.children.get(ch)
+            if child is None:
+                return set()
+            node = child
+        return node.ids
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def _hit(self, i: int, score: float) -> TypeaheadHit:
+        return TypeaheadHit(self._labels[i], self._values[i], score, self.items[i])
+
+    def search(self, query: str, k: int = DEFAULT_LIMIT) -> list[TypeaheadHit]:
+        """Return up to ``k`` hits for ``query``, best first.
+
+        An empty query returns the first ``k`` options in source order.
+        """
+        if k <= 0:
+            return []
+        q = _fold(query).strip()
+        if not q:
+            return [self._hit(i, 0.0) for i in range(min(k, len(self.items)))]
+        scores: dict[int, float] = {}
+        words = _words(q)
+        if words:
+            ids = set(self._prefixed(words[0]))
+            for word in words[1:]:
+                ids &= self._prefixed(word)
+            for i in ids:
+                folded = self._folded[i]
+                tier = _EXACT if folded == q else _PREFIX if folded.startswith(q) else _WORDS
+                scores[i] = tier
+        if len(scores) < k:
+            grams = _trigrams(q)
+            shared: dict[int, int] = {}
+            for gram in grams:
+                for i in self._trigrams.get(gram, ()):
+                    shared[i] = shared.get(i, 0) + 1
+            for i, count in shared.items():
+                similarity = count / len(grams)
+                if i not in scores and similarity >= _MIN_SIMILARITY:
+                    scores[i] = similarity * 0.99
+        # Bounded heap: best score, then shorter label, then source order.
+        best = heapq.nsmallest(
+            k, scores.items(), key=lambda e: (-e[1], len(self._labels[e[0]]), e[0])
+        )
+        return [self._hit(i, score) for i, score in best]
+
+
+def typeahead_fragment(
+    env: _SearchEnv,
+    index: TypeaheadIndex,
+    query: str,
+    *,
+    id: str,
+    target: str = "combobox",
+    k: int = DEFAULT_LIMIT,
+) -> str:
+    """Render the top ``k`` hits for ``query`` as a ``search_url`` response.
+
+    ``target="combobox"`` renders ``combobox_options`` (``<li role="option">``
+    items for ``combobox(search_url=...)``; ``id`` is the combobox id, which
+    the option ids are derived from, so it is required).
+    ``target="command_palette"`` renders ``command_palette_results``
+    (``command_palette_item`` per hit; ``id`` prefixes item ids unless the
+    option carries its own ``id``).
+    """
+    hits = index.search(query, k)
+    if target == "command_palette":
+        return render_macro(
+            env,
+            "chirpui/command_palette.html",
+            "command_palette_results",
+            {"results": hits, "id_prefix": id},
+        )
+    return render_macro(
+        env,
+        "chirpui/combobox.html",
+        "combobox_options",
+        {"cid": id, "options": hits},
+    )
@@ -25,12 +25,19 @@ from chirp_ui.filters import (
 )
 from chirp_ui.grid_state import (
     column_aria_sort,
+    grid_rows,
+    grid_template_columns,
+    grid_window,
     parse_sort,
+    record_rows,
+    row_count,
     selection_state,
     sort_columns,
     sort_query,
+    url_template,
 )
 from chirp_ui.icons import icon as icon_filter
+from chirp_ui.nav_index import nav_index
 from chirp_ui.nav_pill import nav_pill_inline_style, segmented_pill_inline_style
 from chirp_ui.route_tabs import tab_is_active
 from chirp_ui.validation import ChirpUIValidationWarning, _warn, set_strict
@@ -320,13 +327,36 @@ def env() -> Environment:
     e.add_global("selection_state", selection_state)
     e.add_global("column_aria_sort", column_aria_sort)
     e.add_global("sort_query", sort_query)
+    e.add_global("grid_window", grid_window)
+    e.add_global("grid_template_columns", grid_template_columns)
+    e.add_global("url_template", url_template)
+    e.add_global("grid_rows", grid_rows)
+    e.add_global("record_rows", record_rows)
+    e.add_global("row_count", row_count)
     from chirp_ui.config_schema import Field, Widget, project_fields
 
     e.add_global("project_fields", project_fields)
     e.add_global("config_field", Field)
     e.add_global("Widget", Widget)
+    from chirp_ui.form_state import field_state, form_state
+
+    e.add_global("form_state", form_state)
+    e.add_global("field_state", field_state)
+    from chirp_ui.fragment_cache import fragment_cache_get, fragment_cache_put
+
+    e.add_global("fragment_cache_get", fragment_cache_get)
+    e.add_global("fragment_cache_put", fragment_cache_put)
+    from chirp_ui.chart_state import project_bars, project_donut, project_metric_grid
+
+    e.add_global("project_bars", project_bars)
+    e.add_global("project_donut", project_donut)
+    e.add_global("project_metric_grid", project_metric_grid)
+    from chirp_ui.series import project_series
+
+    e.add_global("project_series", project_series)
     e.add_global("tab_is_active", tab_is_active)
     e.add_global("nav_pill_inline_style", nav_pill_inline_style)
+    e.add_global("nav_index", nav_index)
     e.add_global("segmented_pill_inline_style", segmented_pill_inline_style)
     from chirp_ui.shortcuts import shortcuts_by_category, shortcuts_json
     from chirp_ui.text_fragment import build_text_fragment_url
@@ -386,11 +416,33 @@ def theme_env() -> Environment:
     e.add_global("selection_state", selection_state)
     e.add_global("column_aria_sort", column_aria_sort)
     e.add_global("sort_query", sort_query)
+    e.add_global("grid_window", grid_window)
+    e.add_global("grid_template_columns", grid_template_columns)
+    e.add_global("url_template", url_template)
+    e.add_global("grid_rows", grid_rows)
+    e.add_global("record_rows", record_rows)
+    e.add_global("row_count", row_count)
     from chirp_ui.config_schema import Field, Widget, project_fields
 
     e.add_global("project_fields", project_fields)
     e.add_global("config_field", Field)
     e.add_global("Widget", Widget)
+    from chirp_ui.form_state import field_state, form_state
+
+    e.add_global("form_state", form_state)
+    e.add_global("field_state", field_state)
+    from chirp_ui.fragment_cache import fragment_cache_get, fragment_cache_put
+
+    e.add_global("fragment_cache_get", fragment_cache_get)
+    e.add_global("fragment_cache_put", fragment_cache_put)
+    from chirp_ui.chart_state import project_bars, project_donut, project_metric_grid
+
+    e.add_global("project_bars", project_bars)
+    e.add_global("project_donut", project_donut)
+    e.add_global("project_metric_grid", project_metric_grid)
+    from chirp_ui.series import project_series
+
+    e.add_global("project_series", project_series)
     e.add_global(
         "csrf_field",
         lambda: Markup('<input type="hidden" name="_csrf_token" value="test-csrf">'),
@@ -20,6 +20,8 @@ def test_verify_generated_task_groups_generated_artifact_checks() -> None:
 
     assert tasks["verify-generated"]["sequence"] == [
         "build-css-check",
+        "build-theme-css-check",
+        "build-theme-packs-check",
         "build-manifest-check",
         "build-docs-check",
         "build-component-index-check",
@@ -0,0 +1,216 @@
+/**
+ * Unit coverage for the chirpuiGridWindow Alpine factory (issue #261).
+ *
+ * Same harness as grid_selection.test.js: eval chirpui-alpine.js against a
+ * mock window.Alpine, then drive the factory against a hand-built viewport
+ * that mirrors data_grid(render_mode="aria_grid"). jsdom does no layout, so
+ * scrollTop / clientHeight are set directly.
+ */
+import fs from "node:fs";
+import path from "node:path";
+import { describe, it, expect, beforeEach, afterEach, vi } from "vitest";
+
+const SRC = fs.readFileSync(
+  path.resolve(process.cwd(), "src/chirp_ui/templates/chirpui-alpine.js"),
+  "utf8",
+);
+
+let factories;
+
+function loadRuntime() {
+  delete window.__chirpuiAlpineRuntimeLoaded;
+  factories = {};
+  window.Alpine = {
+    version: "3.0.0",
+    data(name, factory) {
+      factories[name] = factory;
+    },
+    store() {},
+  };
+  (0, eval)(SRC);
+}
+
+/** Build a viewport holding window [start, stop) of `total` rows. */
+function buildViewport({
+  total = 1000,
+  start = 0,
+  stop = 40,
+  rowHeight = 36,
+  height = 360,
+  header = 0,
+  sticky = false,
+} = {}) {
+  const root = document.createElement("div");
+  root.dataset.rowHeight = String(rowHeight);
+  Object.defineProperty(root, "clientHeight", { value: height, configurable: true });
+  const offset = document.createElement("input");
+  offset.type = "hidden";
+  offset.name = "scroll_top";
+  root.appendChild(offset);
+  const grid = document.createElement("div");
+  grid.setAttribute("role", "grid");
+  grid.setAttribute("aria-rowcount", String(total + 1));
+  if (header) {
+    const head = document.createElement("div");
+    head.className = sticky
+      ? "chirpui-data-grid__head chirpui-data-grid__head--sticky"
+      : "chirpui-data-grid__head";
+    Object.defineProperty(head, "offsetHeight", { value: header, configurable: true });
+    grid.appendChild(head);
+  }
+  const body = document.createElement("div");
+  body.id = "users-grid-body";
+  body.innerHTML = spacerHtml(start, stop);
+  grid.appendChild(body);
+  root.appendChild(grid);
+  document.body.appendChild(root);
+  return { root, offset, body };
+}
+
+function spacerHtml(start, stop) {
+  return `<div class="chirpui-data-grid__spacer" data-window-start="${start}" data-window-stop="${stop}"></div>`;
+}
+
+let liveStates = [];
+
+function makeState(root, offset) {
+  const state = factories.chirpuiGridWindow();
+  state.$root = root;
+  state.$refs = { offset };
+  liveStates.push(state);
+  return state;
+}
+
+describe("chirpuiGridWindow (#261)", () => {
+  beforeEach(() => {
+    document.body.innerHTML = "";
+    liveStates = [];
+    delete window.Alpine;
+    vi.spyOn(console, "warn").mockImplementation(() => {});
+    loadRuntime();
+  });
+
+  afterEach(() => {
+    for (const state of liveStates) {
+      state.destroy();
+    }
+    liveStates = [];
+    delete window.Alpine;
+    delete window.__chirpuiAlpineRuntimeLoaded;
+    vi.restoreAllMocks();
+  });
+
+  it("registers the factory", () => {
+    expect(typeof factories.chirpuiGridWindow).toBe("function");
+  });
+
+  it("reads row height, total, and the rendered window on init", () => {
+    const { root, offset } = buildViewport({ total: 500, start: 10, stop: 50, rowHeight: 40 });
+    const state = makeState(root, offset);
+    state.init();
+    expect(state.rowHeight).toBe(40);
+    expect(state.total).toBe(500);
+    expect(state.start).toBe(10);
+    expect(state.stop).toBe(50);
+  });
+
+  it("does not fetch while the visible range stays inside the window", () => {
+    const { root, offset } = buildViewport({ start: 0, stop: 40 });
+    const state = makeState(root, offset);
+    state.init();
+    const fired = vi.fn();
+    root.addEventListener("chirpui:grid-window", fired);
+    root.scrollTop = 36 * 20; // rows 20..30 visible
+    state.onScroll();
+    expect(fired).not.toHaveBeenCalled();
+    expect(offset.value).toBe("");
+  });
+
+  it("writes the offset and fires the trigger when scrolling past the window", () => {
+    const { root, offset } = buildViewport({ start: 0, stop: 40 });
+    const state = makeState(root, offset);
+    state.init();
+    const fired = vi.fn();
+    root.addEventListener("chirpui:grid-window", fired);
+    root.scrollTop = 36 * 35; // rows 35..45 visible — past stop=40
+    state.onScroll();
+    expect(fired).toHaveBeenCalledTimes(1);
+    expect(offset.value).toBe(String(36 * 35));
+  });
+
+  it("measures the offset from the first data row below a scrolling header", () => {
+    const { root, offset } = buildViewport({ start: 0, stop: 40, header: 40 });
+    const state = makeState(root, offset);
+    state.init();
+    const fired = vi.fn();
+    root.addEventListener("chirpui:grid-window", fired);
+    root.scrollTop = 40 + 36 * 35;
+    state.onScroll();
+    expect(fired).toHaveBeenCalledTimes(1);
+    expect(offset.value).toBe(String(36 * 35));
+  });
+
+  it("shrinks the visible range by a sticky header's height", () => {
+    // 360px viewport, 36px sticky header: rows 30..39 are visible, so the
+    // rendered window [0, 40) still covers them. Without the correction the
+    // range would end at row 40 and fetch.
+    const { root, offset } = buildViewport({ start: 0, stop: 40, header: 36, sticky: true });
+    const state = makeState(root, offset);
+    state.init();
+    const fired = vi.fn();
+    root.addEventListener("chirpui:grid-window", fired);
+    root.scrollTop = 36 * 30 + 18;
+    state.onScroll();
+    expect(fired).not.toHaveBeenCalled();
+    root.scrollTop = 36 * 31 + 18;
+    state.onScroll();
+    expect(fired).toHaveBeenCalledTimes(1);
+    expect(offset.value).toBe(String(36 * 31 + 18));
+  });
+
+  it("fires when scrolling back above the window start", () => {
+    const { root, offset } = buildViewport({ start: 100, stop: 140 });
+    const state = makeState(root, offset);
+    state.init();
+    const fired = vi.fn();
+    root.addEventListener("chirpui:grid-window", fired);
+    root.scrollTop = 36 * 90;
+    state.onScroll();
+    expect(fired).toHaveBeenCalledTimes(1);
+  });
+
+  it("does not fetch past the end of the result set", () => {
+    const { root, offset } = buildViewport({ total: 40, start: 0, stop: 40 });
+    const state = makeState(root, offset);
+    state.init();
+    const fired = vi.fn();
+    root.addEventListener("chirpui:grid-window", fired);
+    root.scrollTop = 36 * 35;
+    state.onScroll();
+    expect(fired).not.toHaveBeenCalled();
+  });
+
+  it("re-reads the window after an htmx swap settles inside the viewport", () => {
+    const { root, offset, body } = buildViewport({ start: 0, stop: 40 });
+    const state = makeState(root, offset);
+    state.init();
+    body.innerHTML = spacerHtml(30, 70);
+    document.body.dispatchEvent(
+      new CustomEvent("htmx:afterSettle", { detail: { target: body } }),
+    );
+    expect(state.start).toBe(30);
+    expect(state.stop).toBe(70);
+  });
+
+  it("destroy() removes the afterSettle listener", () => {
+    const { root, offset, body } = buildViewport({ start: 0, stop: 40 });
+    const state = makeState(root, offset);
+    state.init();
+    state.destroy();
+    body.innerHTML = spacerHtml(30, 70);
+    document.body.dispatchEvent(
+      new CustomEvent("htmx:afterSettle", { detail: { target: body } }),
+    );
+    expect(state.start).toBe(0);
+  });
+});
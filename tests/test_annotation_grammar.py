@@ -21,6 +21,7 @@ KNOWN_KEYS: frozenset[str] = frozenset(
         "_bar_surface",
         "_card_variant",
         "_form_density",
+        "_form_state",
         "_hero_variant",
         "_nav_current_path",
         "_site_nav_current_path",
@@ -907,6 +907,24 @@ class TestAsciiSparkline:
         ).render()
         assert "inline" in html
 
+    def test_long_series_is_downsampled_to_width(self, env: Environment) -> None:
+        html = env.from_string(
+            '{% from "chirpui/ascii_sparkline.html" import ascii_sparkline %}'
+            '{{ ascii_sparkline(values=values, width=40, method="minmax") }}'
+        ).render(values=list(range(50_000)))
+        assert html.count("chirpui-ascii-sparkline__bar") == 40
+        assert 'aria-label="Sparkline: 50000 points, min 0, max 49999, last 49999"' in html
+
+    def test_accepts_projected_series(self, env: Environment) -> None:
+        from chirp_ui.series import project_series
+
+        html = env.from_string(
+            '{% from "chirpui/ascii_sparkline.html" import ascii_sparkline %}'
+            "{{ ascii_sparkline(values=series) }}"
+        ).render(series=project_series([1, 5, 3, 7]))
+        assert html.count("chirpui-ascii-sparkline__bar") == 4
+        assert 'aria-label="Sparkline: 1, 5, 3, 7"' in html
+
 
 # ---------------------------------------------------------------------------
 # ascii_spinner
@@ -1078,6 +1096,23 @@ class TestAsciiTable:
         assert ">api</span>" in html
         assert ">OK</span>" in html
 
+    def test_fixed_layout_emits_padded_cells_and_borders(self, env: Environment) -> None:
+        from chirp_ui.ascii_table import AsciiTableLayout
+
+        layout = AsciiTableLayout.measure(
+            ["Name", "p99"], [["api", "23ms"], ["東京", "5ms"]], align=["left", "right"]
+        )
+        html = env.from_string(
+            '{% from "chirpui/ascii_table.html" import ascii_table_fixed %}'
+            "{{ ascii_table_fixed(layout) }}"
+        ).render(layout=layout)
+        assert "chirpui-ascii-table--fixed" in html
+        assert f">{layout.top}</div>" in html
+        assert f">{layout.bottom}</div>" in html
+        assert '<span class="chirpui-ascii-table__th" role="columnheader"> Name </span>' in html
+        assert '<span class="chirpui-ascii-table__td" role="cell"> 東京 </span>' in html
+        assert '<span class="chirpui-ascii-table__td" role="cell">  5ms </span>' in html
+
     def test_variant_double(self, env: Environment) -> None:
         html = env.from_string(
             '{% from "chirpui/ascii_table.html" import ascii_table %}'
@@ -0,0 +1,54 @@
+"""Tests for chirp_ui.ascii_table precomputed ASCII table layout."""
+
+from kida import Environment
+
+from chirp_ui.ascii_table import AsciiTableLayout, display_width, stream_ascii_table
+
+
+def test_display_width_counts_wide_and_combining() -> None:
+    assert display_width("abc") == 3
+    assert display_width("東京") == 4
+    assert display_width("\uff46\uff55\uff4c\uff4c") == 8  # fullwidth "full"
+    assert display_width("e\u0301") == 1  # combining acute
+
+
+def test_measure_shares_widths_between_header_and_rows() -> None:
+    layout = AsciiTableLayout.measure(
+        ["Service", "都市", "p99"],
+        [["api", "東京", 23], ["auth-service", "Zürich", None]],
+        align=["left", "center", "right"],
+    )
+    assert layout.widths == (12, 6, 3)
+    assert layout.header == (" Service      ", "  都市  ", " p99 ")
+    assert layout.rows[1] == (" auth-service ", " Zürich ", "     ")
+    lines = layout.text().splitlines()
+    assert lines[0] == "┌──────────────┬────────┬─────┐"
+    assert lines[3] == "│ api          │  東京  │  23 │"
+    assert {display_width(line) for line in lines} == {31}
+
+
+def test_max_width_truncates_and_variants() -> None:
+    layout = AsciiTableLayout.measure(
+        None, [["a very long cell", "東京都庁"]], max_width=5, variant="double", padding=0
+    )
+    assert layout.rows[0] == ("a ve…", "東京…")
+    assert layout.text() == "╔═════╦═════╗\n║a ve…║東京…║\n╚═════╩═════╝"
+    assert AsciiTableLayout.measure(["x"], variant="bogus").variant == "single"
+
+
+def test_pad_row_fills_missing_and_drops_extra_cells() -> None:
+    layout = AsciiTableLayout.measure(["a", "b"], widths=[3, 2])
+    assert layout.pad_row(["x"]) == (" x   ", "    ")
+    assert layout.pad_row(["x", "y", "z"]) == (" x   ", " y  ")
+
+
+def test_stream_measures_sample_then_fits_rest(env: Environment) -> None:
+    rows = ([f"row{i}", "x" * (i + 1)] for i in range(6))
+    chunks = list(stream_ascii_table(env, ["Name", "Data"], rows, sample=2, batch_size=2))
+    html = "".join(chunks)
+    assert len(chunks) == 5  # head, three row batches, bottom border
+    assert "chirpui-ascii-table--fixed" in chunks[0]
+    assert html.count('role="cell"') == 12
+    # Widths come from the header and the first two rows ("Data" = 4 columns).
+    assert "> xxxx </span>" in html
+    assert html.count("> xxx… </span>") == 2
@@ -0,0 +1,151 @@
+"""Sync/async parity for the grid and form projection helpers.
+
+Every async counterpart (``asort_columns``, ``aselection_state``,
+``agrid_window``, ``aproject_fields``) must return exactly what its sync twin
+returns — whether the I/O-backed arguments arrive as plain values or as
+awaitables. The cases below run through both paths.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+
+from chirp_ui.config_schema import Field, aproject_fields, project_fields
+from chirp_ui.grid_state import (
+    Column,
+    GridSort,
+    agrid_window,
+    aselection_state,
+    asort_columns,
+    grid_window,
+    selection_state,
+    sort_columns,
+)
+
+COLS = [
+    Column("name", "Name", sortable=True),
+    {"key": "status", "label": "Status", "sortable": True, "align": "center"},
+    Column("notes", "Notes"),
+]
+
+SCHEMA = [
+    Field("model", default="a", options_callable=lambda: [("a", "A"), ("b", "B")]),
+    Field("stream", type="bool", default=True),
+    Field("api_key", secret=True),
+]
+
+
+async def _later[T](value: T) -> T:
+    await asyncio.sleep(0)
+    return value
+
+
+# name -> (sync, async, args, kwargs, positions/keywords that may be awaitables)
+CASES: dict[str, tuple[Callable[..., Any], Callable[..., Awaitable[Any]], tuple, dict, set]] = {
+    "sort_columns": (
+        sort_columns,
+        asort_columns,
+        (COLS, GridSort("name", "asc"), "/users?page=2"),
+        {"extra_params": {"q": "ada"}},
+        {0, 1, "extra_params"},
+    ),
+    "selection_state": (
+        selection_state,
+        aselection_state,
+        (["1", 3], [1, 2, 3]),
+        {"total": 40},
+        {0, 1, "total"},
+    ),
+    "selection_state_none": (
+        selection_state,
+        aselection_state,
+        (None, []),
+        {},
+        {0, 1},
+    ),
+    "grid_window": (
+        grid_window,
+        agrid_window,
+        (10_000, "3600"),
+        {"row_height": 36, "overscan": 5},
+        {0},
+    ),
+    "project_fields": (
+        project_fields,
+        aproject_fields,
+        (SCHEMA, {"model": "b", "api_key": "sk-real"}),
+        {},
+        {1},
+    ),
+}
+
+
+@pytest.fixture(params=["plain", "awaitable"])
+def lift(request: pytest.FixtureRequest) -> Callable[[object, object, set], object]:
+    def apply(key: object, value: object, liftable: set) -> object:
+        return _later(value) if request.param == "awaitable" and key in liftable else value
+
+    return apply
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_async_projection_matches_sync(case: str, lift: Callable[..., object]) -> None:
+    sync_fn, async_fn, args, kwargs, liftable = CASES[case]
+    expected = sync_fn(*args, **kwargs)
+    lifted_args = [lift(i, a, liftable) for i, a in enumerate(args)]
+    lifted_kwargs = {k: lift(k, v, liftable) for k, v in kwargs.items()}
+    assert asyncio.run(async_fn(*lifted_args, **lifted_kwargs)) == expected
+
+
+def test_aproject_fields_accepts_async_options_callable() -> None:
+    async def models() -> list[tuple[str, str]]:
+        return [("a", "A"), ("b", "B")]
+
+    schema = [Field("model", default="a", options_callable=models)]
+    expected = project_fields([Field("model", default="a", choices=(("a", "A"), ("b", "B")))])
+    assert asyncio.run(aproject_fields(schema)) == expected
+
+
+def test_aselection_state_gathers_concurrently() -> None:
+    started = asyncio.Event()
+
+    async def page_ids() -> list[str]:
+        started.set()
+        return ["1", "2"]
+
+    async def total() -> int:
+        # Only finishes if page_ids() runs while this is still pending.
+        await asyncio.wait_for(started.wait(), 1)
+        return 2
+
+    async def run() -> object:
+        return await aselection_state(None, page_ids(), total())
+
+    state = asyncio.run(run())
+    assert (state.page_ids, state.total) == (("1", "2"), 2)
+
+
+def test_async_projection_failure_cancels_siblings() -> None:
+    cancelled = asyncio.Event()
+
+    async def slow_total() -> int:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return 0
+
+    async def broken_ids() -> list[str]:
+        await asyncio.sleep(0)
+        raise RuntimeError("db down")
+
+    async def run() -> None:
+        await aselection_state(None, broken_ids(), slow_total())
+
+    with pytest.raises(ExceptionGroup) as excinfo:
+        asyncio.run(run())
+    assert excinfo.group_contains(RuntimeError, match="db down")
+    assert cancelled.is_set()
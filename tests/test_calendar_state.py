@@ -0,0 +1,102 @@
+"""Tests for chirp_ui.calendar_state — month-grid projection for calendar."""
+
+from datetime import date, datetime
+
+from chirp_ui.calendar_state import CalendarEvent, calendar_month, month_dates
+
+
+def _day(month, n: int):
+    return next(d for week in month.weeks for d in week if d.day == n)
+
+
+def test_month_dates_is_memoized_and_padded() -> None:
+    month_dates.cache_clear()
+    weeks = month_dates(2025, 1)
+    assert month_dates(2025, 1) is weeks
+    assert month_dates.cache_info().hits == 1
+    assert weeks[0][:3] == (None, None, None)
+    assert weeks[0][3] == date(2025, 1, 1)
+    assert all(len(week) == 7 for week in weeks)
+
+
+def test_labels_weekdays_and_nav_urls_wrap_the_year() -> None:
+    jan = calendar_month(2025, 1, url="/calendar/{year}/{month}")
+    assert jan.label == "January 2025"
+    assert jan.weekdays[0] == "Sun"
+    assert jan.prev_url == "/calendar/2024/12"
+    assert jan.next_url == "/calendar/2025/2"
+    dec = calendar_month(2025, 12, firstweekday=0, url="/c/{year}-{month}")
+    assert dec.weekdays[0] == "Mon"
+    assert dec.next_url == "/c/2026-1"
+    assert calendar_month(2025, 1).prev_url is None
+
+
+def test_day_state_classes() -> None:
+    month = calendar_month(
+        2025,
+        3,
+        today="2025-03-10",
+        selected=date(2025, 3, 3),
+        range=("2025-03-20", "2025-03-18"),
+        min="2025-03-02",
+        disabled=["2025-03-25"],
+    )
+    assert _day(month, 10).today
+    assert _day(month, 10).cls == " chirpui-calendar__day--today"
+    assert _day(month, 3).selected
+    assert _day(month, 18).selected
+    assert _day(month, 18).in_range
+    assert _day(month, 19).cls == " chirpui-calendar__day--in-range"
+    assert _day(month, 1).disabled
+    assert _day(month, 25).disabled
+    assert not _day(month, 2).disabled
+    assert _day(month, 5).cls == ""
+    assert month.weeks[0][0].cls == " chirpui-calendar__day--empty"
+
+
+def test_events_mapping_and_set() -> None:
+    month = calendar_month(
+        2025,
+        1,
+        events={
+            date(2025, 1, 20): [{"title": "Launch", "href": "/e/1"}, CalendarEvent("Retro")],
+            "not-a-date": [{"title": "ignored"}],
+        },
+    )
+    day = _day(month, 20)
+    assert "chirpui-calendar__day--has-events" in day.cls
+    assert day.events == (CalendarEvent("Launch", "/e/1"), CalendarEvent("Retro"))
+    assert day.iso == "2025-01-20"
+    marked = calendar_month(2025, 1, events={"2025-01-05"})
+    assert _day(marked, 5).cls == " chirpui-calendar__day--has-events"
+    assert _day(marked, 5).events == ()
+
+
+def test_single_event_values_are_not_iterated() -> None:
+    month = calendar_month(
+        2025,
+        1,
+        events={
+            date(2025, 1, 3): {"title": "Standup", "href": "/e/1"},
+            "2025-01-04": "Retro",
+            "2025-01-05": CalendarEvent("Launch"),
+            "2025-01-06": ["Review", {"label": "Demo"}],
+        },
+    )
+    assert _day(month, 3).events == (CalendarEvent("Standup", "/e/1"),)
+    assert _day(month, 4).events == (CalendarEvent("Retro"),)
+    assert _day(month, 5).events == (CalendarEvent("Launch"),)
+    assert _day(month, 6).events == (CalendarEvent("Review"), CalendarEvent("Demo"))
+
+
+def test_datetimes_normalize_to_their_date() -> None:
+    month = calendar_month(
+        2025,
+        3,
+        today=datetime(2025, 3, 10, 23, 59),
+        selected=datetime(2025, 3, 3, 8, 30),
+        events={datetime(2025, 3, 20, 14, 0): [{"title": "Standup"}]},
+    )
+    assert _day(month, 10).today
+    assert _day(month, 3).selected
+    assert _day(month, 20).events == (CalendarEvent("Standup"),)
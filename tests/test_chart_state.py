@@ -0,0 +1,69 @@
+"""Tests for chirp_ui.chart_state chart projections."""
+
+from types import SimpleNamespace
+
+from chirp_ui.chart_state import (
+    MetricRow,
+    project_bars,
+    project_donut,
+    project_metric_grid,
+)
+from chirp_ui.series import project_series
+
+
+def test_project_bars_scales_to_largest_value_by_default() -> None:
+    chart = project_bars(
+        [
+            {"label": "create-rule", "value": 42},
+            {"label": "debug-agent", "value": 21, "href": "/skills/debug-agent"},
+        ]
+    )
+    assert chart.max == 42
+    assert [r.pct for r in chart.rows] == [100.0, 50.0]
+    assert chart.rows[1].style == "width: 50.0%"
+    assert chart.rows[1].href == "/skills/debug-agent"
+    assert chart.aria_label == "Bar chart with 2 items"
+    assert project_bars(chart) is chart
+
+
+def test_project_bars_explicit_max_and_sparse_items() -> None:
+    chart = project_bars([{}, SimpleNamespace(label="obj", value=5)], max=10)
+    assert chart.rows[0].label == ""
+    assert chart.rows[0].value == 0
+    assert chart.rows[1].pct == 50.0
+    assert project_bars([]).rows == ()
+    assert project_bars([{"label": "zero", "value": 0}]).rows[0].pct == 0
+
+
+def test_project_bars_accepts_series() -> None:
+    chart = project_bars(project_series([2, 4], labels=["a", "b"]))
+    assert [(r.label, r.pct) for r in chart.rows] == [("a", 50.0), ("b", 100.0)]
+
+
+def test_project_donut_matches_macro_text() -> None:
+    d = project_donut(40, 100, caption="Uptime")
+    assert d.text == "40%"
+    assert d.aria_label == "40%: Uptime"
+    assert d.style == "--chirpui-donut-pct: 40.0"
+    assert project_donut(3, 5, text="3/5").text == "3/5"
+    assert project_donut(3, 5, label="3/5").aria_label == "3/5"
+    assert project_donut(1, 0).pct == 0
+    assert project_donut(d) is d
+
+
+def test_project_metric_grid_resolves_trend() -> None:
+    rows = project_metric_grid(
+        [
+            {"value": 128, "label": "Tasks", "trend": 12},
+            {"value": "99.9%", "label": "Uptime", "trend": "-0.1%", "trend_direction": "down"},
+            {"value": 3, "label": "Incidents", "trend": "flat"},
+            {"value": 7, "label": "Errors", "trend": "+2", "trend_direction": "warning"},
+        ]
+    )
+    assert (rows[0].trend, rows[0].trend_direction) == ("+12", "up")
+    assert rows[1].trend_direction == "down"
+    assert rows[2].trend_direction == ""
+    assert rows[3].trend_direction == "warning"  # custom modifiers pass through
+    assert project_metric_grid([rows[0]])[0] is rows[0]
+    assert project_metric_grid(None) == []
+    assert MetricRow(value=1, label="x").trend is None
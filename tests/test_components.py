@@ -7,7 +7,7 @@ Each test verifies:
 """
 
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from itertools import pairwise
 from pathlib import Path
@@ -15,6 +15,7 @@ from pathlib import Path
 import pytest
 from kida import Environment
 
+from chirp_ui.fragment_cache import FragmentCache, get_fragment_cache, set_fragment_cache
 from chirp_ui.validation import ChirpUIValidationWarning
 from tests.helpers import assert_element
 
@@ -1387,6 +1388,20 @@ class TestNavTree:
         assert "API" in html
         assert "Ref" in html
 
+    def test_nav_tree_lazy_branches(self, env: Environment) -> None:
+        html = env.from_string(
+            '{% from "chirpui/nav_tree.html" import nav_tree %}'
+            '{% call nav_tree(items=[{"title": "API", "href": "/api", "has_children": true}, '
+            '{"id": "guide", "title": "Guide", "active": true, '
+            '"children": [{"title": "Intro", "href": "/guide/intro"}]}], '
+            'lazy_url="/nav/tree") %}'
+            "{% end %}"
+        ).render()
+        assert 'hx-get="/nav/tree?node=%2Fapi"' in html
+        assert "chirpui-nav-tree__item--branch" in html
+        assert "Intro" in html
+        assert "node=guide" not in html
+
     def test_nav_tree_linked_branch_mode_uses_route_links(self, env: Environment) -> None:
         html = env.from_string(
             '{% from "chirpui/nav_tree.html" import nav_tree %}'
@@ -3752,6 +3767,17 @@ class TestFilterBar:
         assert 'method="get"' in html
         assert '<input name="q" />' in html
 
+    def test_filter_row_preserve_renders_hidden_fields(self, env: Environment) -> None:
+        html = env.from_string(
+            '{% from "chirpui/filter_bar.html" import filter_row %}'
+            '{% set keep = url_template("/users?sort=-name", "q", {"status": "open"}) %}'
+            '{% call filter_row(keep.action, preserve=keep) %}<input name="q" />{% end %}'
+        ).render()
+        assert 'action="/users"' in html
+        assert '<input type="hidden" name="sort" value="-name">' in html
+        assert '<input type="hidden" name="status" value="open">' in html
+        assert 'type="hidden" name="q"' not in html
+
     def test_filter_row_custom_gap(self, env: Environment) -> None:
         html = env.from_string(
             '{% from "chirpui/filter_bar.html" import filter_row %}'
@@ -4737,6 +4763,41 @@ class TestForms:
         assert 'role="alert"' in html
         assert "Pick one" in html
 
+    def test_form_errors_reach_fields_via_provide(self, env: Environment) -> None:
+        html = env.from_string(
+            '{% from "chirpui/forms.html" import form, text_field, checkbox_field %}'
+            '{% call form("/save", errors={"email": ["Required"], "agree": ["Must agree"]}) %}'
+            '{{ text_field("email", label="Email") }}'
+            '{{ text_field("name", label="Name") }}'
+            '{{ checkbox_field("agree", label="I agree") }}'
+            "{% end %}"
+        ).render()
+        assert html.count('aria-invalid="true"') == 1  # checkbox has no aria-invalid
+        assert "Required" in html
+        assert "Must agree" in html
+        assert html.count("chirpui-field--error") == 2
+        assert 'aria-describedby="errors-name"' in html
+
+    def test_field_errors_override_form_state(self, env: Environment) -> None:
+        html = env.from_string(
+            '{% from "chirpui/forms.html" import form, text_field %}'
+            '{% call form("/save", errors={"email": ["From form"]}) %}'
+            '{{ text_field("email", label="Email", errors={"email": ["From field"]}) }}'
+            "{% end %}"
+        ).render()
+        assert "From field" in html
+        assert "From form" not in html
+
+    def test_form_error_summary_accepts_form_state(self, env: Environment) -> None:
+        from chirp_ui.form_state import form_state
+
+        html = env.from_string(
+            '{% from "chirpui/forms.html" import form_error_summary %}'
+            "{{ form_error_summary(state) }}"
+        ).render(state=form_state({"email": ["Required"], "name": []}))
+        assert "1 error" in html
+        assert 'href="#field-email"' in html
+
     def test_form_error_summary_with_errors(self, env: Environment) -> None:
         html = env.from_string(
             '{% from "chirpui/forms.html" import form_error_summary %}'
@@ -6853,6 +6914,21 @@ class TestFab:
 
 
 class TestCommandPaletteCombobox:
+    def test_typeahead_fragment_renders_command_palette_items(self, env: Environment) -> None:
+        from chirp_ui.typeahead import TypeaheadIndex, typeahead_fragment
+
+        index = TypeaheadIndex(
+            [
+                {"label": "New document", "href": "/docs/new", "hint": "N"},
+                {"label": "Open settings", "action": "settings"},
+            ]
+        )
+        html = typeahead_fragment(env, index, "new", target="command_palette", id="cmd")
+        assert html.count('role="option"') == 1
+        assert 'id="cmd-0"' in html
+        assert 'href="/docs/new"' in html
+        assert "chirpui-command-palette__item-hint" in html
+
     def test_command_palette_combobox_contract(self, env: Environment) -> None:
         html = env.from_string(
             '{% from "chirpui/command_palette.html" import command_palette %}'
@@ -7059,6 +7135,22 @@ class TestTreeView:
         assert "Child" in html
         assert "<details" in html
 
+    def test_tree_view_lazy_branch_renders_placeholder(self, env: Environment) -> None:
+        html = env.from_string(
+            '{% from "chirpui/tree_view.html" import tree_view %}'
+            '{% set nodes = [{"id": "src", "label": "src", "children": [], "has_children": true}, '
+            '{"id": "docs", "label": "docs", '
+            '"children": [{"id": "docs/a.md", "label": "a.md"}]}] %}'
+            '{{ tree_view(nodes=nodes, lazy_url="/files/tree", expanded=["docs"]) }}'
+        ).render()
+        assert 'hx-get="/files/tree?node=src"' in html
+        assert "toggle once from:closest details" in html
+        assert "chirpui-tree__lazy" in html
+        assert '<details class="chirpui-tree__node" open>' in html
+        assert "hx-disinherit" not in html
+        assert "a.md" in html
+        assert "node=docs" not in html
+
 
 class TestCalendar:
     def test_calendar(self, env: Environment) -> None:
@@ -7088,6 +7180,31 @@ class TestCalendar:
         assert html.count('hx-target="#site-content"') == 2
         assert html.count('hx-boost="true"') == 2
 
+    def test_calendar_renders_precomputed_month(self, env: Environment) -> None:
+        from datetime import date
+
+        from chirp_ui import calendar_month
+
+        month = calendar_month(
+            2025,
+            1,
+            today=date(2025, 1, 15),
+            events={"2025-01-20": [{"title": "Launch", "href": "/events/1"}]},
+            firstweekday=0,
+            url="/calendar/{year}/{month}",
+        )
+        html = env.from_string(
+            '{% from "chirpui/calendar.html" import calendar %}{{ calendar(month=month) }}'
+        ).render(month=month)
+        assert "January 2025" in html
+        assert html.index("<span>Mon</span>") < html.index("<span>Sun</span>")
+        assert 'href="/calendar/2024/12"' in html
+        assert 'href="/calendar/2025/2"' in html
+        assert 'chirpui-calendar__day chirpui-calendar__day--today" aria-current="date"' in html
+        assert "chirpui-calendar__day--has-events" in html
+        assert '<a class="chirpui-calendar__event" href="/events/1"' in html
+        assert html.count("chirpui-calendar__day--empty") == 4
+
 
 # ---------------------------------------------------------------------------
 # Badge, Skeleton, Progress, Media Object, Stat, App Layout
@@ -7305,6 +7422,16 @@ class TestSuspense:
         assert "chirpui-suspense-group my-group" in html
         assert 'aria-busy="true"' in html
 
+    def test_suspense_group_id_renders_status_target(self, env: Environment) -> None:
+        html = env.from_string(
+            '{% from "chirpui/suspense.html" import suspense_group, suspense_group_done %}'
+            '{% call suspense_group(id="dash") %}content{% end %}'
+            '{{ suspense_group_done("dash") }}'
+        ).render()
+        assert 'id="dash" class="chirpui-suspense-group"' in html
+        assert html.count('id="dash-status"') == 2
+        assert "setAttribute('aria-busy', 'false')" in html
+
     def test_suspense_slot_multiple_lines(self, env: Environment) -> None:
         html = env.from_string(
             '{% from "chirpui/suspense.html" import suspense_slot %}'
@@ -7577,6 +7704,20 @@ class TestMetricGrid:
         assert "chirpui-metric-card" in html
         assert "Tasks" in html
 
+    def test_metric_grid_items_render_projected_cards(self, env: Environment) -> None:
+        html = env.from_string(
+            '{% from "chirpui/metric_grid.html" import metric_grid %}{{ metric_grid(items=kpis) }}'
+        ).render(
+            kpis=[
+                {"value": 128, "label": "Tasks", "trend": 12},
+                {"value": "99.9%", "label": "Uptime", "href": "/status"},
+            ]
+        )
+        assert html.count("chirpui-metric-card__stat") == 2
+        assert "chirpui-metric-card__trend--up" in html
+        assert "+12" in html
+        assert 'href="/status"' in html
+
     def test_metric_card_link(self, env: Environment) -> None:
         html = env.from_string(
             '{% from "chirpui/metric_grid.html" import metric_card %}'
@@ -8815,6 +8956,90 @@ class TestOobHelpers:
         assert 'hx-swap-oob="true"' in html
 
 
+class TestCachedFragment:
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self) -> Iterator[None]:
+        previous = get_fragment_cache()
+        set_fragment_cache(FragmentCache())
+        yield
+        set_fragment_cache(previous)
+
+    @staticmethod
+    def _ticker() -> tuple[list[int], Callable[[], int]]:
+        calls: list[int] = []
+
+        def tick() -> int:
+            calls.append(1)
+            return len(calls)
+
+        return calls, tick
+
+    def test_cached_fragment_renders_body_once(self, env: Environment) -> None:
+        calls, tick = self._ticker()
+        tpl = env.from_string(
+            '{% from "chirpui/oob.html" import cached_fragment %}'
+            '{% call cached_fragment("stats", ttl=60) %}<b>{{ tick() }}</b>{% end %}'
+        )
+        first = tpl.render(tick=tick)
+        second = tpl.render(tick=tick)
+        assert "<b>1</b>" in first
+        assert "<b>1</b>" in second
+        assert len(calls) == 1
+
+    def test_cached_fragment_vary_keys_separately(self, env: Environment) -> None:
+        calls, tick = self._ticker()
+        tpl = env.from_string(
+            '{% from "chirpui/oob.html" import cached_fragment %}'
+            '{% call cached_fragment("badge", vary=uid) %}{{ tick() }}{% end %}'
+        )
+        tpl.render(tick=tick, uid=1)
+        tpl.render(tick=tick, uid=2)
+        tpl.render(tick=tick, uid=1)
+        assert len(calls) == 2
+
+    def test_cached_fragment_invalidate_tag(self, env: Environment) -> None:
+        calls, tick = self._ticker()
+        tpl = env.from_string(
+            '{% from "chirpui/oob.html" import cached_fragment %}'
+            '{% call cached_fragment("inbox", tags="inbox") %}{{ tick() }}{% end %}'
+        )
+        tpl.render(tick=tick)
+        assert get_fragment_cache().invalidate_tag("inbox") == 1
+        tpl.render(tick=tick)
+        assert len(calls) == 2
+
+    def test_oob_fragment_cache_key_warms_suspense_slot(self, env: Environment) -> None:
+        env.from_string(
+            '{% from "chirpui/oob.html" import oob_fragment %}'
+            '{% call oob_fragment("team-stats", cache_key="team-stats", cache_vary=7) %}'
+            "<p>42 seats</p>{% end %}"
+        ).render()
+        html = env.from_string(
+            '{% from "chirpui/suspense.html" import suspense_slot %}'
+            '{{ suspense_slot("team-stats", cache_key="team-stats", cache_vary=7) }}'
+        ).render()
+        assert "<p>42 seats</p>" in html
+        assert 'data-cached="true"' in html
+        assert "chirpui-skeleton" not in html
+
+    def test_oob_fragment_cache_key_keeps_error_boundary(self, env: Environment) -> None:
+        html = env.from_string(
+            '{% from "chirpui/oob.html" import oob_fragment %}'
+            '{% call oob_fragment("broken", cache_key="broken") %}{{ undefined_var.bad }}{% end %}'
+        ).render()
+        assert 'id="broken"' in html
+        assert 'hx-swap-oob="true"' in html
+        assert get_fragment_cache().get("broken") is None
+
+    def test_suspense_slot_cold_cache_shows_skeleton(self, env: Environment) -> None:
+        html = env.from_string(
+            '{% from "chirpui/suspense.html" import suspense_slot %}'
+            '{{ suspense_slot("team-stats", cache_key="team-stats") }}'
+        ).render()
+        assert "chirpui-skeleton" in html
+        assert "data-cached" not in html
+
+
 class TestNumberTicker:
     def test_basic(self, env: Environment) -> None:
         html = env.from_string(
@@ -9271,6 +9496,28 @@ class TestCombobox:
         # Multi-select submits repeated hidden inputs, not the single-value input.
         assert 'x-ref="value"' not in html
 
+    def test_combobox_search_url_fetches_options_from_server(self, env: Environment) -> None:
+        html = self._render(env, extra=', search_url="/countries/search"')
+        assert 'data-remote="true"' in html
+        assert 'hx-get="/countries/search"' in html
+        assert 'hx-target="#chirpui-combobox-country-list"' in html
+        assert 'hx-sync="this:replace"' in html
+        # The query input is detached from the form; only the hidden value submits.
+        assert 'name="q" form=""' in html
+        assert 'data-remote="true"' not in self._render(env)
+
+    def test_typeahead_fragment_renders_ranked_combobox_options(self, env: Environment) -> None:
+        from chirp_ui.typeahead import TypeaheadIndex, typeahead_fragment
+
+        index = TypeaheadIndex(
+            [{"label": "Canada", "value": "ca"}, {"label": "United States", "value": "us"}]
+        )
+        html = typeahead_fragment(env, index, "uni", id="chirpui-combobox-country")
+        assert html.count('role="option"') == 1
+        assert 'id="chirpui-combobox-country-opt-0"' in html
+        assert 'data-value="us"' in html
+        assert "chirpui-combobox__empty" in html
+
 
 class TestDatePicker:
     def test_single_date_picker_contract(self, env: Environment) -> None:
@@ -9864,6 +10111,99 @@ class TestDataGrid:
         assert "<thead" not in html
         assert html.count("chirpui-table__select-row") == 2
 
+    def test_record_rows_source_renders_without_parallel_lists(self, env: Environment) -> None:
+        html = self._render(
+            env,
+            "{% set src = record_rows([{'id': 7, 'name': 'Ada', 'status': 'Active', 'notes': none}], "
+            "cols, label_key='name') %}"
+            "{{ data_grid(columns=cols, rows=src, sort_url='/users', selection_id='users', "
+            "selectable=true) }}",
+        )
+        assert 'value="7"' in html
+        assert 'aria-label="Select Ada"' in html
+        assert ">Active</td>" in html
+        assert "chirpui-table__empty" not in html
+
+    def test_one_shot_record_rows_source_counts_rendered_rows(self, env: Environment) -> None:
+        def records():
+            yield from (
+                {"id": i, "name": n, "status": "Active", "notes": ""}
+                for i, n in enumerate(["Ada", "Bob", "Cy"], 1)
+            )
+
+        tpl = env.from_string(
+            '{% from "chirpui/data_grid.html" import data_grid %}'
+            + self._cols()
+            + "{{ data_grid(columns=cols, rows=record_rows(gen, cols), sort_url='/users', "
+            "selection_id='users', selectable=true, render_mode=mode) }}"
+        )
+        html = tpl.render(gen=records(), mode="table")
+        assert 'data-total-rows="3"' in html
+        assert html.count("chirpui-table__select-row") == 3
+        html = tpl.render(gen=records(), mode="aria_grid")
+        assert 'data-total-rows="3"' in html
+        assert_element(html, "div", {"role": "grid", "aria-rowcount": "4"})
+        assert html.count("chirpui-table__select-row") == 3
+
+    def test_one_shot_record_rows_source_streams_with_total_rows(self, env: Environment) -> None:
+        gen = ({"id": i, "name": "x", "status": "", "notes": ""} for i in range(2))
+        html = env.from_string(
+            '{% from "chirpui/data_grid.html" import data_grid %}'
+            + self._cols()
+            + "{{ data_grid(columns=cols, rows=record_rows(gen, cols), sort_url='/users', "
+            "selection_id='users', total_rows=500) }}"
+        ).render(gen=gen)
+        assert 'data-total-rows="500"' in html
+        assert "chirpui-table__empty" not in html
+
+    def test_empty_record_rows_source_renders_empty_message(self, env: Environment) -> None:
+        html = self._render(
+            env,
+            "{{ data_grid(columns=cols, rows=record_rows([], cols), sort_url='/users', "
+            "selection_id='g', empty_message='Nobody here') }}",
+        )
+        assert "Nobody here" in html
+
+    def test_aria_grid_mode_renders_role_grid_window(self, env: Environment) -> None:
+        # #261: the ARIA-grid mode renders a div role="grid" over one row window
+        # with spacers sized from the GridWindow, not a <table>.
+        html = self._render(
+            env,
+            "{% set win = grid_window(1000, 3600, row_height=36, viewport_rows=1, overscan=0) %}"
+            "{{ data_grid(title='Users', columns=cols, rows=[['Ada','Active','n']], "
+            "row_ids=['101'], sort_url='/users', selection_id='users', "
+            "render_mode='aria_grid', window=win, window_url='/users/window') }}",
+        )
+        assert "<table" not in html
+        assert "chirpui-data-grid--aria-grid" in html
+        assert_element(html, "div", {"role": "grid", "aria-rowcount": "1001"})
+        assert 'aria-colcount="3"' in html
+        assert 'role="columnheader"' in html
+        assert 'aria-sort="ascending"' in html
+        # Window row 100 is result-set row 101 → aria-rowindex 102 (header is 1).
+        assert 'aria-rowindex="102"' in html
+        assert 'style="block-size: 3600px"' in html
+        assert f'style="block-size: {(1000 - 101) * 36}px"' in html
+        assert 'x-data="chirpuiGridWindow()"' in html
+        assert 'hx-get="/users/window"' in html
+        assert 'hx-trigger="chirpui:grid-window"' in html
+        assert 'name="scroll_top" value="3600"' in html
+        # No load-more/pagination footer in windowed mode.
+        assert "chirpui-data-grid__load-more" not in html
+
+    def test_data_grid_window_fragment_renders_rows_and_spacers(self, env: Environment) -> None:
+        html = env.from_string(
+            '{% from "chirpui/data_grid.html" import data_grid_window %}'
+            + self._cols()
+            + "{{ data_grid_window(cols, [['Ada','Active','n'],['Bob','Idle','m']], "
+            "grid_window(50, 0, viewport_rows=2, overscan=0), row_ids=['1','2']) }}"
+        ).render()
+        assert html.count('role="row"') == 2
+        assert html.count("chirpui-data-grid__spacer") == 2
+        assert 'data-window-start="0"' in html
+        assert 'data-window-stop="2"' in html
+        assert "<section" not in html
+
 
 class TestSplitPanel:
     def test_basic(self, env: Environment) -> None:
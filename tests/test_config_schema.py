@@ -5,7 +5,13 @@ tests/test_grid_state.py. Locks the typed-projection contract config_form
 renders from.
 """
 
-from chirp_ui.config_schema import Field, ProjectedField, Widget, project_fields
+import asyncio
+import math
+import threading
+
+import pytest
+
+from chirp_ui.config_schema import CompiledSchema, Field, ProjectedField, Widget, project_fields
 
 
 def test_explicit_widget_wins() -> None:
@@ -58,3 +64,141 @@ def test_required_when_no_default_and_not_secret() -> None:
     assert project_fields([Field("q")])[0].required is True
     assert project_fields([Field("q", default="")])[0].required is False
     assert project_fields([Field("k", secret=True)])[0].required is False
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _counting(*choices: tuple[str, str]):
+    calls: list[int] = []
+
+    def options() -> list[tuple[str, str]]:
+        calls.append(1)
+        return list(choices)
+
+    return options, calls
+
+
+def test_project_fields_calls_options_callable_every_time() -> None:
+    options, calls = _counting(("x", "X"))
+    schema = [Field("model", options_callable=options)]
+    project_fields(schema)
+    project_fields(schema)
+    assert len(calls) == 2
+
+
+def test_compiled_schema_matches_project_fields() -> None:
+    schema = [
+        Field("model", default="a", choices=(("a", "A"),)),
+        {"name": "stream", "type": "bool", "default": True},
+        Field("api_key", secret=True),
+        Field("temp", type="float", min=0, max=2, step=0.1),
+    ]
+    values = {"model": "a", "api_key": "sk-real", "temp": 1.5}
+    assert CompiledSchema(schema).project(values) == project_fields(schema, values)
+
+
+def test_compiled_schema_caches_choices_until_ttl() -> None:
+    clock = _Clock()
+    options, calls = _counting(("x", "X"))
+    compiled = CompiledSchema([Field("model", options_callable=options)], clock=clock)
+    compiled.project()
+    clock.now = 59.0
+    assert compiled.project()[0].choices == ({"value": "x", "label": "X"},)
+    assert len(calls) == 1
+    clock.now = 60.0
+    compiled.project()
+    assert len(calls) == 2
+
+
+def test_compiled_schema_per_field_ttl_and_invalidate() -> None:
+    clock = _Clock()
+    fast, fast_calls = _counting(("f", "F"))
+    pinned, pinned_calls = _counting(("p", "P"))
+    compiled = CompiledSchema(
+        [
+            Field("fast", options_callable=fast, options_ttl=0),
+            {"name": "pinned", "options_callable": pinned, "options_ttl": math.inf},
+        ],
+        clock=clock,
+    )
+    compiled.project()
+    clock.now = 10**9
+    compiled.project()
+    assert (len(fast_calls), len(pinned_calls)) == (2, 1)
+    compiled.invalidate("pinned")
+    assert compiled.choices("pinned") == ({"value": "p", "label": "P"},)
+    assert len(pinned_calls) == 2
+    with pytest.raises(KeyError):
+        compiled.choices("missing")
+
+
+def test_sync_project_rejects_async_options_callable() -> None:
+    async def options() -> list[tuple[str, str]]:
+        return [("x", "X")]
+
+    with pytest.raises(TypeError, match="aproject"):
+        CompiledSchema([Field("model", options_callable=options)]).project()
+
+
+@pytest.mark.asyncio
+async def test_aproject_resolves_options_concurrently() -> None:
+    started: list[str] = []
+    gate = asyncio.Event()
+
+    def make(name: str):
+        async def options() -> list[tuple[str, str]]:
+            started.append(name)
+            if len(started) == 2:
+                gate.set()
+            await asyncio.wait_for(gate.wait(), 1)  # deadlocks if resolved serially
+            return [(name, name.upper())]
+
+        return options
+
+    sync_options, sync_calls = _counting(("s", "S"))
+    compiled = CompiledSchema(
+        [
+            Field("a", options_callable=make("a")),
+            Field("b", options_callable=make("b")),
+            Field("c", options_callable=sync_options),
+            Field("d", choices=(("d", "D"),)),
+        ]
+    )
+    fields = await compiled.aproject({"a": "a"})
+    assert [pf.choices[0]["value"] for pf in fields] == ["a", "b", "s", "d"]
+    assert fields[0].value == "a"
+    assert sorted(started) == ["a", "b"]
+
+    await compiled.aproject()
+    assert len(started) == 2  # cached
+    assert len(sync_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_aproject_offloads_sync_callables_only_when_asked() -> None:
+    threads: dict[str, int] = {}
+
+    def make(name: str):
+        def options() -> list[tuple[str, str]]:
+            threads[name] = threading.get_ident()
+            return [(name, name)]
+
+        return options
+
+    compiled = CompiledSchema(
+        [
+            Field("inline", options_callable=make("inline")),
+            Field("worker", options_callable=make("worker"), offload=True),
+            {"name": "from_dict", "options_callable": make("from_dict"), "offload": True},
+        ]
+    )
+    await compiled.aproject()
+    assert threads["inline"] == threading.get_ident()
+    assert threads["worker"] != threading.get_ident()
+    assert threads["from_dict"] != threading.get_ident()
@@ -0,0 +1,106 @@
+"""Tests for critical-CSS extraction (chirp_ui.critical_css)."""
+
+from __future__ import annotations
+
+import re
+
+from chirp_ui.critical_css import CriticalCss, extract_critical_css, page_classes
+from chirp_ui.css_subset import DEFAULT_FOUNDATION_PARTIALS
+
+SHELL = (
+    "<html><head></head><body>"
+    '<div class="chirpui-app-shell">'
+    '<aside class="chirpui-sidebar"><a class="chirpui-sidebar__link">Home</a></aside>'
+    '<main><div class="chirpui-card"><div class="chirpui-card__body">Hi</div></div></main>'
+    "</div>" + "<p>filler</p>" * 500 + '<div class="chirpui-modal">below the fold</div>'
+    "</body></html>"
+)
+
+BUILT = """\
+/* header */
+@layer chirpui.reset, chirpui.component;
+
+/* === partials/001_tokens.css === */
+@layer chirpui.component {
+:root { --chirpui-x: 1px; }
+}
+
+/* === partials/045_card.css === */
+@layer chirpui.component {
+.chirpui-card { padding: var(--chirpui-x); animation: chirpui-pop 1s; }
+.chirpui-card--flush { padding: 0; }
+.chirpui-card__body :is(p, .chirpui-card__lead) { margin: 0; }
+.chirpui-card:not(.chirpui-card--flush) { border: 1px solid; }
+@media (min-width: 40rem) {
+  .chirpui-card--wide { width: 100%; }
+}
+@keyframes chirpui-pop { from { opacity: 0; } }
+@keyframes chirpui-unused { from { opacity: 0; } }
+}
+
+/* === partials/130_modal.css === */
+@layer chirpui.component {
+.chirpui-modal { position: fixed; }
+}
+"""
+
+
+def test_page_classes_collects_chirpui_classes_only() -> None:
+    html = "<div class=\"chirpui-card x-custom\"><span class='chirpui-badge'></span></div>"
+    assert page_classes(html) == {"chirpui-card", "chirpui-badge"}
+
+
+def test_page_classes_fold_limits_to_first_viewport() -> None:
+    assert "chirpui-modal" in page_classes(SHELL)
+    assert "chirpui-modal" not in page_classes(SHELL, fold_bytes=2_000)
+    assert "chirpui-app-shell" in page_classes(SHELL, fold_bytes=2_000)
+
+
+def test_extract_prunes_rules_to_present_classes() -> None:
+    html = '<div class="chirpui-card"><div class="chirpui-card__body"></div></div>'
+    critical = extract_critical_css(html, stylesheet=BUILT)
+    css = critical.css
+    assert css.startswith("@layer chirpui.reset, chirpui.component;")
+    assert ":root{--chirpui-x: 1px;}" in css
+    assert ".chirpui-card{" in css
+    assert ".chirpui-card__body :is(p, .chirpui-card__lead){" in css
+    assert ".chirpui-card:not(.chirpui-card--flush){" in css
+    assert ".chirpui-card--flush{" not in css
+    assert "@media" not in css  # its only rule needs an absent modifier
+    assert ".chirpui-modal" not in css
+    assert "partials/130_modal.css" not in critical.partial_paths
+
+
+def test_extract_keeps_only_referenced_keyframes() -> None:
+    css = extract_critical_css('<i class="chirpui-card"></i>', stylesheet=BUILT).css
+    assert "@keyframes chirpui-pop" in css
+    assert "chirpui-unused" not in css
+
+
+def test_extract_from_shipped_stylesheet_is_much_smaller() -> None:
+    from chirp_ui.critical_css import CHIRPUI_CSS
+
+    critical = extract_critical_css(SHELL, fold_bytes=2_000)
+    assert set(critical.partial_paths) >= DEFAULT_FOUNDATION_PARTIALS
+    assert ".chirpui-app-shell" in critical.css
+    assert critical.size * 5 < CHIRPUI_CSS.stat().st_size
+    assert critical.css.startswith("@layer chirpui.reset, chirpui.token")
+
+
+def test_head_tags_inline_and_defer() -> None:
+    critical = CriticalCss(css="a{color:red}</style>", classes=frozenset(), partial_paths=())
+    tags = critical.head_tags("/static/chirpui.css?v=1&x=2", nonce="abc")
+    assert tags.startswith('<style data-chirpui-critical nonce="abc">a{color:red}<\\/style>')
+    assert (
+        '<link rel="preload" as="style" href="/static/chirpui.css?v=1&amp;x=2"'
+        " data-chirpui-deferred>"
+    ) in tags
+    assert '<script nonce="abc">' in tags
+    assert "link[data-chirpui-deferred]" in tags
+    assert '<noscript><link rel="stylesheet" href="/static/chirpui.css?v=1&amp;x=2">' in tags
+
+
+def test_head_tags_have_no_inline_event_handlers() -> None:
+    # CSP without script 'unsafe-inline' blocks on*= attributes even with a nonce.
+    tags = CriticalCss(css="", classes=frozenset(), partial_paths=()).head_tags(nonce="n")
+    assert not re.search(r"\son[a-z]+\s*=", tags, re.IGNORECASE)
@@ -0,0 +1,57 @@
+"""Tests for chirp_ui.form_state — one-pass error normalization for forms.html."""
+
+import pytest
+
+from chirp_ui.filters import field_errors
+from chirp_ui.form_state import FieldState, FormState, field_state, form_state
+from chirp_ui.validation import ChirpUIValidationWarning
+
+ERRORS = {"email": ["Required", "Must be valid"], "name": [], "age": ("Too young",)}
+
+
+def test_form_state_precomputes_field_states() -> None:
+    state = form_state(ERRORS, names=("email", "bio"))
+    email = state.field("email")
+    assert email == FieldState(
+        name="email",
+        errors=("Required", "Must be valid"),
+        field_id="field-email",
+        errors_id="errors-email",
+        invalid=True,
+        aria_invalid="true",
+    )
+    assert state.invalid_fields == ("email", "age")
+    assert (state.has_errors, state.error_count) == (True, 2)
+    assert state.fields["bio"].aria_invalid is None
+    assert not state.field("unknown").invalid  # clean state on demand
+
+
+def test_form_state_is_an_errors_mapping() -> None:
+    state = form_state(ERRORS)
+    assert dict(state) == {"email": ("Required", "Must be valid"), "age": ("Too young",)}
+    assert "name" not in state
+    for name in ("email", "name", "age", "missing"):
+        assert field_errors(state, name) == field_errors(ERRORS, name)
+
+
+def test_form_state_coerces_non_list_values_with_warning() -> None:
+    with pytest.warns(ChirpUIValidationWarning, match="expected list/tuple"):
+        state = form_state({"email": "Required"})
+    assert state["email"] == ("Required",)
+
+
+@pytest.mark.parametrize("errors", [None, "", [], {}])
+def test_form_state_empty_inputs(errors: object) -> None:
+    state = form_state(errors)
+    assert isinstance(state, FormState)
+    assert not state.has_errors
+    assert form_state(state) is state
+
+
+def test_field_state_accepts_every_errors_shape() -> None:
+    state = form_state(ERRORS)
+    from_state = field_state("email", state)
+    assert field_state("email", ERRORS) == from_state
+    assert field_state("email", from_state) is from_state
+    assert field_state("email", None) == FieldState.build("email")
+    assert field_state("email", "not a mapping").errors == ()
@@ -0,0 +1,163 @@
+"""Tests for chirp_ui.fragment_cache — LRU/TTL fragment cache with tag invalidation."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from chirp_ui.fragment_cache import (
+    CacheEntry,
+    CacheInfo,
+    FileStore,
+    FragmentCache,
+    FragmentStore,
+    MemoryStore,
+    cache_key,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> _Clock:
+    return _Clock()
+
+
+def test_cache_key_without_vary_is_the_key() -> None:
+    assert cache_key("stats") == "stats"
+    assert cache_key("stats", None) == "stats"
+
+
+def test_cache_key_vary_forms() -> None:
+    assert cache_key("b", 7) == cache_key("b", (7,)) == cache_key("b", ["7"])
+    assert cache_key("b", {"z": 1, "a": 2}) == cache_key("b", {"a": 2, "z": 1})
+    assert cache_key("b", (1, 2)) != cache_key("b", (2, 1))
+    # The separator keeps "a" + vary "b" apart from a literal key "a b".
+    assert cache_key("a", "b") != cache_key("a b")
+
+
+def test_get_set_roundtrip_and_info(clock: _Clock) -> None:
+    cache = FragmentCache(clock=clock)
+    assert cache.get("k") is None
+    assert cache.set("k", "<p>x</p>") == "<p>x</p>"
+    assert cache.get("k") == "<p>x</p>"
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.size) == (1, 1, 1)
+
+
+def test_ttl_expiry(clock: _Clock) -> None:
+    cache = FragmentCache(clock=clock, default_ttl=10)
+    cache.set("short", "a", ttl=5)
+    cache.set("default", "b")
+    clock.now += 6
+    assert cache.get("short") is None
+    assert cache.get("default") == "b"
+    clock.now += 5
+    assert cache.get("default") is None
+    assert len(cache.store) == 0
+
+
+def test_ttl_none_default_never_expires(clock: _Clock) -> None:
+    cache = FragmentCache(clock=clock, default_ttl=None)
+    cache.set("k", "v")
+    clock.now += 10**9
+    assert cache.get("k") == "v"
+
+
+def test_non_positive_ttl_skips_write(clock: _Clock) -> None:
+    cache = FragmentCache(clock=clock)
+    assert cache.set("k", "v", ttl=0) == "v"
+    assert cache.get("k") is None
+
+
+def test_lru_eviction_respects_recent_reads() -> None:
+    cache = FragmentCache(max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")  # b is now least recently used
+    cache.set("c", "3")
+    assert cache.get("a") == "1"
+    assert cache.get("b") is None
+    assert cache.get("c") == "3"
+
+
+def test_fetch_renders_only_on_miss() -> None:
+    cache = FragmentCache()
+    calls: list[int] = []
+
+    def render() -> str:
+        calls.append(1)
+        return f"<b>{len(calls)}</b>"
+
+    assert cache.fetch("k", render, vary=1) == "<b>1</b>"
+    assert cache.fetch("k", render, vary=1) == "<b>1</b>"
+    assert cache.fetch("k", render, vary=2) == "<b>2</b>"
+    assert len(calls) == 2
+
+
+def test_invalidate_and_invalidate_tag() -> None:
+    cache = FragmentCache()
+    cache.set("stats", "s", vary=1, tags=("team:1", "stats"))
+    cache.set("stats", "s", vary=2, tags=("team:2", "stats"))
+    cache.set("feed", "f", tags="team:1")
+    assert cache.invalidate("stats", vary=2) is True
+    assert cache.invalidate("stats", vary=2) is False
+    assert cache.invalidate_tag("team:1") == 2
+    assert len(cache.store) == 0
+
+
+def test_clear_resets_counters() -> None:
+    cache = FragmentCache()
+    cache.set("k", "v")
+    cache.get("k")
+    cache.clear()
+    assert cache.cache_info() == CacheInfo(0, 0, 0)
+
+
+def test_stores_satisfy_protocol(tmp_path: Path) -> None:
+    assert isinstance(MemoryStore(), FragmentStore)
+    assert isinstance(FileStore(tmp_path), FragmentStore)
+
+
+def test_file_store_shared_between_instances(tmp_path: Path, clock: _Clock) -> None:
+    writer = FragmentCache(FileStore(tmp_path), clock=clock)
+    reader = FragmentCache(FileStore(tmp_path), clock=clock)
+    writer.set("stats", "<p>42</p>", vary="u1", tags="stats")
+    assert reader.get("stats", "u1") == "<p>42</p>"
+    assert reader.invalidate_tag("stats") == 1
+    assert writer.get("stats", "u1") is None
+
+
+def test_file_store_evicts_oldest(tmp_path: Path) -> None:
+    store = FileStore(tmp_path, max_entries=2)
+    for i, key in enumerate("abc"):
+        store.set(key, CacheEntry(key))
+        # Deterministic mtimes; a real store relies on wall-clock ordering.
+        os.utime(store._path(key), (i, i))
+    assert len(store) == 2
+    assert store.get("a") is None
+    assert store.get("c") == CacheEntry("c")
+
+
+def test_file_store_drops_corrupt_files(tmp_path: Path) -> None:
+    store = FileStore(tmp_path)
+    store.set("k", CacheEntry("v"))
+    store._path("k").write_text("{not json", encoding="utf-8")
+    assert store.get("k") is None
+    assert len(store) == 0
+
+
+def test_file_store_shared_location() -> None:
+    store = FileStore.shared("chirpui-fragments-test")
+    try:
+        store.set("k", CacheEntry("v"))
+        assert store.get("k") == CacheEntry("v")
+    finally:
+        store.clear()
+        store.directory.rmdir()
@@ -0,0 +1,49 @@
+"""Tests for chirp_ui.glyph_metrics advance-table width estimates."""
+
+import pytest
+
+from chirp_ui._glyph_tables import TABLES
+from chirp_ui.glyph_metrics import FONT_TOKEN_TABLES, font_table, text_width_em
+
+
+def test_tables_cover_printable_ascii() -> None:
+    assert set(TABLES) == {"sans", "sans-bold", "mono", "mono-bold"}
+    for table in TABLES.values():
+        assert len(table) == 0x7E - 0x20 + 1
+        assert all(0 < w <= 1100 for w in table)
+
+
+def test_proportional_widths_differ_by_glyph() -> None:
+    assert text_width_em("iiii") < text_width_em("MMMM") / 3
+    assert text_width_em("Settings") == pytest.approx(3.613)
+    assert text_width_em("Settings", weight=600) > text_width_em("Settings")
+
+
+def test_intermediate_weights_interpolate_between_tables() -> None:
+    regular, bold = text_width_em("Settings"), text_width_em("Settings", weight=700)
+    assert bold == pytest.approx(3.945)
+    assert text_width_em("Settings", weight=500) == pytest.approx(regular + (bold - regular) / 3)
+    assert text_width_em("Settings", weight=300) == regular
+    assert text_width_em("Settings", weight=900) == bold
+
+
+@pytest.mark.parametrize(
+    ("font", "family"),
+    [
+        ("--chirpui-ui-font-family", "sans"),
+        ("prose-font-family", "sans"),
+        ("--chirpui-font-mono", "mono"),
+        ('"JetBrains Mono", ui-monospace, monospace', "mono"),
+        ("Inter, system-ui, sans-serif", "sans"),
+    ],
+)
+def test_font_table_selected_by_token_or_stack(font: str, family: str) -> None:
+    assert font_table(font) is TABLES[family]
+    assert font_table(font, 700) is TABLES[f"{family}-bold"]
+    assert FONT_TOKEN_TABLES.get(font, family) == family
+
+
+def test_non_ascii_fallbacks() -> None:
+    assert text_width_em("設定", "mono") == 2.0  # wide glyphs are one em each
+    assert text_width_em("e\u0301") == text_width_em("e")  # combining marks add nothing
+    assert 0.4 < text_width_em("ß") < 0.7
@@ -5,6 +5,7 @@ tests/test_route_tabs-style coverage. Locks the typed-projection contract the
 data_grid macro renders from.
 """
 
+from dataclasses import dataclass
 from urllib.parse import parse_qs, urlsplit
 
 import pytest
@@ -12,12 +13,21 @@ import pytest
 from chirp_ui.grid_state import (
     Column,
     ColumnSort,
+    GridRow,
     GridSort,
+    GridWindow,
+    RowSource,
     column_aria_sort,
+    grid_rows,
+    grid_template_columns,
+    grid_window,
     parse_sort,
+    record_rows,
+    row_count,
     selection_state,
     sort_columns,
     sort_query,
+    url_template,
 )
 
 # ── parse_sort ─────────────────────────────────────────────────────────
@@ -290,3 +300,208 @@ def test_coerce_column_width_from_dict() -> None:
     assert col.width == "1fr"
     assert col.mobile_width == "64px"
     assert col.resizable is True
+
+
+def test_sort_columns_carries_width_hints() -> None:
+    cols = sort_columns(
+        [Column("name", "Name", sortable=True, width="12rem", mobile_width="8rem", resizable=True)],
+        GridSort("name", "asc"),
+        base_url="/users",
+    )
+    assert cols[0].width == "12rem"
+    assert cols[0].mobile_width == "8rem"
+    assert cols[0].resizable is True
+
+
+# ── grid_template_columns ──────────────────────────────────────────────
+
+
+def test_grid_template_columns_uses_width_hints() -> None:
+    cols = [Column("name", "Name", width="12rem"), Column("notes", "Notes")]
+    assert grid_template_columns(cols) == "12rem minmax(0, 1fr)"
+
+
+def test_grid_template_columns_selectable_prepends_select_track() -> None:
+    tracks = grid_template_columns([Column("name", "Name")], selectable=True)
+    assert tracks.startswith("var(--chirpui-data-grid-select-width")
+    assert tracks.endswith("minmax(0, 1fr)")
+
+
+def test_grid_template_columns_mobile_falls_back_to_width() -> None:
+    cols = [
+        {"key": "a", "label": "A", "width": "10rem", "mobile_width": "5rem"},
+        {"key": "b", "label": "B", "width": "6rem"},
+    ]
+    assert grid_template_columns(cols, mobile=True) == "5rem 6rem"
+
+
+# ── grid_window ────────────────────────────────────────────────────────
+
+
+def test_grid_window_top_of_result_set() -> None:
+    win = grid_window(10_000, None, row_height=36, viewport_rows=20, overscan=10)
+    assert (win.start, win.stop) == (0, 30)
+    assert win.top_spacer == 0
+    assert win.bottom_spacer == (10_000 - 30) * 36
+
+
+def test_grid_window_mid_scroll_includes_overscan() -> None:
+    win = grid_window(10_000, "3600.5", row_height=36, viewport_rows=20, overscan=10)
+    # offset 3600 → first visible row 100; 10 rows overscan on each side.
+    assert (win.start, win.stop) == (90, 130)
+    assert win.size == 40
+    # scroll_top echoes the requested offset, not the overscanned start row's.
+    assert win.scroll_top == 3600
+    assert win.top_spacer == 90 * 36
+
+
+def test_grid_window_spacers_cover_full_height() -> None:
+    win = grid_window(500, 7200, row_height=24)
+    assert win.top_spacer + win.size * 24 + win.bottom_spacer == 500 * 24
+
+
+@pytest.mark.parametrize("raw", ["garbage", "-50", "nan", "inf", ""])
+def test_grid_window_defensive_offsets(raw: str) -> None:
+    win = grid_window(100, raw, row_height=10, viewport_rows=5, overscan=0)
+    assert 0 <= win.start <= win.stop <= 100
+
+
+def test_grid_window_past_end_clamps_to_last_rows() -> None:
+    win = grid_window(100, 10**9, row_height=10, viewport_rows=5, overscan=2)
+    assert win.stop == 100
+    assert win.start == 97
+    assert win.scroll_top == 100 * 10
+
+
+def test_grid_window_empty_result_set() -> None:
+    win = grid_window(0, 500)
+    assert win == GridWindow(start=0, stop=0, total=0, row_height=36)
+    assert win.bottom_spacer == 0
+
+
+def test_grid_window_aria_rowindex_accounts_for_header_row() -> None:
+    win = grid_window(1000, 36 * 50, row_height=36, overscan=0)
+    assert win.aria_rowindex(0) == 52
+
+
+# ── url_template ───────────────────────────────────────────────────────
+
+
+def test_url_template_matches_per_column_build() -> None:
+    tpl = url_template("/users?page=2&sort=old", "sort", {"q": "a b", "status": ""})
+    assert tpl.url("-name") == "/users?page=2&q=a+b&sort=-name"
+
+
+def test_url_template_extra_params_replace_base_params() -> None:
+    tpl = url_template("/users?q=old&page=2", "sort", {"q": "new"})
+    assert tpl.url("name") == "/users?page=2&q=new&sort=name"
+
+
+def test_url_template_keeps_scheme_netloc_fragment() -> None:
+    tpl = url_template("https://h.example/users?x=1#top", "sort")
+    assert tpl.url("name") == "https://h.example/users?x=1&sort=name#top"
+
+
+def test_url_template_pattern_leaves_placeholder_unencoded() -> None:
+    tpl = url_template("/users", "page", {"sort": "-name"})
+    assert tpl.pattern() == "/users?sort=-name&page={page}"
+
+
+def test_url_template_action_and_hidden_fields() -> None:
+    tpl = url_template("/users?q=old&sort=name", "q", {"status": "open"})
+    assert tpl.action == "/users"
+    assert tpl.hidden_fields == (("sort", "name"), ("status", "open"))
+
+
+def test_url_template_is_cached_per_state() -> None:
+    a = url_template("/users", "sort", {"q": "x"})
+    b = url_template("/users", "sort", {"q": "x"})
+    assert a is b
+
+
+def test_sort_columns_builds_one_template_for_all_columns() -> None:
+    cols = [Column(f"c{i}", f"C{i}", sortable=True) for i in range(30)]
+    out = sort_columns(cols, GridSort("c3", "asc"), "/users?page=2", extra_params={"q": "x"})
+    assert out[3].next_url == "/users?page=2&q=x&sort=-c3"
+    assert out[4].next_url == "/users?page=2&q=x&sort=c4"
+
+
+# ── record_rows / grid_rows ────────────────────────────────────────────
+
+
+@dataclass
+class _User:
+    id: int
+    name: str
+    seats: int | None
+
+
+_USER_COLS = [Column("name", "Name"), Column("seats", "Seats")]
+
+
+def test_record_rows_reads_attributes_and_mappings() -> None:
+    src = record_rows([_User(1, "Ada", 3), {"id": 2, "name": "Bob", "seats": 5}], _USER_COLS)
+    rows = [(r.id, r.label, list(r.cells)) for r in grid_rows(src)]
+    assert rows == [("1", "1", ["Ada", 3]), ("2", "2", ["Bob", 5])]
+
+
+def test_record_rows_label_key_and_none_cells() -> None:
+    src = record_rows([_User(7, "Ada", None)], _USER_COLS, label_key="name")
+    (row,) = grid_rows(src)
+    assert row.label == "Ada"
+    assert list(row.cells) == ["Ada", ""]
+
+
+def test_record_rows_getters_compute_cells() -> None:
+    src = record_rows(
+        [_User(1, "Ada", 3)], _USER_COLS, getters={"seats": lambda u: f"{u.seats} seats"}
+    )
+    (row,) = grid_rows(src)
+    assert list(row.cells) == ["Ada", "3 seats"]
+
+
+def test_record_rows_is_lazy_over_one_shot_iterators() -> None:
+    seen: list[int] = []
+
+    def records():
+        for i in range(3):
+            seen.append(i)
+            yield _User(i, f"u{i}", i)
+
+    src = record_rows(records(), _USER_COLS)
+    assert isinstance(src, RowSource)
+    assert seen == []
+    it = grid_rows(src)
+    next(it)
+    assert seen == [0]
+    assert bool(src) is True
+    with pytest.raises(TypeError, match="sized"):
+        len(src)
+    with pytest.raises(TypeError, match="sized"):
+        src.ids()
+    assert seen == [0]
+
+
+def test_record_rows_sized_truthiness_and_ids() -> None:
+    assert not record_rows([], _USER_COLS)
+    src = record_rows([_User(4, "a", 1), _User(5, "b", 2)], _USER_COLS)
+    assert len(src) == 2
+    assert list(src.ids()) == ["4", "5"]
+
+
+def test_row_count_is_none_for_one_shot_sources() -> None:
+    assert row_count(None) == 0
+    assert row_count([["Ada"], ["Bob"]]) == 2
+    assert row_count(record_rows([_User(1, "a", 1)], _USER_COLS)) == 1
+    assert row_count(record_rows(iter([_User(1, "a", 1)]), _USER_COLS)) is None
+    assert row_count(r for r in [["Ada"]]) is None
+
+
+def test_grid_rows_legacy_lists_with_parallel_ids() -> None:
+    rows = list(grid_rows([["Ada"], ["Bob"]], row_ids=["a"], row_labels=["", "Bobby"], start=10))
+    assert rows == [GridRow("a", "a", ["Ada"]), GridRow("11", "Bobby", ["Bob"])]
+
+
+def test_plain_lists_are_not_row_sources() -> None:
+    assert not isinstance([["Ada"]], RowSource)
+    assert list(grid_rows(None)) == []
@@ -0,0 +1,91 @@
+"""Tests for chirp_ui.nav_index compiled nav matching."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from chirp_ui.nav_index import NavIndex, nav_index
+from chirp_ui.nav_pill import nav_pill_inline_style
+from chirp_ui.route_tabs import tab_is_active
+
+TABS = (
+    {"label": "Overview", "href": "/skills"},
+    {"label": "Settings", "href": "/settings", "match": "prefix", "icon": "gear"},
+    {"label": "Billing", "href": "/settings/billing"},
+    {"label": "Draft", "href": ""},
+)
+
+DOCS = [
+    {
+        "title": "Guides",
+        "href": "/docs",
+        "match": "prefix",
+        "children": [
+            {
+                "title": "Forms",
+                "href": "/docs/forms",
+                "match": "prefix",
+                "children": [{"title": "Validation", "href": "/docs/forms/validation"}],
+            },
+        ],
+    },
+    {"title": "API", "href": "/api", "match": "prefix"},
+]
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["/skills", "/skills/x", "/settings", "/settings/", "/settings/general", "/settingsx", "/", ""],
+)
+def test_single_candidate_matches_tab_is_active(path: str) -> None:
+    index = NavIndex(TABS[:2])
+    hit = index.lookup(path)
+    expected = [t for t in TABS[:2] if tab_is_active(t, path)]
+    assert ([hit.item] if hit else []) == expected
+
+
+def test_exact_beats_prefix_and_deepest_prefix_wins() -> None:
+    index = NavIndex(TABS)
+    billing = index.lookup("/settings/billing")
+    assert billing is not None
+    assert billing.item is TABS[2]
+    assert index.is_active(TABS[2], "/settings/billing")
+    assert not index.is_active(TABS[1], "/settings/billing")  # tab_is_active would say True
+    assert index.lookup("/settings/billing/invoices").item is TABS[1]
+    assert index.lookup("/nope") is None
+
+
+def test_lookup_returns_ancestors_and_trail() -> None:
+    index = NavIndex(DOCS)
+    forms, validation = DOCS[0]["children"][0], DOCS[0]["children"][0]["children"][0]
+    hit = index.lookup("/docs/forms/validation")
+    assert hit.item is validation
+    assert hit.ancestors == (DOCS[0], forms)
+    assert hit.position == 0
+    assert index.lookup("/docs/forms/widgets").item is forms
+    assert index.in_trail(DOCS[0], "/docs/forms/widgets")
+    assert not index.in_trail(DOCS[1], "/docs/forms/widgets")
+    assert index.size == 4
+
+
+def test_pill_offsets_match_nav_pill_inline_style() -> None:
+    index = NavIndex(TABS)
+    for path in ("/skills", "/settings/general", "/nope"):
+        assert index.pill_style(path) == nav_pill_inline_style(TABS, path, index.is_active)
+    nested = NavIndex(DOCS)
+    assert nested.lookup("/api").pill_x > 0
+    assert nested.lookup("/docs/forms").pill_style == nested.pill_style("/docs")
+
+
+def test_object_items_and_custom_children_key() -> None:
+    leaf = SimpleNamespace(label="Leaf", href="/a/b")
+    root = SimpleNamespace(label="Root", href="/a", match="prefix", items=[leaf])
+    index = NavIndex([root], children_key="items")
+    assert index.lookup("/a/b").ancestors == (root,)
+
+
+def test_nav_index_caches_per_definition() -> None:
+    first = nav_index(DOCS)
+    assert nav_index(DOCS) is first
+    assert nav_index(first) is first
+    assert nav_index(list(DOCS)) is not first
@@ -42,3 +42,21 @@ def test_segmented_pill_inline_style_uses_active_flag() -> None:
     style = segmented_pill_inline_style(items)
     assert "--chirpui-pill-x:" in style
     assert not style.startswith("--chirpui-pill-x:0rem;")
+
+
+def test_estimate_nav_item_width_uses_glyph_advances() -> None:
+    narrow = estimate_nav_item_width_em({"label": "Illinois"})
+    wide = estimate_nav_item_width_em({"label": "MWMWMWMW"})
+    assert wide - narrow > 2.0  # same length, very different advances
+    # 2rem padding + "Settings" at weight 500 (3.613em regular, 3.945em bold,
+    # one third of the way) at --chirpui-font-sm.
+    label_em = 3.613 + (3.945 - 3.613) / 3
+    assert estimate_nav_item_width_em({"label": "Settings"}) == round(2.0 + label_em * 0.8125, 3)
+
+
+def test_nav_pill_inline_style_selects_table_by_font_token() -> None:
+    items = ({"label": "Illinois", "href": "/a"}, {"label": "Docs", "href": "/b"})
+    sans = nav_pill_inline_style(items, "/b", tab_is_active)
+    mono = nav_pill_inline_style(items, "/b", tab_is_active, font="--chirpui-code-font-family")
+    assert sans != mono
+    assert mono.startswith("--chirpui-pill-x:")
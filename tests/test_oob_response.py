@@ -0,0 +1,52 @@
+"""Tests for chirp_ui.oob_response — coalesced OOB updates."""
+
+import re
+
+from kida import Environment
+
+from chirp_ui.oob_response import OobResponse
+
+
+def test_same_target_collapses_to_last_write_in_first_position() -> None:
+    resp = OobResponse()
+    resp.badge("inbox-count", count=1).fragment("stats", "<p>a</p>").badge("inbox-count", count=4)
+    assert len(resp) == 2
+    assert [u["id"] for u in resp.updates] == ["inbox-count", "stats"]
+    assert resp.updates[0]["count"] == 4
+
+
+def test_toasts_stack_unless_keyed() -> None:
+    resp = OobResponse()
+    resp.toast("Saved").toast("Saved")
+    resp.toast("Syncing", key="sync").toast("Synced", key="sync", variant="success")
+    assert [u["message"] for u in resp.updates] == ["Saved", "Saved", "Synced"]
+    resp.discard("sync")
+    assert len(resp) == 2
+    assert not OobResponse()
+    assert OobResponse(main="<tr></tr>")
+
+
+def test_render_emits_each_target_once(env: Environment) -> None:
+    resp = OobResponse(main="<tr id='row-1'></tr>")
+    resp.badge("inbox-count", count=3)
+    resp.fill("activity", "<ul><li>read</li></ul>")
+    resp.toast("Marked as read", variant="success")
+    resp.badge("inbox-count", count=2)
+    html = resp.render(env)
+    assert html.startswith("<tr id='row-1'></tr>")
+    assert html.count('id="inbox-count"') == 1
+    assert 'aria-label="2 notifications"' in html
+    assert 'id="activity" hx-swap-oob="innerHTML"' in html
+    assert "<li>read</li>" in html
+    assert 'hx-swap-oob="beforeend:#chirpui-toasts"' in html
+    assert "Marked as read" in html
+
+
+def test_stream_matches_render(env: Environment) -> None:
+    resp = OobResponse(main="<p>main</p>")
+    for i in range(5):
+        resp.badge(f"b{i}", count=i)
+    chunks = list(resp.stream(env, batch_size=2))
+    assert chunks[0] == "<p>main</p>"
+    assert len(chunks) == 4
+    assert re.sub(r"\s+", "", "".join(chunks)) == re.sub(r"\s+", "", resp.render(env))
@@ -0,0 +1,167 @@
+"""Tests for chirp_ui.render_stream — chunked row-batch rendering."""
+
+import re
+from collections.abc import Iterator
+
+import pytest
+from kida import Environment
+
+from chirp_ui.grid_state import Column, GridSort, record_rows, sort_columns
+from chirp_ui.render_stream import (
+    _call_source,
+    astream_macro,
+    render_macro,
+    stream_grid_rows,
+    stream_list,
+    stream_macro,
+    stream_table,
+    stream_timeline,
+)
+
+
+def _squash(html: str) -> str:
+    return re.sub(r"\s+", " ", html).replace("> <", "><").strip()
+
+
+def _counting(n: int, seen: list[int]) -> Iterator[str]:
+    for i in range(n):
+        seen.append(i)
+        yield f"item {i}"
+
+
+def test_call_source_builds_named_call() -> None:
+    src = _call_source("chirpui/list.html", "list_items", ("items", "linked"), slot=False)
+    assert src == (
+        '{% from "chirpui/list.html" import list_items %}'
+        "{{ list_items(items=items, linked=linked) }}"
+    )
+
+
+def test_call_source_rejects_non_identifiers() -> None:
+    with pytest.raises(ValueError, match="not a valid"):
+        _call_source("chirpui/list.html", "list_items", ("items) }}{{ x",), slot=False)
+
+
+class _CallTemplate:
+    def __init__(self, source: str) -> None:
+        self.source = source
+
+    def render(self, **ctx: object) -> str:
+        return f"<{len(ctx['items'])}>" if "items" in ctx else "<x>"
+
+    def render_stream(self, **ctx: object) -> Iterator[str]:
+        yield self.render(**ctx)
+
+    async def render_stream_async(self, **ctx: object):
+        yield self.render(**ctx)
+
+
+class _CountingEnv:
+    def __init__(self) -> None:
+        self.compiled: list[str] = []
+
+    def from_string(self, source: str) -> _CallTemplate:
+        self.compiled.append(source)
+        return _CallTemplate(source)
+
+
+def test_call_templates_are_cached_on_the_environment() -> None:
+    a, b = _CountingEnv(), _CountingEnv()
+    for _ in range(3):
+        render_macro(a, "chirpui/list.html", "list_items", {"items": []})
+    render_macro(b, "chirpui/list.html", "list_items", {"items": []})
+    assert len(a.compiled) == 1
+    assert len(b.compiled) == 1
+    assert list(stream_macro(a, "chirpui/list.html", "list_items", range(5), batch_size=2)) == [
+        "<2>",
+        "<2>",
+        "<1>",
+    ]
+    assert len(a.compiled) == 1
+
+
+@pytest.mark.asyncio
+async def test_astream_macro_batches_async_sources() -> None:
+    pulled: list[int] = []
+
+    async def rows():
+        for i in range(5):
+            pulled.append(i)
+            yield i
+
+    env = _CountingEnv()
+    stream = astream_macro(env, "chirpui/list.html", "list_items", rows(), batch_size=2)
+    assert await anext(stream) == "<2>"
+    assert pulled == [0, 1]
+    assert [chunk async for chunk in stream] == ["<2>", "<1>"]
+    assert [c async for c in astream_macro(env, "chirpui/list.html", "list_items", [1])] == ["<1>"]
+
+
+def test_stream_list_yields_head_batches_tail(env: Environment) -> None:
+    chunks = list(stream_list(env, [f"item {i}" for i in range(5)], batch_size=2))
+    # <ul>, three batches (2 + 2 + 1), </ul>.
+    assert len(chunks) == 5
+    assert chunks[0].strip().startswith('<ul class="chirpui-list')
+    assert chunks[-1].strip() == "</ul>"
+    assert [c.count("chirpui-list__item") for c in chunks[1:-1]] == [2, 2, 1]
+
+
+def test_stream_list_matches_non_streamed_render(env: Environment) -> None:
+    items = ["a", "b", "c"]
+    whole = env.from_string(
+        '{% from "chirpui/list.html" import list_group %}{{ list_group(items, bordered=true) }}'
+    ).render(items=items)
+    streamed = "".join(stream_list(env, items, bordered=True, batch_size=2))
+    assert _squash(streamed) == _squash(whole)
+
+
+def test_stream_list_is_lazy(env: Environment) -> None:
+    seen: list[int] = []
+    gen = stream_list(env, _counting(10, seen), batch_size=3)
+    next(gen)  # head: no items pulled yet
+    assert seen == []
+    next(gen)  # first batch
+    assert seen == [0, 1, 2]
+
+
+def test_stream_table_offsets_positional_ids(env: Environment) -> None:
+    rows = [[f"r{i}"] for i in range(3)]
+    html = "".join(stream_table(env, rows, headers=["Name"], selectable=True, batch_size=2))
+    assert "<thead" in html
+    assert html.count("<tbody") == 1
+    assert 'value="2"' in html
+    assert 'aria-label="Select row 3"' in html
+
+
+def test_stream_timeline_renders_all_items(env: Environment) -> None:
+    items = [{"title": f"Event {i}", "date": "now"} for i in range(4)]
+    chunks = list(stream_timeline(env, items, batch_size=3))
+    html = "".join(chunks)
+    assert chunks[0].strip().startswith('<div class="chirpui-timeline')
+    assert html.count("chirpui-timeline__item") == 4
+
+
+def test_stream_grid_rows_emits_oob_sentinel_last(env: Environment) -> None:
+    cols = sort_columns([Column("name", "Name", sortable=True)], GridSort("name"), "/users")
+    src = record_rows([{"id": i, "name": f"u{i}"} for i in range(5)], cols, label_key="name")
+    chunks = list(
+        stream_grid_rows(
+            env,
+            cols,
+            src,
+            batch_size=2,
+            selectable=True,
+            selection_id="users",
+            load_more_url="/users?offset=5",
+            has_more=True,
+        )
+    )
+    assert [c.count("<tr ") for c in chunks[:-1]] == [2, 2, 1]
+    assert 'id="users-load-more"' in chunks[-1]
+    assert 'hx-swap-oob="true"' in chunks[-1]
+    assert 'aria-label="Select u4"' in "".join(chunks)
+
+
+def test_stream_macro_batch_size_floor(env: Environment) -> None:
+    chunks = list(stream_macro(env, "chirpui/list.html", "list_items", ["a", "b"], batch_size=0))
+    assert len(chunks) == 2
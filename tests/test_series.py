@@ -0,0 +1,90 @@
+"""Tests for chirp_ui.series downsampling and sparkline projection."""
+
+import math
+
+import pytest
+
+from chirp_ui.series import (
+    BAR_GLYPHS,
+    Series,
+    lttb_indices,
+    minmax_indices,
+    project_series,
+)
+from chirp_ui.validation import ChirpUIValidationWarning
+
+
+def test_short_series_matches_template_normalization() -> None:
+    values = [1, 5, 3, 7]
+    s = project_series(values)
+    assert s.values == (1, 5, 3, 7)
+    assert not s.downsampled
+    # Same arithmetic the template used: ((v - min) / range * 7) | int
+    assert s.levels == tuple(int((v - 1) / 6 * 7) for v in values)
+    assert s.bars == "▁▅▃█"
+    assert s.aria_label == "Sparkline: 1, 5, 3, 7"
+
+
+def test_flat_and_empty_series() -> None:
+    assert project_series([4, 4, 4]).levels == (0, 0, 0)
+    empty = project_series([])
+    assert empty.values == ()
+    assert empty.last is None
+    assert empty.aria_label == "Sparkline: "
+
+
+def test_lttb_bounds_output_and_keeps_endpoints() -> None:
+    values = [math.sin(i / 50) * 100 for i in range(50_000)]
+    kept = lttb_indices(values, 120)
+    assert len(kept) == 120
+    assert kept[0] == 0
+    assert kept[-1] == len(values) - 1
+    assert kept == sorted(set(kept))
+
+
+def test_minmax_keeps_spikes() -> None:
+    values = [1.0] * 10_000
+    values[1234] = 999.0
+    values[8000] = -5.0
+    kept = minmax_indices(values, 40)
+    assert len(kept) <= 40
+    assert 1234 in kept
+    assert 8000 in kept
+    s = project_series(values, width=40, method="minmax")
+    assert max(s.levels) == 7
+    assert min(s.levels) == 0
+
+
+def test_minmax_never_exceeds_width() -> None:
+    values = [3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0, 6.0]
+    assert len(minmax_indices(values, 1)) == 1
+    assert minmax_indices(values, 0) == []
+    assert len(project_series(values, width=1, method="minmax")) == 1
+
+
+def test_unknown_method_warns_and_falls_back_to_lttb() -> None:
+    values = [float(i % 7) for i in range(500)]
+    with pytest.warns(ChirpUIValidationWarning, match="bogus"):
+        s = project_series(values, width=20, method="bogus")
+    assert s == project_series(values, width=20)
+
+
+def test_large_series_gets_summarized_aria_label() -> None:
+    s = project_series(range(50_000), width=80)
+    assert len(s) == 80
+    assert s.downsampled
+    assert s.count == 50_000
+    assert s.aria_label == "Sparkline: 50000 points, min 0, max 49999, last 49999"
+    assert set(s.bars) <= set(BAR_GLYPHS)
+
+
+def test_rows_feed_bar_chart_and_series_passthrough() -> None:
+    s = project_series([3, 9, 6], labels=["mon", "tue", "wed"])
+    assert s.rows == (
+        {"label": "mon", "value": 3},
+        {"label": "tue", "value": 9},
+        {"label": "wed", "value": 6},
+    )
+    assert project_series(s) is s
+    assert isinstance(project_series(iter([1, 2])), Series)
+    assert project_series(range(10), width=None).count == len(project_series(range(10), width=None))
@@ -0,0 +1,225 @@
+"""Tests for chirp_ui.sse fan-out broker."""
+
+import asyncio
+
+import pytest
+
+from chirp_ui.sse import SSEBroker, SSEEvent, encode_event
+
+
+async def _drain(sub) -> list[str]:
+    return [frame async for frame in sub]
+
+
+def test_encode_event_splits_multiline_data() -> None:
+    assert encode_event("a\nb", event="fragment", id="7") == (
+        "id: 7\nevent: fragment\ndata: a\ndata: b\n\n"
+    )
+    assert encode_event("x") == "data: x\n\n"
+
+
+def test_unknown_policy_raises() -> None:
+    with pytest.raises(ValueError, match="policy"):
+        SSEBroker(policy="block")
+
+
+async def test_publish_fans_out_one_frame_to_every_subscriber() -> None:
+    broker = SSEBroker()
+    a = broker.subscribe("chat")
+    b = broker.subscribe("chat")
+    ev = broker.publish("chat", "<p>hi</p>")
+    broker.close("chat")
+    frames_a, frames_b = await _drain(a), await _drain(b)
+    assert frames_a == frames_b == [ev.wire, encode_event("", event="done", id="2")]
+    assert frames_a[0] is ev.wire
+    assert broker.subscriber_count("chat") == 0
+
+
+async def test_drop_policy_keeps_newest_frames() -> None:
+    broker = SSEBroker(queue_size=2)
+    sub = broker.subscribe("t")
+    for i in range(4):
+        broker.publish("t", str(i))
+    assert sub.dropped == 2
+    assert [await anext(sub), await anext(sub)] == [
+        encode_event("2", event="fragment", id="3"),
+        encode_event("3", event="fragment", id="4"),
+    ]
+    sub.close()
+    broker.publish("t", "4")
+    assert len(sub) == 0
+
+
+async def test_coalesce_policy_merges_same_event_frames() -> None:
+    broker = SSEBroker(queue_size=1, policy="coalesce")
+    sub = broker.subscribe("t")
+    broker.publish("t", "a")
+    broker.publish("t", "b")
+    broker.publish("t", "c")
+    assert sub.dropped == 0
+    assert await anext(sub) == SSEEvent.build("abc", event="fragment", id="3").wire
+
+
+async def test_last_event_id_replays_from_ring_buffer() -> None:
+    broker = SSEBroker(replay=3)
+    for i in range(5):
+        broker.publish("t", f"m{i}")
+    sub = broker.subscribe("t", last_event_id="3")
+    assert [await anext(sub), await anext(sub)] == [
+        encode_event("m3", event="fragment", id="4"),
+        encode_event("m4", event="fragment", id="5"),
+    ]
+    older = broker.subscribe("t", last_event_id="1")
+    assert len(older) == 3
+    assert len(broker.subscribe("t", last_event_id="nope")) == 0
+    assert len(broker.subscribe("t")) == 0
+
+
+async def test_replay_is_not_truncated_by_the_queue_bound() -> None:
+    broker = SSEBroker(queue_size=4)
+    for i in range(20):
+        broker.publish("t", f"m{i}")
+    sub = broker.subscribe("t", last_event_id="10")
+    assert len(sub) == 10
+    broker.publish("t", "live")
+    assert sub.dropped == 0
+    frames = [await anext(sub) for _ in range(11)]
+    assert frames[0] == encode_event("m10", event="fragment", id="11")
+    assert frames[-1] == encode_event("live", event="fragment", id="21")
+
+
+async def test_publish_to_closed_topic_raises() -> None:
+    broker = SSEBroker(linger=0)
+    broker.publish("t", "x")
+    broker.close("t")
+    with pytest.raises(RuntimeError, match="closed"):
+        broker.publish("t", "y")
+    broker.close("t")
+    await asyncio.sleep(0.01)
+    assert "t" not in broker._topics
+    broker.publish("t", "fresh")
+    assert broker._topics["t"].history[0].id == "1"
+
+
+async def test_closed_topic_replays_then_ends() -> None:
+    broker = SSEBroker()
+    broker.publish("t", "x")
+    broker.close("t")
+    frames = await _drain(broker.subscribe("t", last_event_id="0"))
+    assert [f.split("\n")[1] for f in frames] == ["event: fragment", "event: done"]
+
+
+async def test_producer_runs_once_for_all_subscribers_and_closes() -> None:
+    calls = 0
+    release = asyncio.Event()
+
+    def produce():
+        nonlocal calls
+        calls += 1
+
+        async def gen():
+            await release.wait()
+            yield "<b>1</b>"
+            yield ("status", "ok")
+
+        return gen()
+
+    broker = SSEBroker()
+    broker.register("job", produce)
+    streams = [broker.stream("job") for _ in range(3)]
+    tasks = [asyncio.create_task(_drain(s)) for s in streams]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+    assert calls == 1
+    assert all(r == results[0] for r in results)
+    assert [f.split("\n")[1] for f in results[0]] == [
+        "event: fragment",
+        "event: status",
+        "event: done",
+    ]
+
+
+async def test_producer_cancelled_when_last_subscriber_leaves() -> None:
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def gen():
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            cancelled.set()
+        yield ""
+
+    broker = SSEBroker(linger=0)
+    broker.register("t", gen)
+    sub = broker.subscribe("t")
+    await started.wait()
+    sub.close()
+    await asyncio.wait_for(cancelled.wait(), 1)
+    assert broker.subscriber_count("t") == 0
+
+
+async def test_reconnect_within_linger_resumes_producer_without_replaying_twice() -> None:
+    calls = 0
+    step = asyncio.Queue()
+
+    def produce():
+        nonlocal calls
+        calls += 1
+
+        async def gen():
+            while (item := await step.get()) is not None:
+                yield item
+
+        return gen()
+
+    broker = SSEBroker(linger=10)
+    broker.register("job", produce)
+    first = broker.subscribe("job")
+    step.put_nowait("a")
+    assert await anext(first) == encode_event("a", event="fragment", id="1")
+    first.close()
+    step.put_nowait("b")
+    await asyncio.sleep(0.01)
+    again = broker.subscribe("job", last_event_id="1")
+    step.put_nowait("c")
+    step.put_nowait(None)
+    frames = await _drain(again)
+    assert calls == 1
+    assert [f.split("\n")[2] for f in frames] == ["data: b", "data: c", "data: "]
+
+
+async def test_producer_error_is_logged_and_closes_topic(caplog) -> None:
+    async def gen():
+        yield "<b>1</b>"
+        raise RuntimeError("upstream gone")
+
+    broker = SSEBroker()
+    broker.register("t", gen)
+    frames = await asyncio.wait_for(_drain(broker.subscribe("t")), 1)
+    assert [f.split("\n")[1] for f in frames] == [
+        "event: fragment",
+        "event: error",
+        "event: done",
+    ]
+    assert "upstream gone" in caplog.text
+    assert "'t'" in caplog.text
+
+
+async def test_closed_topic_without_subscribers_is_reaped() -> None:
+    broker = SSEBroker(linger=0)
+    broker.publish("t", "x")
+    broker.close("t")
+    late = broker.subscribe("t", last_event_id="0")
+    assert len(late) == 2
+    await asyncio.sleep(0.01)
+    assert "t" not in broker._topics
+
+
+async def test_keepalive_comment_when_idle() -> None:
+    broker = SSEBroker(keepalive=0.01)
+    sub = broker.subscribe("t")
+    assert await anext(sub) == ": keepalive\n\n"
+    sub.close()
@@ -0,0 +1,101 @@
+"""Tests for chirp_ui.suspense — concurrent deferred-block resolution."""
+
+import asyncio
+
+from kida import Environment
+
+from chirp_ui.suspense import DEFAULT_FALLBACK, DeferredBlock, resolve_deferred
+
+
+async def _after(delay: float, html: str) -> str:
+    await asyncio.sleep(delay)
+    return html
+
+
+async def _boom() -> str:
+    raise RuntimeError("db down")
+
+
+async def test_fills_stream_in_completion_order(env: Environment) -> None:
+    fills = [
+        f
+        async for f in resolve_deferred(
+            env,
+            {
+                "slow": _after(0.05, "<p>slow</p>"),
+                "fast": _after(0, "<p>fast</p>"),
+            },
+        )
+    ]
+    assert len(fills) == 2
+    assert 'id="fast" hx-swap-oob="innerHTML"' in fills[0]
+    assert "<p>fast</p>" in fills[0]
+    assert "<p>slow</p>" in fills[1]
+
+
+async def test_timeouts_and_errors_get_fallback_fills(env: Environment) -> None:
+    fills = [
+        f
+        async for f in resolve_deferred(
+            env,
+            {
+                "hung": _after(10, "<p>never</p>"),
+                "broken": _boom,
+                "custom": DeferredBlock(_after(10, ""), timeout=0.01, fallback="<p>later</p>"),
+            },
+            timeout=0.02,
+        )
+    ]
+    joined = "".join(fills)
+    assert joined.count(DEFAULT_FALLBACK) == 2
+    assert "<p>later</p>" in joined
+    assert "never" not in joined
+
+
+async def test_macro_render_and_group_busy_clear(env: Environment) -> None:
+    fills = [
+        f
+        async for f in resolve_deferred(
+            env,
+            {
+                "inbox": DeferredBlock(
+                    _after(0, 7),
+                    "chirpui/oob.html",
+                    "counter_badge",
+                    param="count",
+                    kwargs={"id": "inbox-count"},
+                )
+            },
+            group_id="dashboard",
+        )
+    ]
+    assert len(fills) == 2
+    assert 'aria-label="7 notifications"' in fills[0]
+    assert 'id="dashboard-status"' in fills[1]
+    assert 'hx-swap-oob="true"' in fills[1]
+    assert "aria-busy" in fills[1]
+
+
+async def test_failed_slot_is_logged_with_its_id(env: Environment, caplog) -> None:
+    fills = [f async for f in resolve_deferred(env, {"broken": _boom})]
+    assert DEFAULT_FALLBACK in fills[0]
+    (record,) = [r for r in caplog.records if r.name == "chirp_ui.suspense"]
+    assert "'broken'" in record.getMessage()
+    assert record.exc_info is not None
+
+
+async def test_aclose_cancels_pending_sources(env: Environment) -> None:
+    cancelled = asyncio.Event()
+
+    async def hung() -> str:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return ""
+
+    fills = resolve_deferred(env, {"fast": _after(0, "<p>fast</p>"), "hung": hung()})
+    assert "<p>fast</p>" in await anext(fills)
+    await fills.aclose()
+    await asyncio.wait_for(cancelled.wait(), 1)
@@ -0,0 +1,45 @@
+"""Tests for chirp_ui.template_cache persistent compile cache and warm-up."""
+
+from pathlib import Path
+
+import pytest
+
+import chirp_ui
+from chirp_ui.preview_env import make_preview_env
+from chirp_ui.template_cache import CACHE_DIR_ENV, template_cache, template_cache_dir
+
+
+def test_cache_dir_is_keyed_by_package_version(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    leaf = f"chirpui-{chirp_ui.__version__}"
+    assert template_cache_dir(tmp_path) == tmp_path / leaf
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / "env"))
+    assert template_cache_dir() == tmp_path / "env" / leaf
+    monkeypatch.delenv(CACHE_DIR_ENV)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert template_cache_dir() == tmp_path / "xdg" / "chirp-ui" / "templates" / leaf
+
+
+def test_warm_templates_fills_and_reuses_disk_cache(tmp_path: Path) -> None:
+    env = make_preview_env(bytecode_cache=template_cache(tmp_path))
+    count = chirp_ui.warm_templates(env)
+    assert count > 200
+    written = template_cache(tmp_path).stats()["file_count"]
+    assert written == count
+
+    fresh = make_preview_env(bytecode_cache=template_cache(tmp_path))
+    assert chirp_ui.warm_templates(fresh) == count
+    assert template_cache(tmp_path).stats()["file_count"] == written
+    html = fresh.from_string(
+        '{% from "chirpui/badge.html" import badge %}{{ badge("ok") }}', name="warm-smoke"
+    ).render()
+    assert "chirpui-badge" in html
+
+
+def test_warm_templates_default_uses_cache_env_var(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    assert chirp_ui.warm_templates() > 200
+    assert any(template_cache_dir(tmp_path).iterdir())
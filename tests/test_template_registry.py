@@ -0,0 +1,66 @@
+"""Tests for chirp_ui.template_registry — declarative filter/global table."""
+
+from kida import Environment
+
+from chirp_ui.filters import bem, contrast_text, html_attrs, register_filters, resolve_color
+from chirp_ui.preview_env import make_preview_env
+from chirp_ui.template_registry import (
+    FILTERS,
+    GLOBALS,
+    PURE_FILTERS,
+    TEMPLATE_REGISTRY,
+    install_template_registry,
+)
+
+
+def test_table_names_are_unique_and_views_match() -> None:
+    names = [e.name for e in TEMPLATE_REGISTRY]
+    assert len(names) == len(set(names))
+    assert set(FILTERS) | set(GLOBALS) == set(names)
+    assert FILTERS["bem"] is bem
+    assert sorted(PURE_FILTERS) == ["contrast_text", "html_attrs", "sanitize_color", "value_type"]
+    assert set(FILTERS) >= PURE_FILTERS
+
+
+def test_pure_filters_carry_kida_marker_after_install_without_wrapping() -> None:
+    install_template_registry(Environment())
+    assert FILTERS["contrast_text"] is contrast_text
+    assert getattr(contrast_text, "_kida_pure", False) is True
+    assert not getattr(bem, "_kida_pure", False)
+    assert not getattr(resolve_color, "_kida_pure", False)
+
+
+def test_preview_env_does_not_fold_stubbed_filters() -> None:
+    env = make_preview_env(bytecode_cache=False)
+    assert env.filters["html_attrs"] is not html_attrs
+    assert "html_attrs" not in env.pure_filters
+    assert "contrast_text" in env.pure_filters
+
+
+def test_register_filters_registers_the_whole_table() -> None:
+    filters: dict[str, object] = {}
+    globals_: dict[str, object] = {}
+
+    class MockApp:
+        def template_filter(self, name: str):
+            return lambda fn: filters.setdefault(name, fn)
+
+        def template_global(self, name: str):
+            return lambda fn: globals_.setdefault(name, fn)
+
+    register_filters(MockApp())
+    assert filters == dict(FILTERS)
+    assert globals_ == dict(GLOBALS)
+
+
+def test_install_into_kida_environment() -> None:
+    env = Environment()
+    env.add_global("csrf_field", lambda: "")
+    install_template_registry(env)
+    assert env.filters["bem"] is bem
+    assert env.pure_filters >= PURE_FILTERS
+    assert "csrf_field" in env.globals
+    html = env.from_string(
+        '{{ "btn" | bem(variant="primary") }}|{{ build_hx_attrs(hx_get="/x") | html_attrs }}'
+    ).render()
+    assert html == 'chirpui-btn chirpui-btn--primary| hx-get="/x"'
@@ -0,0 +1,152 @@
+"""Compiled theme packs (chirp_ui.theme_compiler) — freshness and flattening rules."""
+
+from __future__ import annotations
+
+import pytest
+
+from chirp_ui.critical_css import CHIRPUI_CSS
+from chirp_ui.theme_compiler import (
+    COMPILED_MODES,
+    STATIC_ROOT,
+    _base_tokens,
+    _collapse,
+    compile_theme_pack,
+    compiled_theme_packs,
+    resolve_tokens,
+)
+from chirp_ui.theme_packs import THEME_PACKS, ThemePack
+
+BASE = """\
+@layer chirpui.component {
+:root {
+    --chirpui-radius: 0.5rem;
+    --chirpui-bg: light-dark(#fff, #000);
+    --chirpui-accent: blue;
+}
+[data-theme="dark"] { --chirpui-text: white; }
+@media (prefers-color-scheme: dark) {
+    :root:not([data-theme="light"]) { --chirpui-muted: gray; }
+}
+}
+"""
+
+PACK_CSS = """\
+@layer app.theme {
+    :root {
+        --chirpui-radius: 0.5rem;
+        --chirpui-accent: oklch(0.6 0.1 40);
+        --chirpui-primary: var(--chirpui-accent);
+        --chirpui-error: var(--chirpui-danger);
+    }
+    [data-theme="light"] { --chirpui-bg: #fff; --chirpui-text: black; }
+    [data-theme="dark"] { --chirpui-bg: #111; --chirpui-text: white; }
+    @media (prefers-color-scheme: light) {
+        [data-theme="system"] { --chirpui-bg: #fff; }
+    }
+    @media (prefers-color-scheme: dark) {
+        [data-theme="system"] { --chirpui-bg: #111; }
+    }
+}
+"""
+
+PACK = ThemePack(name="test", label="Test", path="themes/test.css")
+
+
+def _compile(mode: str, pack_css: str = PACK_CSS) -> str:
+    return compile_theme_pack(PACK, mode, pack_css=pack_css, base_css=BASE)
+
+
+def test_compiled_theme_packs_are_fresh() -> None:
+    outputs = compiled_theme_packs()
+    assert len(outputs) == len(THEME_PACKS) * len(COMPILED_MODES)
+    for path, css in outputs.items():
+        assert path.read_text(encoding="utf-8") == css, (
+            f"{path.name} is stale. Run `poe build-theme-packs` and commit the result."
+        )
+
+
+def test_theme_pack_exposes_compiled_asset() -> None:
+    for pack in THEME_PACKS:
+        for mode in pack.modes:
+            path = STATIC_ROOT / pack.compiled_path(mode)
+            assert path.is_file()
+            assert pack.compiled_size(mode) == path.stat().st_size
+            # Flattened sheets carry only the pack's deltas.
+            assert pack.compiled_size(mode) < (STATIC_ROOT / pack.path).stat().st_size
+        assert pack.compiled_path() == f"themes/compiled/{pack.name}.system.css"
+    with pytest.raises(ValueError, match="no 'oled' mode"):
+        THEME_PACKS[0].compiled_path("oled")
+
+
+def test_resolve_tokens_follows_mode_scheme_and_light_dark() -> None:
+    assert resolve_tokens(BASE, "light")["--chirpui-bg"] == "#fff"
+    dark = resolve_tokens(BASE, "dark")
+    assert (dark["--chirpui-bg"], dark["--chirpui-text"], dark["--chirpui-muted"]) == (
+        "#000",
+        "white",
+        "gray",
+    )
+    assert "--chirpui-muted" not in resolve_tokens(BASE, "light", "dark")
+    with pytest.raises(ValueError, match="scheme"):
+        resolve_tokens(BASE, "system")
+
+
+def test_compile_drops_unchanged_tokens_and_collapses_static_vars() -> None:
+    css = _compile("dark")
+    root, dark = css.split('[data-theme="dark"]')
+    assert "--chirpui-radius" not in css  # same as base
+    assert "--chirpui-accent: oklch(0.6 0.1 40);" in root
+    assert "--chirpui-bg: #111;" in dark
+    assert "--chirpui-text" not in css  # base dark already sets white
+    assert "--chirpui-primary: oklch(0.6 0.1 40);" in root
+    # --chirpui-danger is not set by the pack, so the reference stays live.
+    assert "--chirpui-error: var(--chirpui-danger);" in root
+    assert '[data-theme="light"]' not in css
+    assert "prefers-color-scheme" not in css
+
+
+def test_compile_system_guards_scheme_blocks_with_data_theme() -> None:
+    css = _compile("system")
+    assert '[data-theme="light"] {' in css
+    assert '[data-theme="dark"] {' in css
+    assert '@media (prefers-color-scheme: dark) {\n        :root[data-theme="system"] {' in css
+    # Light #fff matches the base light-dark() branch, so no light query block.
+    assert "prefers-color-scheme: light" not in css
+
+
+def _effective(css: str, mode: str, scheme: str) -> dict[str, str]:
+    tokens = resolve_tokens(BASE + css, mode, scheme)
+    return {name: _collapse(value, tokens) for name, value in tokens.items()}
+
+
+@pytest.mark.parametrize("mode", ["light", "dark", "system", "oled"])
+@pytest.mark.parametrize("scheme", ["light", "dark"])
+def test_system_sheet_matches_source_pack_for_every_data_theme(mode: str, scheme: str) -> None:
+    # data-theme="dark" on a light-OS machine must still get the dark tokens.
+    assert _effective(_compile("system"), mode, scheme) == _effective(PACK_CSS, mode, scheme)
+
+
+@pytest.mark.parametrize("scheme", ["light", "dark"])
+def test_mode_sheet_matches_source_pack_for_its_mode(scheme: str) -> None:
+    for mode in ("light", "dark"):
+        assert _effective(_compile(mode), mode, scheme) == _effective(PACK_CSS, mode, scheme)
+
+
+def test_compile_rejects_uncataloged_tokens() -> None:
+    with pytest.raises(ValueError, match="--chirpui-not-a-token"):
+        _compile("light", ":root { --chirpui-not-a-token: 1px; }")
+
+
+@pytest.mark.parametrize("pack", THEME_PACKS, ids=lambda p: p.name)
+def test_shipped_system_sheets_match_their_packs(pack: ThemePack) -> None:
+    base = CHIRPUI_CSS.read_text(encoding="utf-8")
+    source = (STATIC_ROOT / pack.path).read_text(encoding="utf-8")
+    compiled = (STATIC_ROOT / pack.compiled_path("system")).read_text(encoding="utf-8")
+    for mode in ("light", "dark", "system", "oled"):
+        for scheme in ("light", "dark"):
+            base_tokens = _base_tokens(base, mode, scheme)
+            got = {**base_tokens, **resolve_tokens(compiled, mode, scheme)}
+            want = {**base_tokens, **resolve_tokens(source, mode, scheme)}
+            assert {k: _collapse(v, got) for k, v in got.items()} == {
+                k: _collapse(v, want) for k, v in want.items()
+            }, (mode, scheme)
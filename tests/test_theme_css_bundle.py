@@ -0,0 +1,148 @@
+"""Ensure ``style.bundle.css`` is the flattened, fresh form of the theme ``style.css``.
+
+The bundler (``scripts/build_theme_css.py``) inlines the ``@import`` graph so
+the Bengal theme ships one stylesheet request. This test regenerates into
+memory and diffs against the committed bundle + source map, and pins the
+flattening contract on small fixture graphs.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = REPO_ROOT / "scripts"
+
+
+def _load_build_module():
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    import build_theme_css  # type: ignore[import-not-found]
+
+    return build_theme_css
+
+
+def _decode_mappings(mappings: str) -> list[list[tuple[int, int, int, int]]]:
+    b64 = {c: i for i, c in enumerate(_load_build_module()._B64)}
+    state = [0, 0, 0]
+    decoded: list[list[tuple[int, int, int, int]]] = []
+    for line in mappings.split(";"):
+        segs: list[tuple[int, int, int, int]] = []
+        for seg in filter(None, line.split(",")):
+            values: list[int] = []
+            value = shift = 0
+            for ch in seg:
+                digit = b64[ch]
+                value += (digit & 31) << shift
+                if digit & 32:
+                    shift += 5
+                    continue
+                values.append(-(value >> 1) if value & 1 else value >> 1)
+                value = shift = 0
+            col, *delta = values
+            state = [s + d for s, d in zip(state, delta, strict=True)]
+            segs.append((col, *state))
+        decoded.append(segs)
+    return decoded
+
+
+def test_theme_bundle_matches_sources() -> None:
+    build_theme_css = _load_build_module()
+    css, source_map = build_theme_css.build()
+    assert css == build_theme_css.OUTPUT.read_text(encoding="utf-8"), (
+        "style.bundle.css is stale. Run `poe build-theme-css` (or "
+        "`python scripts/build_theme_css.py`) and commit the result."
+    )
+    assert source_map == build_theme_css.MAP_OUTPUT.read_text(encoding="utf-8")
+
+
+def test_theme_bundle_is_deterministic() -> None:
+    build_theme_css = _load_build_module()
+    assert build_theme_css.build() == build_theme_css.build()
+
+
+def test_theme_bundle_has_no_imports_and_keeps_layer_order() -> None:
+    build_theme_css = _load_build_module()
+    css, _ = build_theme_css.build()
+    code = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    assert "@import" not in code
+    # The layer-order statement stays the first rule, and chirp-theme.css lands last.
+    assert code.lstrip().startswith(
+        "@layer tokens, base, utilities, components, pages, chirp-theme;"
+    )
+    markers = re.findall(r"/\* === (\S+) === \*/", css)
+    assert markers[0] == "tokens/foundation.css"
+    assert markers[-1] == "chirp-theme.css"
+    assert len(markers) == len(set(markers))
+
+
+def test_theme_bundle_source_map_points_at_sources() -> None:
+    build_theme_css = _load_build_module()
+    css, source_map = build_theme_css.build()
+    data = json.loads(source_map)
+    assert data["version"] == 3
+    assert data["file"] == "style.bundle.css"
+    assert data["sources"][0] == "style.css"
+    assert css.rstrip().endswith("/*# sourceMappingURL=style.bundle.css.map */")
+
+    sources = [
+        (build_theme_css.CSS_ROOT / name).read_text(encoding="utf-8").split("\n")
+        for name in data["sources"]
+    ]
+    bundle_lines = css.split("\n")
+    checked = 0
+    for out_line, segs in enumerate(_decode_mappings(data["mappings"])):
+        for col, src, line, src_col in segs:
+            text = bundle_lines[out_line][col:]
+            if not text.strip() or text.lstrip().startswith(("/* ===", "}")):
+                continue  # import markers/closers map to the @import statement
+            assert sources[src][line][src_col:].startswith(text[:40])
+            checked += 1
+    assert checked > 1000
+
+
+@pytest.fixture
+def graph(tmp_path: Path) -> Path:
+    (tmp_path / "parts").mkdir()
+    (tmp_path / "parts" / "a.css").write_text(
+        ".a { background: url('../img/a.png'); }\n", encoding="utf-8"
+    )
+    (tmp_path / "parts" / "b.css").write_text(
+        "@import url('nested.css');\n.b { color: red; }\n", encoding="utf-8"
+    )
+    (tmp_path / "parts" / "nested.css").write_text(".n { color: blue; }\n", encoding="utf-8")
+    (tmp_path / "entry.css").write_text(
+        "@layer one, two;\n"
+        "/* @import url('ignored.css'); */\n"
+        "@layer one {\n  @import url('parts/a.css');\n}\n"
+        "@import url('parts/b.css') layer(two) screen;\n",
+        encoding="utf-8",
+    )
+    return tmp_path
+
+
+def test_bundler_flattens_layered_and_conditional_imports(graph: Path) -> None:
+    build_theme_css = _load_build_module()
+    css, _ = build_theme_css.build(graph, "entry.css")
+    code = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    assert "@import" not in code
+    assert "url('img/a.png')" in css  # rebased onto the entry's directory
+    assert "@layer two {\n@media screen {" in css
+    assert code.index(".a {") < code.index(".n {") < code.index(".b {")
+
+
+def test_bundler_rejects_cycles_and_remote_imports(tmp_path: Path) -> None:
+    build_theme_css = _load_build_module()
+    (tmp_path / "a.css").write_text("@import 'b.css';\n", encoding="utf-8")
+    (tmp_path / "b.css").write_text("@import 'a.css';\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="cycle"):
+        build_theme_css.build(tmp_path, "a.css")
+
+    (tmp_path / "r.css").write_text("@import url('https://x.test/a.css');\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="remote"):
+        build_theme_css.build(tmp_path, "r.css")
@@ -0,0 +1,122 @@
+"""Tests for the cached token index (chirp_ui.tokens.token_index) and its CLI view."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from chirp_ui.inspect import main as inspect_main
+from chirp_ui.tokens import TOKEN_CATALOG, TokenIndex, extract_css_tokens, token_index
+
+SAMPLE = """\
+/* header */
+@layer chirpui.reset, chirpui.component;
+
+/* === partials/002_reset.css === */
+@layer chirpui.component {
+:root {
+    --chirpui-accent: teal;
+    --chirpui-primary: var(--chirpui-accent);
+    --chirpui-focus-ring: color-mix(in oklch, var(--chirpui-primary) 30%, transparent);
+}
+}
+
+/* === partials/045_card.css === */
+@layer chirpui.component {
+@scope (.chirpui-card) {
+    :scope:hover {
+        border-color: var(--chirpui-accent);
+    }
+}
+.chirpui-card--sm { --chirpui-card-pad: 1rem; }
+.chirpui-card__title::before { content: "var(--chirpui-nope)"; }
+}
+
+/* === partials/071_button.css === */
+@layer chirpui.component {
+.chirpui-btn:focus-visible {
+    outline: 2px solid
+        var(--chirpui-focus-ring);
+}
+}
+"""
+
+
+@pytest.fixture
+def sample(tmp_path: Path) -> Path:
+    path = tmp_path / "chirpui.css"
+    path.write_text(SAMPLE, encoding="utf-8")
+    return path
+
+
+def test_index_records_declarations_with_location(sample: Path) -> None:
+    index = token_index(sample)
+    (site,) = index.declarations["--chirpui-primary"]
+    assert (site.line, site.partial, site.selector) == (8, "partials/002_reset.css", ":root")
+    # One-line modifier rules set private knobs; they are indexed but not cataloged.
+    (knob,) = index.declarations["--chirpui-card-pad"]
+    assert not knob.own_line
+    assert "--chirpui-card-pad" not in extract_css_tokens(sample)
+    assert "--chirpui-primary" in extract_css_tokens(sample)
+
+
+def test_index_records_usages_scope_and_ignores_strings(sample: Path) -> None:
+    index = token_index(sample)
+    (card,) = (s for s in index.usages["--chirpui-accent"] if s.partial == "partials/045_card.css")
+    assert (card.line, card.selector, card.scope, card.declared) == (
+        17,
+        ":scope:hover",
+        "@scope (.chirpui-card)",
+        "border-color",
+    )
+    (ring,) = index.usages["--chirpui-focus-ring"]
+    assert ring.line == 28  # the line holding var(), not the property
+    assert "--chirpui-nope" not in index.usages
+
+
+def test_reverse_lookup_follows_dependent_tokens(sample: Path) -> None:
+    index = token_index(sample)
+    assert index.dependent_tokens("--chirpui-accent") == {
+        "--chirpui-primary",
+        "--chirpui-focus-ring",
+    }
+    assert index.blocks_using("--chirpui-accent") == ("card",)
+    assert index.blocks_using("--chirpui-accent", transitive=True) == ("btn", "card")
+    assert index.partials_using("--chirpui-accent", transitive=True) == (
+        "partials/002_reset.css",
+        "partials/045_card.css",
+        "partials/071_button.css",
+    )
+    assert index.tokens_used_by("partials/071_button.css") == {"--chirpui-focus-ring"}
+
+
+def test_index_is_cached_by_content_hash(sample: Path, tmp_path: Path) -> None:
+    first = token_index(sample)
+    assert token_index(sample) is first
+
+    copy = tmp_path / "copy.css"
+    copy.write_text(SAMPLE, encoding="utf-8")
+    assert token_index(copy) is first  # same bytes, same digest
+
+    sample.write_text(SAMPLE.replace("teal", "tomato"), encoding="utf-8")
+    os.utime(sample, ns=(0, 0))
+    changed = token_index(sample)
+    assert changed is not first
+    assert changed.digest != first.digest
+
+
+def test_shipped_index_matches_catalog() -> None:
+    index = token_index()
+    assert isinstance(index, TokenIndex)
+    assert extract_css_tokens() == set(TOKEN_CATALOG)
+    assert "card" in index.blocks_using("--chirpui-card-hover-border")
+
+
+def test_inspect_token_usage(capsys: pytest.CaptureFixture[str]) -> None:
+    inspect_main(["--token-usage", "card-hover-border"])
+    out = capsys.readouterr().out
+    assert out.startswith("--chirpui-card-hover-border\n")
+    assert "partials/045_card.css" in out
+    assert "Blocks: card" in out
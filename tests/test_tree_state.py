@@ -0,0 +1,95 @@
+"""Tests for chirp_ui.tree_state lazy tree pages."""
+
+from chirp_ui.tree_state import TreeIndex, TreePage
+
+TREE = [
+    {
+        "id": "src",
+        "label": "src",
+        "children": [
+            {
+                "id": "src/app",
+                "label": "app",
+                "children": [{"id": "src/app/main.py", "label": "main.py"}],
+            },
+            {"id": "src/util.py", "label": "util.py"},
+        ],
+    },
+    {"id": "README.md", "label": "README.md"},
+]
+
+
+def test_index_flattens_ids_depths_and_ancestors() -> None:
+    index = TreeIndex(TREE)
+    assert len(index) == 5
+    assert "src/app/main.py" in index
+    assert index.node("src/util.py") == {"id": "src/util.py", "label": "util.py"}
+    assert index.depth_of("src") == 0
+    assert index.depth_of("src/app/main.py") == 2
+    assert index.depth_of("missing") is None
+    assert index.ancestors("src/app/main.py") == ("src", "src/app")
+    assert index.expanded_path("src/app") == frozenset({"src", "src/app"})
+    assert index.expanded_path("missing") == frozenset()
+
+
+def test_page_prunes_branches_to_depth() -> None:
+    page = TreeIndex(TREE).page()
+    assert page.parent is None
+    assert page.total == 2
+    src, readme = page.items
+    assert src["children"] == []
+    assert src["has_children"] is True
+    assert "has_children" not in readme
+    # Source nodes are untouched.
+    assert len(TREE[0]["children"]) == 2
+
+
+def test_page_items_are_copies_including_leaves() -> None:
+    page = TreeIndex(TREE).page(depth=3)
+    src, readme = page.items
+    readme["label"] = "changed"
+    src["children"][1]["label"] = "changed"
+    assert TREE[1]["label"] == "README.md"
+    assert TREE[0]["children"][1]["label"] == "util.py"
+
+
+def test_page_depth_and_expanded_pre_render_branches() -> None:
+    index = TreeIndex(TREE)
+    deep = index.page(depth=2).items[0]
+    assert [c["id"] for c in deep["children"]] == ["src/app", "src/util.py"]
+    assert deep["children"][0]["children"] == []
+
+    expanded = index.expanded_path("src/app")
+    src = index.page(expanded=expanded).items[0]
+    assert src["children"][0]["children"][0]["label"] == "main.py"
+
+
+def test_page_of_branch_with_offset_and_limit() -> None:
+    index = TreeIndex(TREE)
+    page = index.page("src", limit=1)
+    assert [n["id"] for n in page.items] == ["src/app"]
+    assert page.has_more
+    assert page.next_offset == 1
+    rest = index.page("src", offset=page.next_offset, limit=1)
+    assert [n["id"] for n in rest.items] == ["src/util.py"]
+    assert rest.next_offset is None
+    assert index.page("missing") == TreePage(parent="missing", items=(), depth=1, offset=0, total=0)
+
+
+def test_index_by_href_for_nav_tree_items() -> None:
+    items = [{"title": "API", "href": "/api", "children": [{"title": "Ref", "href": "/api/ref"}]}]
+    index = TreeIndex(items, id_key="href")
+    assert index.ancestors("/api/ref") == ("/api",)
+    assert index.page("/api").items[0]["title"] == "Ref"
+
+
+def test_query_string_ids_find_int_ids() -> None:
+    index = TreeIndex([{"id": 1, "children": [{"id": 2, "children": [{"id": 3}]}]}])
+    page = index.page("2")
+    assert page.parent == 2
+    assert [item["id"] for item in page.items] == [3]
+    assert "1" in index
+    assert index.ancestors("3") == (1, 2)
+    assert index.expanded_path("2") == frozenset({1, 2})
+    assert index.page(expanded=["2"], depth=1).items[0]["children"] == []
+    assert index.page(expanded=["1"], depth=1).items[0]["children"][0]["id"] == 2
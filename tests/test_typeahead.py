@@ -0,0 +1,65 @@
+"""Tests for chirp_ui.typeahead TypeaheadIndex ranking."""
+
+from types import SimpleNamespace
+
+from chirp_ui.typeahead import TypeaheadIndex
+
+COUNTRIES = [
+    {"label": "United States", "value": "us"},
+    {"label": "United Kingdom", "value": "gb", "keywords": ["britain", "england"]},
+    {"label": "United Arab Emirates", "value": "ae"},
+    {"label": "Canada", "value": "ca"},
+    {"label": "Côte d'Ivoire", "value": "ci"},
+    {"label": "Uganda", "value": "ug"},
+]
+
+
+def _values(hits: list) -> list[str]:
+    return [h.value for h in hits]
+
+
+def test_word_prefixes_narrow_and_rank() -> None:
+    index = TypeaheadIndex(COUNTRIES)
+    hits = index.search("uni st")
+    assert hits[0].value == "us"
+    assert all(h.score < hits[0].score for h in hits[1:])  # trigram fill ranks below
+    assert _values(index.search("united", k=2)) == ["us", "gb"]  # shorter label first
+    assert _values(index.search("Canada"))[0] == "ca"
+
+
+def test_exact_beats_prefix_beats_word() -> None:
+    index = TypeaheadIndex([{"label": "Art history"}, {"label": "Art"}, {"label": "Modern art"}])
+    assert [h.label for h in index.search("art")] == ["Art", "Art history", "Modern art"]
+
+
+def test_keywords_accents_and_trigram_fallback() -> None:
+    index = TypeaheadIndex(COUNTRIES)
+    assert _values(index.search("england")) == ["gb"]
+    assert _values(index.search("cote")) == ["ci"]
+    fuzzy = index.search("untied states")
+    assert fuzzy
+    assert fuzzy[0].value == "us"
+    assert fuzzy[0].score < 1
+    assert index.search("zzzz") == []
+
+
+def test_top_k_is_bounded_and_empty_query_lists_in_order() -> None:
+    index = TypeaheadIndex({"label": f"Item {i}", "value": str(i)} for i in range(5_000))
+    assert len(index) == 5_000
+    assert len(index.search("item", k=7)) == 7
+    assert _values(index.search("", k=3)) == ["0", "1", "2"]
+    assert index.search("item", k=0) == []
+
+
+def test_hits_read_like_option_dicts() -> None:
+    index = TypeaheadIndex(
+        [
+            {"label": "New document", "href": "/docs/new", "hint": "N"},
+            SimpleNamespace(label="Settings", value="settings", hint=None),
+        ]
+    )
+    hit = index.search("new")[0]
+    assert hit.get("value") == "New document"  # value defaults to the label
+    assert hit.get("href") == "/docs/new"
+    assert hit.get("missing", "x") == "x"
+    assert index.search("set")[0].get("value") == "settings"